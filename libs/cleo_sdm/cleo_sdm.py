@@ -8,7 +8,7 @@ Created Date: Monday 23rd June 2025
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Thursday 10th July 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -20,18 +20,27 @@ CLEO v0.44.0 python_bindings example.
 NOTE: To use the wrapper, you must first export "PYCLEO_DIR". E.g. is python bindings are
 built in $HOME/microphysics_testcases/build/, do:
 export PYCLEO_DIR=$HOME/microphysics_testcases/build/_deps/cleo-build/pycleo/
+The bindings (pycleo) and mpi4py are only imported once they are used.
 """
 
-import os
-import sys
-from mpi4py import MPI
+from ..utility_functions.scheme_registry import import_extension
 
-sys.path.append(os.environ["PYCLEO_DIR"])
-import pycleo
-from pycleo import coupldyn_numpy
+
+def import_pycleo():
+    """Import and return CLEO's python bindings from the directory given by PYCLEO_DIR."""
+    return import_extension("pycleo", "PYCLEO_DIR")
+
+
+def __getattr__(name):
+    """Import the CLEO bindings lazily on access of the module's pycleo."""
+    if name == "pycleo":
+        return import_pycleo()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def mpi_info(comm):
+    from mpi4py import MPI
+
     print("\n--- PYCLEO STATUS: MPI INFORMATION ---")
     print(f"MPI version: {MPI.Get_version()}")
     print(f"Processor name: {MPI.Get_processor_name()}")
@@ -40,14 +49,24 @@ def mpi_info(comm):
     print("--------------------------------------")
 
 
-def create_sdm(config, tsteps, is_motion):
+def create_gridbox_maps(config):
+    """Return CLEO's (cartesian) maps of the gridboxes on this process (i.e. MPI rank)."""
+    pycleo = import_pycleo()
+
     print("PYCLEO STATUS: creating GridboxMaps")
-    gbxmaps = pycleo.create_cartesian_maps(
+    return pycleo.create_cartesian_maps(
         config.get_ngbxs(),
         config.get_nspacedims(),
         config.get_grid_filename(),
     )
 
+
+def create_sdm(config, tsteps, is_motion, gbxmaps=None):
+    pycleo = import_pycleo()
+
+    if gbxmaps is None:
+        gbxmaps = create_gridbox_maps(config)
+
     print("PYCLEO STATUS: creating Observer")
     obs = pycleo.NullObserver()
 
@@ -76,6 +95,8 @@ def create_sdm(config, tsteps, is_motion):
 
 
 def prepare_to_timestep_sdm(config, sdm):
+    pycleo = import_pycleo()
+
     print("PYCLEO STATUS: creating superdroplets")
     initsupers = pycleo.InitSupersFromBinary(
         config.get_initsupersfrombinary(), sdm.gbxmaps
@@ -109,6 +130,7 @@ class CleoSDM:
         wvel,
         uvel,
         vvel,
+        gbxmaps=None,
     ):
         """Initialize the CleoSDM object.
 
@@ -116,9 +138,15 @@ class CleoSDM:
         qvap, qcond, wvel, uvel, and vvel arrays remain unchanged throughout a simulation.
         Undefined behaviour if values are changed by reassigning arrays rather than by copying
         data into the arrays given during class initialisation.
+
+        gbxmaps are CLEO's maps of the gridboxes, if they have already been created (e.g. to
+        decompose the domain, see create_gridbox_maps), otherwise they are created for SDM.
         """
         self.name = "CLEO SDM microphysics"
 
+        pycleo = import_pycleo()
+        from pycleo import coupldyn_numpy
+
         tsteps = pycleo.pycreate_timesteps(config)
         assert (
             pycleo.realtime2step(timestep) == tsteps.get_couplstep()
@@ -140,35 +168,56 @@ class CleoSDM:
         )
         self.comms = coupldyn_numpy.NumpyComms()
 
-        self.sdm = create_sdm(config, tsteps, is_motion)
+        self.sdm = create_sdm(config, tsteps, is_motion, gbxmaps=gbxmaps)
         self.sdm, self.gbxs, self.allsupers = prepare_to_timestep_sdm(config, self.sdm)
 
+        # members of sdm used every substep (found once to avoid calls to the bindings)
+        self.couplstep = self.sdm.get_couplstep()
+        self.gbxmaps = self.sdm.gbxmaps
+        self.obs = self.sdm.obs
+
     def run(self, timestep):
-        timestep = pycleo.realtime2step(
+        timestep = import_pycleo().realtime2step(
             timestep
         )  # convert from seconds to model timesteps (!)
-        t_mdl_next = self.t_sdm + timestep
+        self.run_until(self.t_sdm + timestep)
+
+    def run_until(self, t_mdl_next):
+        """Run SDM from the current coupling step, t_sdm, to the next, t_mdl_next.
+
+        Dynamics are received from the coupled dynamics at the start of the coupling step and
+        sent back after its first substep. SDM's own substeps (e.g. of condensation) are run
+        by CLEO within each call to sdm.run_step, so the python loop only iterates once per
+        observation (i.e. once per coupling step with a NullObserver) and everything which
+        is constant during the coupling step is found outside of the loop.
+
+        Args:
+            t_mdl_next (int): Time of the next coupling step [model timesteps].
+        """
+        t_sdm = self.t_sdm
         assert t_mdl_next == self.sdm.next_couplstep(
-            self.t_sdm
+            t_sdm
         ), "SDM out of sync with coupling"
+        assert t_sdm % self.couplstep == 0, "SDM not at a coupling step"
 
-        # print(f"PYCLEO STATUS: start t_sdm = {self.t_sdm} [model timesteps]")
-        while self.t_sdm < t_mdl_next:
-            t_sdm_next = min(
-                self.sdm.next_couplstep(self.t_sdm), self.sdm.obs.next_obs(self.t_sdm)
-            )
+        sdm, coupldyn = self.sdm, self.coupldyn
+        gbxs, allsupers = self.gbxs, self.allsupers
+        next_obs = self.obs.next_obs
 
-            if self.t_sdm % self.sdm.get_couplstep() == 0:
-                self.comms.receive_dynamics(self.sdm.gbxmaps, self.coupldyn, self.gbxs)
+        # print(f"PYCLEO STATUS: start t_sdm = {t_sdm} [model timesteps]")
+        self.comms.receive_dynamics(self.gbxmaps, coupldyn, gbxs)
+        while t_sdm < t_mdl_next:
+            t_sdm_next = min(t_mdl_next, next_obs(t_sdm))
 
-            self.sdm.at_start_step(self.t_sdm, self.gbxs, self.allsupers)
+            sdm.at_start_step(t_sdm, gbxs, allsupers)
 
-            self.coupldyn.run_step(self.t_sdm, t_sdm_next)
+            coupldyn.run_step(t_sdm, t_sdm_next)
 
-            self.sdm.run_step(self.t_sdm, t_sdm_next, self.gbxs, self.allsupers)
+            sdm.run_step(t_sdm, t_sdm_next, gbxs, allsupers)
 
-            if self.t_sdm % self.sdm.get_couplstep() == 0:
-                self.comms.send_dynamics(self.sdm.gbxmaps, self.gbxs, self.coupldyn)
+            if t_sdm == self.t_sdm:
+                self.comms.send_dynamics(self.gbxmaps, gbxs, coupldyn)
 
-            self.t_sdm = t_sdm_next
+            t_sdm = t_sdm_next
+        self.t_sdm = t_sdm
         # print(f"PYCLEO STATUS: end t_sdm = {self.t_sdm} [model timesteps]")
@@ -0,0 +1,138 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: domain_decomposition.py
+Project: cleo_sdm
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+decomposition of the gridboxes of a test case's domain across MPI processes (ranks) so that
+CLEO SDM can run with its gridboxes (and superdroplets) split across ranks whilst the
+dynamics, and output, of the test case are on the root rank only. Thermodynamics are
+scattered from the root rank to every rank's local gridboxes before each coupling step and
+gathered back to the root rank afterwards.
+NOTE: run with e.g. mpirun -n N python [script.py], mpi4py is only imported once used.
+"""
+
+import numpy as np
+
+
+class GridboxDecomposition:
+    """Decomposition of a domain of gridboxes into contiguous blocks, one per rank of an MPI
+    communicator in order of rank (as CLEO decomposes a 1-D column of gridboxes).
+
+    Variables of the whole domain (on the root rank) are 1-D arrays with the same number of
+    values for each gridbox, ordered by gridbox, e.g. ngbxs values of temperature or
+    2*ngbxs values of a wind on the lower and upper faces of each gridbox.
+
+    The first (global) gridbox index of each rank is checked against this decomposition
+    when it is created (on every rank, so that every rank fails together if, e.g. CLEO does
+    not decompose its domain in this way).
+
+    Args:
+        comm (mpi4py.MPI.Comm): MPI communicator of the ranks.
+        nlocal (int): Number of gridboxes on this rank (at least 1).
+        first_gbxindex (int): Global index of the first gridbox on this rank.
+        root (int, optional): Rank with the variables of the whole domain. Defaults to 0.
+    """
+
+    def __init__(self, comm, nlocal, first_gbxindex, root=0):
+        assert nlocal >= 1, "every rank must have at least one gridbox"
+        self.comm = comm
+        self.root = root
+        self.rank = comm.Get_rank()
+        self.nlocal = int(nlocal)
+        self.counts = np.array(comm.allgather(self.nlocal), dtype=np.int64)
+        self.displs = np.concatenate(([0], np.cumsum(self.counts)[:-1]))
+        self.ngbxs = int(self.counts.sum())
+
+        first_gbxindexes = np.array(comm.allgather(int(first_gbxindex)))
+        assert np.array_equal(
+            first_gbxindexes, self.displs
+        ), "gridboxes are not decomposed into contiguous blocks in order of rank"
+
+    @property
+    def is_root(self):
+        """True if this rank is the root rank."""
+        return self.rank == self.root
+
+    def _values_per_gridbox(self, nvalues, ngbxs):
+        assert nvalues % ngbxs == 0, "variable must have the same size for each gridbox"
+        return nvalues // ngbxs
+
+    def local(self, var):
+        """Return (a copy of) the values of a variable of the whole domain in the gridboxes
+        of this rank."""
+        var = np.ravel(var)
+        n = self._values_per_gridbox(var.size, self.ngbxs)
+        start = self.displs[self.rank] * n
+        return var[start : start + self.nlocal * n].copy()
+
+    def scatter(self, var, local):
+        """Scatter the values of a variable of the whole domain from the root rank into the
+        local values of each rank.
+
+        Args:
+            var (np.ndarray): Contiguous float64 array of the variable on the root rank
+              (ignored on other ranks, e.g. None).
+            local (np.ndarray): Contiguous float64 array of the variable in this rank's
+              gridboxes, which is overwritten.
+        """
+        from mpi4py import MPI
+
+        n = self._values_per_gridbox(local.size, self.nlocal)
+        sendbuf = None
+        if self.is_root:
+            assert var.size == self.ngbxs * n, "variable has wrong size"
+            assert var.flags["C_CONTIGUOUS"], "variable must be contiguous"
+            sendbuf = [var, self.counts * n, self.displs * n, MPI.DOUBLE]
+        self.comm.Scatterv(sendbuf, [local, MPI.DOUBLE], root=self.root)
+
+    def gather(self, local, var):
+        """Gather the local values of a variable on each rank into the variable of the whole
+        domain on the root rank.
+
+        Args:
+            local (np.ndarray): Contiguous float64 array of the variable in this rank's
+              gridboxes.
+            var (np.ndarray): Contiguous float64 array of the variable on the root rank which
+              is overwritten (ignored on other ranks, e.g. None).
+        """
+        from mpi4py import MPI
+
+        n = self._values_per_gridbox(local.size, self.nlocal)
+        recvbuf = None
+        if self.is_root:
+            assert var.size == self.ngbxs * n, "variable has wrong size"
+            assert var.flags["C_CONTIGUOUS"], "variable must be contiguous"
+            recvbuf = [var, self.counts * n, self.displs * n, MPI.DOUBLE]
+        self.comm.Gatherv([local, MPI.DOUBLE], recvbuf, root=self.root)
+
+
+def run_microphysics_worker(microphys_scheme, time, time_end, timestep):
+    """Run the microphysics scheme on a rank other than the root rank.
+
+    The time loop is the same as the test cases' (e.g. run_1dkid) on the root rank, so that
+    every rank calls the microphysics scheme (and so its collective MPI communication) the
+    same number of times. Thermodynamics are received from the root rank by the scheme.
+
+    Args:
+        microphys_scheme: Microphysics scheme (wrapper) decomposed across ranks.
+        time (float): Initial time of the run (s).
+        time_end (float): End time of the run (s).
+        timestep (float): Timestep of the run (s).
+    """
+    microphys_scheme.initialize()
+    while time < time_end:
+        microphys_scheme.run(timestep, None)
+        time += timestep
+    microphys_scheme.finalize()
@@ -8,7 +8,7 @@ Created Date: Monday 23rd June 2025
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Tuesday 1st July 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -22,15 +22,12 @@ built in $HOME/microphysics_testcases/build/, do:
 export PYCLEO_DIR=$HOME/microphysics_testcases/build/_deps/cleo-build/pycleo/
 """
 
-import os
-import sys
+import numpy as np
 
-from .cleo_sdm import CleoSDM
+from .cleo_sdm import CleoSDM, create_gridbox_maps, import_pycleo
+from .domain_decomposition import GridboxDecomposition
 from ..thermo.thermodynamics import Thermodynamics
 
-sys.path.append(os.environ["PYCLEO_DIR"])
-import pycleo
-
 
 class MicrophysicsSchemeWrapper:
     """A class wrapping around C++ bindings to CLEO's Superdroplet Model (SDM) microphysics scheme
@@ -54,37 +51,86 @@ class MicrophysicsSchemeWrapper:
         wvel,
         uvel,
         vvel,
+        comm=None,
     ):
         """Initialize the MicrophysicsSchemeWrapper object.
 
-        This Wrapper only works correctly if addresses of press, temp,
-        qvap, qcond, wvel, uvel, and vvel arrays remain unchanged throughout a simulation.
-        Undefined behaviour if values are changed by reassigning arrays rather than by copying
-        data into the arrays given during wrapper initialisation.
+        CLEO is coupled to the wrapper's own (dimensionless) copies of press, temp, qvap and
+        qcond, which are filled from the thermodynamics given to run() on every call, so the
+        thermodynamics need not be the arrays given here. Since CLEO only reads the winds,
+        if they do not need de-dimensionalising (W0 == 1) CLEO is coupled directly to the
+        wvel, uvel and vvel arrays given here. Then the addresses of these arrays must remain
+        unchanged throughout a simulation (i.e. values are changed by copying data into them
+        rather than by reassigning them) and they must be the winds given to run().
+
+        If comm is given, CLEO's gridboxes are decomposed across the ranks of comm (see
+        GridboxDecomposition) and the wrapper must be created on every rank with the same
+        arguments. Then CLEO is coupled to arrays of only the local gridboxes of each rank,
+        into which thermodynamics given to run() on the root rank are scattered (and from
+        which they are gathered back again), whilst on other ranks run() must be called with
+        no thermodynamics (e.g. by run_microphysics_worker).
+
+        Args:
+            comm (mpi4py.MPI.Comm, optional): MPI communicator to decompose CLEO's gridboxes
+              across. Defaults to None, meaning all gridboxes are on this rank.
         """
+        pycleo = import_pycleo()
         config = pycleo.Config(str(config_filename))
         pycleo.pycleo_initialize(config)
 
+        # constants to de-dimensionalise thermodynamics
+        self.TEMP0 = 273.15  # Temperature [K]
+        self.P0 = 100000.0  # Pressure [Pa]
+        self.W0 = 1.0  # Velocity [m/s]
+
+        self.decomposition = None
+        gbxmaps = None
+        if comm is not None:
+            gbxmaps = create_gridbox_maps(config)  # also used by SDM
+            self.decomposition = GridboxDecomposition(
+                comm,
+                gbxmaps.get_local_ngridboxes_hostcopy(),
+                gbxmaps.local_to_global_gridbox_index(0),
+            )
+            assert (
+                np.size(temp) == self.decomposition.ngbxs
+            ), "thermodynamics must have one value per gridbox of CLEO's domain"
+            press, temp, qvap, qcond, wvel, uvel, vvel = (
+                self.decomposition.local(var)
+                for var in (press, temp, qvap, qcond, wvel, uvel, vvel)
+            )
+            self._gather_buffer = np.empty_like(
+                temp
+            )  # re-dimensionalised local variable
+
+        # dimensionless thermodynamics coupled to CLEO
+        self.press_dimless = np.divide(press, self.P0)
+        self.temp_dimless = np.divide(temp, self.TEMP0)
+        self.qvap_dimless = np.array(qvap, dtype=np.float64)
+        self.qcond_dimless = np.array(qcond, dtype=np.float64)
+        if self.W0 == 1.0 and self.decomposition is None:
+            self.wvel_dimless, self.uvel_dimless, self.vvel_dimless = wvel, uvel, vvel
+        else:
+            self.wvel_dimless = np.divide(wvel, self.W0)
+            self.uvel_dimless = np.divide(uvel, self.W0)
+            self.vvel_dimless = np.divide(vvel, self.W0)
+
         self.microphys = CleoSDM(
             config,
             is_motion,
             t_start,
             timestep,
-            press,
-            temp,
-            qvap,
-            qcond,
-            wvel,
-            uvel,
-            vvel,
+            self.press_dimless,
+            self.temp_dimless,
+            self.qvap_dimless,
+            self.qcond_dimless,
+            self.wvel_dimless,
+            self.uvel_dimless,
+            self.vvel_dimless,
+            gbxmaps=gbxmaps,
         )
         self.name = "Wrapper around " + self.microphys.name
 
-        # constants to de-dimensionalise thermodynamics
-        self.TEMP0 = 273.15  # Temperature [K]
-        self.P0 = 100000.0  # Pressure [Pa]
-        self.W0 = 1.0  # Velocity [m/s]
-
     def initialize(self) -> int:
         """Initialise the microphysics scheme.
 
@@ -113,6 +159,11 @@ class MicrophysicsSchemeWrapper:
         This method is a wrapper of the MicrophysicsScheme object's run function to call the
         microphysics computations in a way that's compatible with the test and scripts in this project.
 
+        The thermodynamics are de-dimensionalised into the wrapper's own arrays which are
+        coupled to CLEO (one pass over each array), and only the variables CLEO updates
+        (temperature, vapour and cloud water) are copied back into thermo, so pressure and
+        winds in thermo are never modified.
+
         Args:
             timestep (float):
               Time-step for integration of microphysics (s)
@@ -123,20 +174,66 @@ class MicrophysicsSchemeWrapper:
             Thermodynamics: Updated thermodynamic properties after microphysics computations.
 
         """
+        if self.decomposition is not None:
+            return self._run_decomposed(timestep, thermo)
+
         # de-dimensionlise variables
-        thermo.press /= self.P0
-        thermo.temp /= self.TEMP0
-        thermo.wvel /= self.W0
-        thermo.uvel /= self.W0
-        thermo.vvel /= self.W0
+        np.divide(thermo.press, self.P0, out=self.press_dimless)
+        np.divide(thermo.temp, self.TEMP0, out=self.temp_dimless)
+        np.copyto(self.qvap_dimless, thermo.massmix_ratios["qvap"])
+        np.copyto(self.qcond_dimless, thermo.massmix_ratios["qcond"])
+        if self.W0 != 1.0:
+            np.divide(thermo.wvel, self.W0, out=self.wvel_dimless)
+            np.divide(thermo.uvel, self.W0, out=self.uvel_dimless)
+            np.divide(thermo.vvel, self.W0, out=self.vvel_dimless)
+
+        self.microphys.run(timestep)
+
+        # re-dimensionlise variables updated by CLEO
+        np.multiply(self.temp_dimless, self.TEMP0, out=thermo.temp)
+        np.copyto(thermo.massmix_ratios["qvap"], self.qvap_dimless)
+        np.copyto(thermo.massmix_ratios["qcond"], self.qcond_dimless)
+
+        return thermo
+
+    def _run_decomposed(self, timestep, thermo):
+        """Run the microphysics computations with CLEO's gridboxes decomposed across ranks.
+
+        Thermodynamics are scattered from the root rank into the local (dimensionless)
+        arrays coupled to CLEO on every rank, and after running SDM the variables updated
+        by CLEO are gathered back into thermo on the root rank. On other ranks thermo is
+        ignored (e.g. None) and returned unchanged.
+        """
+        dec = self.decomposition
+
+        def var(name):
+            """return variable of thermodynamics on root rank, otherwise None"""
+            if not dec.is_root:
+                return None
+            if name in thermo.massmix_ratios:
+                return thermo.massmix_ratios[name]
+            return getattr(thermo, name)
+
+        # scatter and de-dimensionlise variables
+        dec.scatter(var("press"), self.press_dimless)
+        self.press_dimless /= self.P0
+        dec.scatter(var("temp"), self.temp_dimless)
+        self.temp_dimless /= self.TEMP0
+        dec.scatter(var("qvap"), self.qvap_dimless)
+        dec.scatter(var("qcond"), self.qcond_dimless)
+        for name in ("wvel", "uvel", "vvel"):
+            local = getattr(self, name + "_dimless")
+            if local.size:
+                dec.scatter(var(name), local)
+                if self.W0 != 1.0:
+                    local /= self.W0
 
         self.microphys.run(timestep)
 
-        # re-dimensionlise variables
-        thermo.press *= self.P0
-        thermo.temp *= self.TEMP0
-        thermo.wvel *= self.W0
-        thermo.uvel *= self.W0
-        thermo.vvel *= self.W0
+        # re-dimensionlise and gather variables updated by CLEO
+        np.multiply(self.temp_dimless, self.TEMP0, out=self._gather_buffer)
+        dec.gather(self._gather_buffer, var("temp"))
+        dec.gather(self.qvap_dimless, var("qvap"))
+        dec.gather(self.qcond_dimless, var("qcond"))
 
         return thermo
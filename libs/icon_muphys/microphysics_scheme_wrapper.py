@@ -8,7 +8,7 @@ Created Date: Wednesday 28th February 2024
 Author: Clara Bayley (CB)
 Additional Contributors: Joerg Behrens, Georgiana Mania
 -----
-Last Modified: Wednesday 4th June 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -19,17 +19,21 @@ wrapper function for an instance of MicrophysicsScheme so it can be used by gene
 and run scripts.
 NOTE: To use the wrapper, you must first export "AES_MUPHYS_PY_DIR". Currently on Levante, do:
 export AES_MUPHYS_PY_DIR=/work/k20200/k202174/icon-mpim/ragnarok/build_py/src/aes_microphysics/
+The bindings (aes_muphys_py) are only imported once a wrapper is created.
 """
 
-import os
-import sys
 import numpy as np
 from copy import deepcopy
 
 from ..thermo.thermodynamics import Thermodynamics
+from ..utility_functions.scheme_registry import import_extension
 
-sys.path.append(os.environ["AES_MUPHYS_PY_DIR"])
-import aes_muphys_py
+
+def __getattr__(name):
+    """Import the ICON AES bindings lazily on access of the module's aes_muphys_py."""
+    if name == "aes_muphys_py":
+        return import_extension("aes_muphys_py", "AES_MUPHYS_PY_DIR")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class MicrophysicsSchemeWrapper:
@@ -53,6 +57,9 @@ class MicrophysicsSchemeWrapper:
           Cloud number concentration.
         lrain (bool):
           Switch to enable precipitation
+        inplace (bool, optional):
+          If True, update the arrays of the thermodynamics given to run() directly rather than
+          a copy of them. Defaults to False.
 
     Attributes:
         nvec (int):
@@ -65,12 +72,21 @@ class MicrophysicsSchemeWrapper:
           Layer thickness of full levels (m).
         qnc (float):
           Cloud number concentration.
+        inplace (bool):
+          If True, run() updates the given thermodynamics in-place (zero-copy).
         microphys (MicrophysicsScheme):
           instance of Python MicrophysicsScheme.
+        prr_gsp, pri_gsp, prs_gsp, prg_gsp, pre_gsp (np.ndarray):
+          Surface precipitation rates of rain, ice, snow and graupel and the energy flux
+          of precipitation from the most recent call to run(), shape (nvec,).
+        pflx (np.ndarray):
+          Total precipitation flux from the most recent call to run(), shape (nvec, ke).
+        total_ice (np.ndarray):
+          Work array for the sum of ice, snow and graupel mass mixing ratios.
 
     """
 
-    def __init__(self, nvec, ke, ivstart, dz, qnc, lrain):
+    def __init__(self, nvec, ke, ivstart, dz, qnc, lrain, inplace=False):
         """Initialize the MicrophysicsSchemeWrapper object.
 
         Args:
@@ -86,6 +102,9 @@ class MicrophysicsSchemeWrapper:
             Cloud number concentration.
           lrain (bool):
             Switch to enable precipitation
+          inplace (bool, optional):
+            If True, update the arrays of the thermodynamics given to run() directly rather than
+            a copy of them. Defaults to False.
 
         """
         self.nvec = nvec
@@ -93,10 +112,20 @@ class MicrophysicsSchemeWrapper:
         self.ivstart = ivstart
         self.dz = dz
         self.qnc = np.float64(qnc)
-        self.microphys = aes_muphys_py
+        self.microphys = import_extension("aes_muphys_py", "AES_MUPHYS_PY_DIR")
 
         self.name = "Wrapper around " + "ICON AES microphysics"  # self.microphys.name
         self.lrain = lrain
+        self.inplace = inplace
+
+        # buffers reused by every call to run()
+        self.prr_gsp = np.zeros(self.nvec, dtype=np.float64)
+        self.pri_gsp = np.zeros(self.nvec, dtype=np.float64)
+        self.prs_gsp = np.zeros(self.nvec, dtype=np.float64)
+        self.prg_gsp = np.zeros(self.nvec, dtype=np.float64)
+        self.pre_gsp = np.zeros(self.nvec, dtype=np.float64)
+        self.pflx = np.zeros((self.nvec, self.ke), dtype=np.float64)
+        self.total_ice = np.zeros(self.nvec * self.ke, dtype=np.float64)
 
     def initialize(self) -> int:
         """Initialise the microphysics scheme.
@@ -110,6 +139,25 @@ class MicrophysicsSchemeWrapper:
 
         return 0
 
+    def precipitation_diagnostics(self) -> dict:
+        """Return the precipitation diagnostics from the most recent call to run().
+
+        The arrays returned are the wrapper's own buffers, not copies, and so they are
+        overwritten by the next call to run(). Copy them if they need to be kept.
+
+        Returns:
+            dict: Mapping from the name of each diagnostic ("prr_gsp", "pri_gsp", "prs_gsp",
+            "prg_gsp", "pre_gsp" and "pflx") to its array.
+        """
+        return {
+            "prr_gsp": self.prr_gsp,
+            "pri_gsp": self.pri_gsp,
+            "prs_gsp": self.prs_gsp,
+            "prg_gsp": self.prg_gsp,
+            "pre_gsp": self.pre_gsp,
+            "pflx": self.pflx,
+        }
+
     def finalize(self) -> int:
         """Finalise the microphysics scheme.
 
@@ -123,11 +171,32 @@ class MicrophysicsSchemeWrapper:
 
         return 0
 
+    def get_state(self) -> dict:
+        """Return the internal state of the microphysics scheme (for checkpointing).
+
+        The scheme has no internal state between calls to run().
+
+        Returns:
+            dict: Empty dictionary.
+        """
+        return {}
+
+    def set_state(self, state: dict):
+        """Restore the internal state of the microphysics scheme from get_state().
+
+        The scheme has no internal state between calls to run(), so this does nothing.
+        """
+        pass
+
     def run(self, timestep: float, thermo: Thermodynamics) -> Thermodynamics:
         """Run the microphysics computations.
 
         This method is a wrapper of the MicrophysicsScheme object's run function to call the
         microphysics computations in a way that's compatible with the test and scripts in this project.
+        If the wrapper was initialised with inplace=True, the arrays of thermo are updated
+        directly and thermo itself is returned, otherwise a copy of thermo is updated and returned.
+        The precipitation diagnostics are written into the wrapper's preallocated buffers,
+        see precipitation_diagnostics().
 
         Args:
             timestep (float):
@@ -140,23 +209,20 @@ class MicrophysicsSchemeWrapper:
 
         """
 
-        cp_thermo = deepcopy(thermo)
+        cp_thermo = thermo if self.inplace else deepcopy(thermo)
         dt = np.float64(timestep)
         t = cp_thermo.temp
         rho = cp_thermo.rho
         p = cp_thermo.press
         qv, qc, qi, qr, qs, qg = cp_thermo.unpack_massmix_ratios()
 
-        prr_gsp = np.zeros(self.nvec, dtype=np.float64)
-        pri_gsp = np.zeros(self.nvec, dtype=np.float64)
-        prs_gsp = np.zeros(self.nvec, dtype=np.float64)
-        prg_gsp = np.zeros(self.nvec, dtype=np.float64)
-        pre_gsp = np.zeros(self.nvec, dtype=np.float64)
-        pflx = np.zeros((self.nvec, self.ke), np.float64)
+        for buffer in self.precipitation_diagnostics().values():
+            buffer.fill(0.0)
+        total_ice = self.total_ice.reshape(qg.shape)  # view on work array
 
         # call saturation adjustment
-        total_ice = qg + qs + qi  # temporary variable
-        aes_muphys_py.saturation_adjustment(
+        self._sum_total_ice(qi, qs, qg, total_ice)
+        self.microphys.saturation_adjustment(
             ncells=self.nvec,
             nlev=self.ke,
             ta=t,
@@ -183,18 +249,18 @@ class MicrophysicsSchemeWrapper:
             qs=qs,
             qg=qg,
             qnc=self.qnc,
-            prr_gsp=prr_gsp,
-            pri_gsp=pri_gsp,
-            prs_gsp=prs_gsp,
-            prg_gsp=prg_gsp,
-            pre_gsp=pre_gsp,
-            pflx=pflx,
+            prr_gsp=self.prr_gsp,
+            pri_gsp=self.pri_gsp,
+            prs_gsp=self.prs_gsp,
+            prg_gsp=self.prg_gsp,
+            pre_gsp=self.pre_gsp,
+            pflx=self.pflx,
             lrain=self.lrain,
         )
 
         # call saturation adjustment
-        total_ice = qg + qs + qi  # temporary variable
-        aes_muphys_py.saturation_adjustment(
+        self._sum_total_ice(qi, qs, qg, total_ice)
+        self.microphys.saturation_adjustment(
             ncells=self.nvec,
             nlev=self.ke,
             ta=t,
@@ -209,3 +275,8 @@ class MicrophysicsSchemeWrapper:
         cp_thermo.copy_massmix_ratios(qv, qc, qi, qr, qs, qg)
 
         return cp_thermo
+
+    def _sum_total_ice(self, qi, qs, qg, total_ice):
+        """Write qg + qs + qi into the (preallocated) total_ice array."""
+        np.add(qg, qs, out=total_ice)
+        np.add(total_ice, qi, out=total_ice)
@@ -8,7 +8,7 @@ Created Date: Thursday 21st November 2024
 Author: Clara Bayley (CB)
 Additional Contributors: Joerg Behrens, Georgiana Mania
 -----
-Last Modified: Friday 22nd November 2024
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -19,16 +19,20 @@ wrapper function for an instance of MicrophysicsScheme so it can be used by gene
 and run scripts
 NOTE: To use the wrapper, you must first export "AES_MUPHYS_PY_DIR". Currently on Levante, do:
 export AES_MUPHYS_PY_DIR=/work/k20200/k202174/icon-mpim/ragnarok/build_py/src/aes_microphysics/
+The bindings (aes_muphys_py) are only imported once a wrapper is created.
 """
 
-import os
-import sys
 from copy import deepcopy
 
 from ..thermo.thermodynamics import Thermodynamics
+from ..utility_functions.scheme_registry import import_extension
 
-sys.path.append(os.environ["AES_MUPHYS_PY_DIR"])
-import aes_muphys_py
+
+def __getattr__(name):
+    """Import the ICON AES bindings lazily on access of the module's aes_muphys_py."""
+    if name == "aes_muphys_py":
+        return import_extension("aes_muphys_py", "AES_MUPHYS_PY_DIR")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class MicrophysicsSchemeWrapper:
@@ -51,6 +55,9 @@ class MicrophysicsSchemeWrapper:
           Layer thickness of full levels (m).
         qnc (float):
           Cloud number concentration.
+        inplace (bool, optional):
+          If True, update the arrays of the thermodynamics given to run() directly rather than
+          a copy of them. Defaults to False.
 
     Attributes:
         nvec (int):
@@ -63,12 +70,14 @@ class MicrophysicsSchemeWrapper:
           Layer thickness of full levels (m).
         qnc (float):
           Cloud number concentration.
+        inplace (bool):
+          If True, run() updates the given thermodynamics in-place (zero-copy).
         microphys (MicrophysicsScheme):
           instance of Python MicrophysicsScheme.
 
     """
 
-    def __init__(self, nvec, ke, ivstart, dz, qnc):
+    def __init__(self, nvec, ke, ivstart, dz, qnc, inplace=False):
         """Initialize the MicrophysicsSchemeWrapper object.
 
         Args:
@@ -82,6 +91,9 @@ class MicrophysicsSchemeWrapper:
             Layer thickness of full levels (m).
           qnc (float):
             Cloud number concentration.
+          inplace (bool, optional):
+            If True, update the arrays of the thermodynamics given to run() directly rather than
+            a copy of them. Defaults to False.
 
         """
         self.nvec = nvec
@@ -89,7 +101,8 @@ class MicrophysicsSchemeWrapper:
         self.ivstart = ivstart
         self.dz = dz
         self.qnc = qnc
-        self.microphys = aes_muphys_py
+        self.inplace = inplace
+        self.microphys = import_extension("aes_muphys_py", "AES_MUPHYS_PY_DIR")
         self.name = (
             "Wrapper around " + "ICON Saturation Adjustment"
         )  # self.microphys.name
@@ -120,11 +133,30 @@ class MicrophysicsSchemeWrapper:
 
         return 0
 
+    def get_state(self) -> dict:
+        """Return the internal state of the microphysics scheme (for checkpointing).
+
+        The scheme has no internal state between calls to run().
+
+        Returns:
+            dict: Empty dictionary.
+        """
+        return {}
+
+    def set_state(self, state: dict):
+        """Restore the internal state of the microphysics scheme from get_state().
+
+        The scheme has no internal state between calls to run(), so this does nothing.
+        """
+        pass
+
     def run(self, timestep: float, thermo: Thermodynamics) -> Thermodynamics:
         """Run the microphysics computations.
 
         This method is a wrapper of the MicrophysicsScheme object's run function to call the
         microphysics computations in a way that's compatible with the test and scripts in this project.
+        If the wrapper was initialised with inplace=True, the arrays of thermo are updated
+        directly and thermo itself is returned, otherwise a copy of thermo is updated and returned.
 
         Args:
             timestep (float):
@@ -137,14 +169,14 @@ class MicrophysicsSchemeWrapper:
 
         """
 
-        cp_thermo = deepcopy(thermo)
+        cp_thermo = thermo if self.inplace else deepcopy(thermo)
         t = cp_thermo.temp
         rho = cp_thermo.rho
         qv, qc, qi, qr, qs, qg = cp_thermo.unpack_massmix_ratios()
 
         # call saturation adjustment
         total_ice = qg + qs + qi  # temporary variable
-        aes_muphys_py.saturation_adjustment(
+        self.microphys.saturation_adjustment(
             ncells=self.nvec,
             nlev=self.ke,
             ta=t,
@@ -8,7 +8,7 @@ Created Date: Wednesday 28th February 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Monday 11th November 2024
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -43,6 +43,9 @@ class MicrophysicsSchemeWrapper:
           Layer thickness of full levels (m).
         qnc (float):
           Cloud number concentration.
+        inplace (bool, optional):
+          If True, update the arrays of the thermodynamics given to run() directly rather than
+          a copy of them. Defaults to False.
 
     Attributes:
         nvec (int):
@@ -55,12 +58,14 @@ class MicrophysicsSchemeWrapper:
           Layer thickness of full levels (m).
         qnc (float):
           Cloud number concentration.
+        inplace (bool):
+          If True, run() updates the given thermodynamics in-place (zero-copy).
         microphys (MicrophysicsScheme):
           instance of Python MicrophysicsScheme.
 
     """
 
-    def __init__(self, nvec, ke, ivstart, dz, qnc):
+    def __init__(self, nvec, ke, ivstart, dz, qnc, inplace=False):
         """Initialize the MicrophysicsSchemeWrapper object.
 
         Args:
@@ -74,6 +79,9 @@ class MicrophysicsSchemeWrapper:
             Layer thickness of full levels (m).
           qnc (float):
             Cloud number concentration.
+          inplace (bool, optional):
+            If True, update the arrays of the thermodynamics given to run() directly rather than
+            a copy of them. Defaults to False.
 
         """
         self.nvec = nvec
@@ -81,6 +89,7 @@ class MicrophysicsSchemeWrapper:
         self.ivstart = ivstart
         self.dz = dz
         self.qnc = qnc
+        self.inplace = inplace
         self.microphys = MicrophysicsScheme()
         self.name = "Wrapper around " + self.microphys.name
 
@@ -110,11 +119,25 @@ class MicrophysicsSchemeWrapper:
 
         return 0
 
+    def get_state(self) -> dict:
+        """Return the internal state of the microphysics scheme (for checkpointing).
+
+        Returns:
+            dict: Number of calls to the scheme's run function, "n".
+        """
+        return {"n": self.microphys.n}
+
+    def set_state(self, state: dict):
+        """Restore the internal state of the microphysics scheme from get_state()."""
+        self.microphys.n = int(state["n"])
+
     def run(self, timestep: float, thermo: Thermodynamics) -> Thermodynamics:
         """Run the microphysics computations.
 
         This method is a wrapper of the MicrophysicsScheme object's run function to call the
         microphysics computations in a way that's compatible with the test and scripts in this project.
+        If the wrapper was initialised with inplace=True, the arrays of thermo are updated
+        directly and thermo itself is returned, otherwise a copy of thermo is updated and returned.
 
         Args:
             timestep (float):
@@ -127,7 +150,7 @@ class MicrophysicsSchemeWrapper:
 
         """
 
-        cp_thermo = deepcopy(thermo)
+        cp_thermo = thermo if self.inplace else deepcopy(thermo)
         dt = timestep
         t = cp_thermo.temp
         rho = cp_thermo.rho
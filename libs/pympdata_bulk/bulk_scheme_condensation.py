@@ -8,7 +8,7 @@ Created Date: Monday 2nd September 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Wednesday 4th September 2024
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -19,12 +19,20 @@ Simple bulk microphysics scheme extracted from pyMPDATA
 Shipway and Hill 2012 example for 1-D KiD rainshaft model
 """
 
+import numba
 import numpy as np
 from ..thermo.thermodynamics import Thermodynamics
 from PyMPDATA_examples import Shipway_and_Hill_2012 as kid
 
 from copy import deepcopy
 
+# constants for numba kernel (compile-time constants) from Shipway and Hill 2012 formulae
+T0 = kid.const.T0
+EPS = kid.const.eps
+ARM_C1 = kid.const.ARM_C1
+ARM_C2 = kid.const.ARM_C2
+ARM_C3 = kid.const.ARM_C3
+
 
 def bulk_scheme_condensation(temp, press, qvap, qcond):
     """
@@ -56,9 +64,68 @@ def bulk_scheme_condensation(temp, press, qvap, qcond):
     return qvap, qcond
 
 
+@numba.njit(cache=True)
+def _bulk_scheme_condensation_kernel(temp, press, qvap, qcond):
+    """Saturation adjustment of bulk_scheme_condensation fused into a single loop over
+    (1-D arrays of) cells which updates qvap and qcond in-place without temporary arrays.
+    Cells which are not supersaturated (including cells with no vapour) are skipped since
+    there is no condensation in them."""
+    for i in range(qvap.shape[0]):
+        temp_celsius = temp[i] - T0
+        pvs = ARM_C1 * np.exp((ARM_C2 * temp_celsius) / (temp_celsius + ARM_C3))
+        relh = press[i] * qvap[i] / (qvap[i] + EPS) / pvs
+        if relh <= 1.0:
+            continue
+
+        dqcond = qvap[i] * (1 - 1 / relh)
+
+        qvap[i] -= dqcond
+        qcond[i] += dqcond
+
+
+def bulk_scheme_condensation_numba(temp, press, qvap, qcond):
+    """
+    Numba-compiled equivalent of bulk_scheme_condensation.
+
+    Enacts the same saturation adjustment on qvap and qcond as bulk_scheme_condensation (which
+    is the reference implementation) but in a single compiled pass over the cells.
+    qvap and qcond are updated in-place so they must be contiguous numpy arrays.
+
+    Parameters:
+    temp (np.ndarray): Temperature in Kelvin.
+    press (np.ndarray): Pressure in Pascals.
+    qvap (np.ndarray): Specific humidity of water vapor (kg/kg).
+    qcond (np.ndarray): Specific humidity of condensed water (kg/kg).
+
+    Returns:
+    tuple: Adjusted specific humidities of water vapor and condensed water (qvap, qcond).
+    """
+    assert (
+        qvap.flags["C_CONTIGUOUS"] and qcond.flags["C_CONTIGUOUS"]
+    ), "qvap and qcond must be contiguous to be updated in-place"
+    _bulk_scheme_condensation_kernel(
+        np.ravel(temp), np.ravel(press), qvap.reshape(-1), qcond.reshape(-1)
+    )
+
+    return qvap, qcond
+
+
 class MicrophysicsSchemeWrapper:
-    def __init__(self):
-        """Initialize the WrappedKiDBulkMicrophysics object."""
+    def __init__(self, inplace=False, use_numba=False):
+        """Initialize the WrappedKiDBulkMicrophysics object.
+
+        Args:
+            inplace (bool, optional): If True, update the arrays of the thermodynamics given
+              to run() directly rather than a copy of them. Defaults to False.
+            use_numba (bool, optional): If True, use the numba-compiled
+              bulk_scheme_condensation_numba rather than the reference NumPy
+              bulk_scheme_condensation. Defaults to False.
+        """
+        self.inplace = inplace
+        if use_numba:
+            self.condensation = bulk_scheme_condensation_numba
+        else:
+            self.condensation = bulk_scheme_condensation
         self.microphys = "pyMPDATA KiD Bulk Microphysics Scheme for Condensation"
         self.name = "Wrapper around " + self.microphys
 
@@ -82,11 +149,30 @@ class MicrophysicsSchemeWrapper:
         """
         return 0
 
+    def get_state(self) -> dict:
+        """Return the internal state of the microphysics scheme (for checkpointing).
+
+        The scheme has no internal state between calls to run().
+
+        Returns:
+            dict: Empty dictionary.
+        """
+        return {}
+
+    def set_state(self, state: dict):
+        """Restore the internal state of the microphysics scheme from get_state().
+
+        The scheme has no internal state between calls to run(), so this does nothing.
+        """
+        pass
+
     def run(self, timestep: float, thermo: Thermodynamics) -> Thermodynamics:
         """Run the microphysics computations.
 
         This method is a wrapper of the MicrophysicsScheme object's run function to call the
         microphysics computations in a way that's compatible with the test and scripts in this project.
+        If the wrapper was initialised with inplace=True, the arrays of thermo are updated
+        directly and thermo itself is returned, otherwise a copy of thermo is updated and returned.
 
         Args:
             timestep (float): Time-step for integration of microphysics (s).
@@ -96,13 +182,13 @@ class MicrophysicsSchemeWrapper:
             Thermodynamics: Updated thermodynamic properties after microphysics computations.
         """
 
-        cp_thermo = deepcopy(thermo)
+        cp_thermo = thermo if self.inplace else deepcopy(thermo)
         temp = cp_thermo.temp
         press = cp_thermo.press
         qvap = cp_thermo.massmix_ratios["qvap"]
         qcond = cp_thermo.massmix_ratios["qcond"]
 
-        qvap, qcond = bulk_scheme_condensation(temp, press, qvap, qcond)
+        qvap, qcond = self.condensation(temp, press, qvap, qcond)
 
         cp_thermo.massmix_ratios["qvap"][:] = qvap
         cp_thermo.massmix_ratios["qcond"][:] = qcond
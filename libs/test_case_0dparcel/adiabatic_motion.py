@@ -8,7 +8,7 @@ Created Date: Wednesday 28th February 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Wednesday 4th June 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -25,17 +25,24 @@ import scipy.integrate as integrate
 class AdiabaticMotion:
     """A class for driving the adiabatic expansion/contraction of a volume of air.
 
-    Enacts adiabatic sinusoidal pressure change of parcel of air.
+    Enacts adiabatic sinusoidal pressure change of parcel of air. An ensemble of N independent
+    parcels can be driven at once by giving thermodynamics with N elements, in which case the
+    equations for all the parcels are integrated together in one (vectorised) ODE solve.
 
     Args:
         amp (float):
           Amplitude of pressure sinusoid [Pa].
         tau (float):
           Time period of the pressure sinusoid [s].
+        analytic (bool, optional):
+          If True, each timestep is integrated using the analytical solution to the equations
+          rather than with scipy's odeint. Defaults to False.
 
     Attributes:
         amp (float):
           Amplitude of pressure sinusoid [Pa].
+        analytic (bool):
+          Whether to use the analytical solution (True) or odeint (False) for each timestep.
         omega (float):
           Angular frequency of pressure sinusoid (tau is time period) [radians s^-1].
         cp_dry (float):
@@ -46,7 +53,7 @@ class AdiabaticMotion:
           Ratio of gas constants, dry air / water vapour (approx. 0.622).
     """
 
-    def __init__(self, amp, tau):
+    def __init__(self, amp, tau, analytic=False):
         """Initialize the AdiabaticMotion object.
 
         Args:
@@ -54,6 +61,9 @@ class AdiabaticMotion:
               Amplitude of pressure sinusoid [Pa].
             tau (float):
               Time period of the pressure sinusoid [s].
+            analytic (bool, optional):
+              If True, each timestep is integrated using the analytical solution to the
+              equations rather than with scipy's odeint. Defaults to False.
         """
 
         rgas_univ = 8.314462618  # universal molar gas constant [J/kg/K]
@@ -72,6 +82,7 @@ class AdiabaticMotion:
         self.omega = (
             2.0 * np.pi / tau
         )  # angular frequency of pressure sinusio (tau is time period) [radians s^-1]
+        self.analytic = analytic
 
     def dpress_dtime(self, time):
         r"""Calculate the rate of change of pressure with respect to time.
@@ -163,20 +174,100 @@ class AdiabaticMotion:
 
         return drho_dt
 
+    def delta_press(self, time, timestep):
+        r"""Calculate the change in pressure from time to time+timestep.
+
+        The change in pressure is the integral of :math:`\frac{dP}{dt}` over the timestep:
+
+        .. math:: \Delta P = - A \left( \sin(\omega (t + \Delta t)) - \sin(\omega t) \right)
+
+        Args:
+            time (float): Current time [s].
+            timestep (float): Time step size [s].
+
+        Returns:
+            float: Change in pressure over the timestep [Pa].
+        """
+
+        t0, t1 = time, time + timestep
+        delta_press = -self.amp * (np.sin(self.omega * t1) - np.sin(self.omega * t0))
+
+        return delta_press
+
+    def analytic_solution(self, qvap, temp, rho, press, delta_press):
+        r"""Calculate temperature, density and pressure after a change in pressure.
+
+        Since :math:`q_{\rm v}` is constant during the adiabatic motion, the equations for
+        :math:`\frac{dT}{dt}` and :math:`\frac{d\rho}{dt}` can be written as ODEs in pressure
+        and integrated exactly to give
+
+        .. math::
+          T = T_{0} \left(1 + \frac{\Delta P}{\rho_{0} R_{\rm eff} T_{0}}\right)
+              ^{\frac{R_{\rm eff}}{c_{\rm p, dry}}}
+
+        .. math::
+          \rho = \rho_{0} \left(\frac{T}{T_{0}}\right)^{\frac{c_{\rm p, dry}}{R_{\rm eff}} - 1}
+
+        where :math:`R_{\rm eff} = R_{\rm dry} \left(1 + \frac{q_{\rm v}}{\epsilon}\right)`
+        and subscript :math:`0` denotes the value before the change in pressure.
+
+        Args:
+            qvap (np.ndarray):
+              Mass mixing ratio of water vapor [kg/kg].
+            temp (np.ndarray):
+              Temperature of air before the change in pressure [K].
+            rho (np.ndarray):
+              Density of air before the change in pressure [kg/m^3].
+            press (np.ndarray):
+              Pressure of air before the change in pressure [Pa].
+            delta_press (float):
+              Change in pressure [Pa].
+
+        Returns:
+            tuple: Temperature [K], density [kg/m^3] and pressure [Pa] after the change.
+        """
+
+        rgas_eff = self.rgas_dry * (1 + qvap / self.epsilon)
+        exponent = rgas_eff / self.cp_dry
+
+        temp_ratio = (1 + delta_press / (rho * rgas_eff * temp)) ** exponent
+
+        return (
+            temp * temp_ratio,
+            rho * temp_ratio ** (1 / exponent - 1),
+            press + delta_press,
+        )
+
     def adiabatic_odes(self, y, time, qvap):
-        temp, rho, press = y
-        dpress_dt = self.dpress_dtime(time)
+        """Right hand side of ODEs for adiabatic motion of an ensemble of N parcels.
+
+        Args:
+            y (np.ndarray):
+              Concatenation of temperature [K], density [kg/m^3] and pressure [Pa] of the
+              N parcels, i.e. [temp_0, ..., temp_N-1, rho_0, ..., press_N-1].
+            time (float):
+              Current time [s].
+            qvap (np.ndarray):
+              Mass mixing ratio of water vapor of the N parcels [kg/kg].
+
+        Returns:
+            np.ndarray: Concatenation of the rates of change of temperature, density and pressure.
+        """
+        temp, rho, press = np.split(y, 3)
+        dpress_dt = np.full_like(press, self.dpress_dtime(time))
         dtemp_dt = self.dtemp_dtime(rho, dpress_dt)
         drho_dt = self.drho_dtime(qvap, temp, rho, dtemp_dt, dpress_dt)
 
-        return [dtemp_dt, drho_dt, dpress_dt]
+        return np.concatenate((dtemp_dt, drho_dt, dpress_dt))
 
     def run(self, time, timestep, thermo):
         """
         Run the adiabatic motion computations.
 
         This method integrates the equations from time to time+timestep for adiabatic
-        expansion/contraction of a parcel of air.
+        expansion/contraction of a parcel of air, or of an ensemble of N independent parcels
+        if thermo has N elements. Integration is either by odeint or, if analytic is True, by
+        the analytical solution to the equations (see analytic_solution).
 
         Args:
             time (float):
@@ -189,38 +280,42 @@ class AdiabaticMotion:
         Returns:
             Thermodynamics: Updated thermodynamic state of the air.
         """
+        nparcels = thermo.temp.size
         assert (
-            thermo.temp.size == 1
-        ), "AdiabaticMotion only applicable to 0-D parcel (1 element)"
-        assert (
-            thermo.rho.size == 1
-        ), "AdiabaticMotion only applicable to 0-D parcel (1 element)"
+            thermo.rho.size == nparcels
+        ), "AdiabaticMotion requires one element per parcel for every variable"
         assert (
-            thermo.press.size == 1
-        ), "AdiabaticMotion only applicable to 0-D parcel (1 element)"
+            thermo.press.size == nparcels
+        ), "AdiabaticMotion requires one element per parcel for every variable"
         assert (
-            thermo.massmix_ratios["qvap"].size == 1
-        ), "AdiabaticMotion only applicable to 0-D parcel (1 element)"
-        assert (thermo.wvel.size == 2) or (
+            thermo.massmix_ratios["qvap"].size == nparcels
+        ), "AdiabaticMotion requires one element per parcel for every variable"
+        assert (thermo.wvel.size == nparcels + 1) or (
             thermo.wvel.size == 0
-        ), "AdiabaticMotion only applicable to 0-D parcel (1 element)"
-        assert (thermo.uvel.size == 2) or (
+        ), "AdiabaticMotion requires one element per parcel for every variable"
+        assert (thermo.uvel.size == nparcels + 1) or (
             thermo.uvel.size == 0
-        ), "AdiabaticMotion only applicable to 0-D parcel (1 element)"
-        assert (thermo.vvel.size == 2) or (
+        ), "AdiabaticMotion requires one element per parcel for every variable"
+        assert (thermo.vvel.size == nparcels + 1) or (
             thermo.vvel.size == 0
-        ), "AdiabaticMotion only applicable to 0-D parcel (1 element)"
+        ), "AdiabaticMotion requires one element per parcel for every variable"
 
         t0, t1 = time, time + timestep
-        qvap = thermo.massmix_ratios["qvap"][0]
-
-        y0 = [thermo.temp[0], thermo.rho[0], thermo.press[0]]
-        temp, rho, press = integrate.odeint(
-            self.adiabatic_odes, y0, [t0, t1], args=(qvap,)
-        )[1]
-
-        thermo.temp[0] = temp
-        thermo.rho[0] = rho
-        thermo.press[0] = press
+        qvap = thermo.massmix_ratios["qvap"]
+
+        if self.analytic:
+            delta_press = self.delta_press(time, timestep)
+            temp, rho, press = self.analytic_solution(
+                qvap, thermo.temp, thermo.rho, thermo.press, delta_press
+            )
+        else:
+            y0 = np.concatenate((thermo.temp, thermo.rho, thermo.press))
+            temp, rho, press = np.split(
+                integrate.odeint(self.adiabatic_odes, y0, [t0, t1], args=(qvap,))[1], 3
+            )
+
+        thermo.temp[:] = temp
+        thermo.rho[:] = rho
+        thermo.press[:] = press
 
         return thermo
@@ -8,7 +8,7 @@ Created Date: Thursday 29th February 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Wednesday 4th June 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -19,15 +19,42 @@ run 0-D parcel model by timestepping and outputting data
 """
 
 from .adiabatic_motion import AdiabaticMotion
-from libs.thermo.output_thermodynamics import OutputThermodynamics
+from libs.thermo.output_thermodynamics import (
+    OutputThermodynamics,
+    StreamingOutputThermodynamics,
+    steps_per_output,
+)
+from libs.utility_functions.checkpoint import (
+    check_run_checkpointable,
+    read_run_checkpoint,
+    write_run_checkpoint,
+)
+from libs.utility_functions.phase_timers import NullTimers, scheme_phase_name
 
 
-def run_0dparcel(time, time_end, timestep, thermo, microphys_scheme):
+def run_0dparcel(
+    time,
+    time_end,
+    timestep,
+    thermo,
+    microphys_scheme,
+    outfile=None,
+    output_timestep=None,
+    output_variables=None,
+    amp=11325,
+    tau=120,
+    timers=None,
+    checkpoint_file=None,
+    checkpoint_timestep=None,
+    restart_file=None,
+):
     """Run a 0-D parcel model with a specified microphysics scheme and parcel dynamics.
 
     This function runs a 0-D parcel model with the given initial thermodynamic conditions, and
     microphysics scheme from time to time_end with a constant timestep using an instance of
-    AdiabaticMotion for the parcel dynamics.
+    AdiabaticMotion for the parcel dynamics. If the thermodynamics has N elements, an ensemble
+    of N independent parcels is run together and the microphysics scheme is called once per
+    timestep for all N parcels.
 
     Parameters:
         time (float):
@@ -40,35 +67,103 @@ def run_0dparcel(time, time_end, timestep, thermo, microphys_scheme):
           Initial thermodynamic conditions.
         microphys_scheme:
           Microphysics scheme to use.
+        outfile (str or Path, optional):
+          If not None, output is streamed to a Zarr store at this path rather than
+          kept in memory. Defaults to None.
+        output_timestep (float, optional):
+          Time between outputs (s), must be a multiple of timestep. Defaults to None,
+          meaning output every timestep.
+        output_variables (list of str, optional):
+          Names of the thermodynamic variables to output. Defaults to None, meaning all.
+        amp (float, optional):
+          Amplitude of the parcel's pressure sinusoid (Pa). Defaults to 11325.
+        tau (float, optional):
+          Time period of the parcel's pressure sinusoid (s). Defaults to 120.
+        timers (PhaseTimers, optional):
+          If not None, the wall time spent in each phase of the run (initialize, dynamics,
+          microphysics:<scheme>, output, checkpoint, restart and finalize) is accumulated
+          in timers. Defaults to None.
+        checkpoint_file (str or Path, optional):
+          If not None, the full state of the run is written to a checkpoint (.npz) file at
+          this path every checkpoint_timestep (overwriting the previous checkpoint), see
+          libs.utility_functions.checkpoint. Requires in-memory output (outfile=None) and a
+          microphysics scheme with get_state() and set_state() methods, which is checked
+          before the run starts. Defaults to None.
+        checkpoint_timestep (float, optional):
+          Time between checkpoints (s), must be a multiple of timestep. Required if
+          checkpoint_file is not None. Defaults to None.
+        restart_file (str or Path, optional):
+          If not None, the run resumes from the state in this checkpoint file, which must
+          have been written by a run with the same arguments (other than the checkpoint
+          and restart arguments), with the same requirements as checkpoint_file. The
+          arrays of thermo are overwritten by the checkpoint's thermodynamics. Defaults
+          to None.
 
     Returns:
-          OutputThermodynamics: Output containing thermodynamic data from the model run.
+          OutputThermodynamics (or StreamingOutputThermodynamics if outfile is not None):
+            Output containing thermodynamic data from the model run.
     """
 
     ### data to output during model run
     ntime = int(time_end / timestep) + 1
-    out = OutputThermodynamics([ntime, 1])
+    nparcels = thermo.temp.size
+    output_options = {
+        "variables": output_variables,
+        "output_interval": steps_per_output(timestep, output_timestep),
+    }
+    if outfile is None:
+        out = OutputThermodynamics([ntime, nparcels], **output_options)
+    else:
+        out = StreamingOutputThermodynamics(
+            [ntime, nparcels], outfile, **output_options
+        )
 
     ### type of dynamics parcel will undergo
-    amp = 11325  # amplitude of pressure sinusoid [Pa]
-    tau = 120  # time period of pressure sinusiod [s]
-    parcel_dynamics = AdiabaticMotion(amp, tau)
+    parcel_dynamics = AdiabaticMotion(amp, tau, analytic=True)
 
     ### run dynamics + microphysics from time to time_end
-    microphys_scheme.initialize()
+    if timers is None:
+        timers = NullTimers()
+    microphysics = scheme_phase_name(microphys_scheme)
 
-    out.output_thermodynamics(time, thermo)
+    with timers.phase("initialize"):
+        microphys_scheme.initialize()
+    if checkpoint_file is not None:
+        assert checkpoint_timestep is not None, "checkpointing requires a timestep"
+        checkpoint_interval = steps_per_output(timestep, checkpoint_timestep)
+    if checkpoint_file is not None or restart_file is not None:
+        check_run_checkpointable(out, microphys_scheme)
+
+    step = 0
+    if restart_file is None:
+        with timers.phase("output"):
+            out.output_thermodynamics(time, thermo)
+    else:
+        with timers.phase("restart"):
+            step, time = read_run_checkpoint(
+                restart_file, thermo, out, microphys_scheme
+            )
     while time < time_end:
-        thermo = parcel_dynamics.run(time, timestep, thermo)
+        with timers.phase("dynamics"):
+            thermo = parcel_dynamics.run(time, timestep, thermo)
         #    thermo.print_state()
-        thermo = microphys_scheme.run(timestep, thermo)
+        with timers.phase(microphysics):
+            thermo = microphys_scheme.run(timestep, thermo)
         #    thermo.print_state()
 
         time += timestep
+        step += 1
 
-        out.output_thermodynamics(time, thermo)
+        with timers.phase("output"):
+            out.output_thermodynamics(time, thermo)
+        if checkpoint_file is not None and step % checkpoint_interval == 0:
+            with timers.phase("checkpoint"):
+                write_run_checkpoint(
+                    checkpoint_file, step, time, thermo, out, microphys_scheme
+                )
 
-    microphys_scheme.finalize()
+    with timers.phase("finalize"):
+        microphys_scheme.finalize()
+        out.finalize()
 
-    out.finalize()
     return out
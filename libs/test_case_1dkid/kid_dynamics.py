@@ -8,7 +8,7 @@ Created Date: Monday 2nd September 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Wednesday 4th June 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -51,9 +51,26 @@ class KiDDynamics:
 
     See https://github.com/open-atmos/PyMPDATA/tree/main/examples/PyMPDATA_examples/Shipway_and_Hill_2012
     for the original source code.
+
+    If ncolumns > 1, the dynamics drives ncolumns independent rainshafts, each with its own
+    updraft strength. Then the thermodynamics must have arrays of shape (ncolumns, nz) (and
+    winds, if any, of shape (ncolumns, nz+1)) so that the microphysics scheme is called
+    once per timestep with all ncolumns*nz cells.
     """
 
-    def __init__(self, z_delta, z_max, timestep, t_end, advect_hydrometeors=True):
+    def __init__(
+        self,
+        z_delta,
+        z_max,
+        timestep,
+        t_end,
+        advect_hydrometeors=True,
+        ncolumns=1,
+        wmax_factors=None,
+        multi_field_solver=False,
+        wmax=3,
+        tscale=600,
+    ):
         """Initialize the KiDDynamics object.
 
         Args:
@@ -61,11 +78,24 @@ class KiDDynamics:
             z_max (float): Maximum height of the domain (top of half-cell) [m].
             timestep (float): Size of time steps of simulation [s].
             t_end (float): End time of the simulation [s].
+            advect_hydrometeors (bool, optional): If True, hydrometeors (not only water vapour)
+              are advected. Defaults to True.
+            ncolumns (int, optional): Number of independent columns. Defaults to 1.
+            wmax_factors (array-like, optional): Factor multiplying the maximum updraft
+              velocity of each column. Defaults to None, meaning 1.0 for every column.
+            multi_field_solver (bool, optional): If True, advected fields with the same
+              boundary conditions share one MPDATA Solver (with a common stepper and
+              advector), so that all the hydrometeors are advanced by one compiled call per
+              timestep. Defaults to False.
+            wmax (float, optional): Maximum vertical velocity, 'w1' of equation (6) in
+              Shipway and Hill (2012) [m/s]. Defaults to 3.
+            tscale (float, optional): Timescale of the updraft sinusoid, 't1' of equation (6)
+              in Shipway and Hill (2012) [s]. Defaults to 600.
         """
         options = Options(n_iters=3, nonoscillatory=True)
 
-        WMAX = 3  # maximum vertical velocity [m/s], 'w1' of equation (6) in Shipway and Hill (2012)
-        TSCALE = 600  # timescale of sinusoid [s], 't1' of equation (6) in Shipway and Hill (2012)
+        WMAX = wmax  # maximum vertical velocity [m/s], 'w1' of equation (6) in Shipway and Hill (2012)
+        TSCALE = tscale  # timescale of sinusoid [s], 't1' of equation (6) in Shipway and Hill (2012)
         P0 = 1007 * si.hPa
         self.settings = Settings(
             dt=timestep,
@@ -77,15 +107,31 @@ class KiDDynamics:
             z_max=z_max,
         )
 
-        self.mpdata = MPDATA(
-            nz=self.settings.nz,
-            dt=self.settings.dt,
-            qv_of_zZ_at_t0=lambda zZ: self.settings.qv(zZ * self.settings.dz),
-            g_factor_of_zZ=lambda zZ: self.settings.rhod(zZ * self.settings.dz),
-            options=options,
-        )
+        # one 1-D solver per column (the columns' solvers share the same compiled stepper).
+        # Columns are not solved as one 2-D grid because the non-oscillatory limiter would
+        # couple neighbouring columns through the extrema of psi.
+        self.mpdata_columns = [
+            MPDATA(
+                nz=self.settings.nz,
+                dt=self.settings.dt,
+                qv_of_zZ_at_t0=lambda zZ: self.settings.qv(zZ * self.settings.dz),
+                g_factor_of_zZ=lambda zZ: self.settings.rhod(zZ * self.settings.dz),
+                options=options,
+                advected_fields=None if advect_hydrometeors else ("qvap",),
+                multi_field_solver=multi_field_solver,
+            )
+            for _ in range(ncolumns)
+        ]
+        self.mpdata = self.mpdata_columns[0]
 
         self.advect_hydrometeors = advect_hydrometeors
+        self.ncolumns = ncolumns
+        if wmax_factors is None:
+            wmax_factors = np.ones(ncolumns)
+        self.wmax_factors = np.asarray(wmax_factors, dtype=np.float64)
+        assert self.wmax_factors.shape == (
+            ncolumns,
+        ), "wmax_factors must have one value per column"
 
         assert self.settings.nz == int(z_max / z_delta)
         assert self.settings.dz == z_delta
@@ -97,12 +143,13 @@ class KiDDynamics:
         self.temp_prof = SH2012formulae.temperature(
             self.rhod_prof, self.settings.thd(zfull)
         )
-        qvap0 = self.mpdata["qvap"].advectee.get()
+        qvap0 = self.mpdata.advectees["qvap"].get()
         self.press_prof = SH2012formulae.pressure(self.rhod_prof, self.temp_prof, qvap0)
 
         self.updraught_velocity = UpdraftVelocity(WMAX, TSCALE)
+        self.coupled_thermo = None  # thermodynamics with views onto advectees (if any)
 
-        key = f"nr={self.mpdata.nr}, dz={self.settings.dz}, dt={self.settings.dt}, options={options}"
+        key = f"ncolumns={ncolumns}, nr={self.mpdata.nr}, dz={self.settings.dz}, dt={self.settings.dt}, options={options}"
         print(f"Simulating {self.settings.nt} timesteps using {key}")
 
     def set_thermo(self, time, thermo):
@@ -115,19 +162,21 @@ class KiDDynamics:
             Thermodynamics: Updated thermodynamic state.
         """
         thermo.temp[:] = self.temp_prof
-        thermo.rho[:] = self.rhod_prof
-        thermo.press[:] = self.press_prof
-        thermo.massmix_ratios["qvap"][:] = self.mpdata["qvap"].advectee.get()
-        thermo.massmix_ratios["qcond"][:] = self.mpdata["qcond"].advectee.get()
-        thermo.massmix_ratios["qice"][:] = self.mpdata["qice"].advectee.get()
-        thermo.massmix_ratios["qrain"][:] = self.mpdata["qrain"].advectee.get()
-        thermo.massmix_ratios["qsnow"][:] = self.mpdata["qsnow"].advectee.get()
-        thermo.massmix_ratios["qgrau"][:] = self.mpdata["qgrau"].advectee.get()
-
+        if thermo is not self.coupled_thermo:
+            thermo.rho[:] = self.rhod_prof
+            thermo.press[:] = self.press_prof
         wmagnitude = self.updraught_velocity.magnitude(
             time
         )  # TODO(CB: get from mpdata directly
-        thermo.wvel[:] = np.ones_like(thermo.wvel) * wmagnitude
+        for c, mpdata in enumerate(self.mpdata_columns):
+            for field in mpdata.fields:
+                var = self._column(thermo.massmix_ratios[field], c)
+                advectee = mpdata.advectees[field].get()
+                if not self._is_same_memory(var, advectee):
+                    var[:] = advectee
+
+            wvel = self._column(thermo.wvel, c)
+            wvel[:] = np.ones_like(wvel) * wmagnitude * self.wmax_factors[c]
 
         return thermo
 
@@ -158,14 +207,8 @@ class KiDDynamics:
         )
         advector_0 = np.ones_like(self.settings.z_vec) * GC
 
-        if self.advect_hydrometeors:
-            for field in self.mpdata.fields:
-                self.mpdata[field].advector.get_component(0)[:] = advector_0
-                self.mpdata[field].advance(1)
-        else:
-            field = "qvap"
-            self.mpdata[field].advector.get_component(0)[:] = advector_0
-            self.mpdata[field].advance(1)
+        for c, mpdata in enumerate(self.mpdata_columns):
+            mpdata.advance(advector_0 * self.wmax_factors[c])
 
         thermo = self.set_thermo(time, thermo)
         return thermo
@@ -183,9 +226,87 @@ class KiDDynamics:
         Args:
             thermo (Thermodynamics): Object representing the thermodynamic state.
         """
-        self.mpdata["qvap"].advectee.get()[:] = thermo.massmix_ratios["qvap"]
-        self.mpdata["qcond"].advectee.get()[:] = thermo.massmix_ratios["qcond"]
-        self.mpdata["qice"].advectee.get()[:] = thermo.massmix_ratios["qice"]
-        self.mpdata["qrain"].advectee.get()[:] = thermo.massmix_ratios["qrain"]
-        self.mpdata["qsnow"].advectee.get()[:] = thermo.massmix_ratios["qsnow"]
-        self.mpdata["qgrau"].advectee.get()[:] = thermo.massmix_ratios["qgrau"]
+        for c, mpdata in enumerate(self.mpdata_columns):
+            for field in mpdata.fields:
+                var = self._column(thermo.massmix_ratios[field], c)
+                advectee = mpdata.advectees[field].get()
+                if not self._is_same_memory(var, advectee):
+                    advectee[:] = var
+
+    def couple_thermo(self, thermo):
+        """
+        Couple thermodynamics to the 1-D KiD dynamics without copies.
+
+        This method makes the mass mixing ratios of thermo views onto the memory of the
+        advectees, so that set_thermo and set_advectees do not copy them, and writes the
+        (constant) density and pressure profiles into thermo once. Temperature is still
+        reset to its profile in every call to set_thermo since microphysics schemes may
+        change it. To have no copies at all during a run, thermo must be updated in-place
+        by the microphysics (e.g. a wrapper with inplace=True) and must not be a
+        contiguous thermodynamics object.
+
+        Args:
+            thermo (Thermodynamics): Object representing the thermodynamic state.
+
+        Returns:
+            Thermodynamics: thermo, coupled to the dynamics.
+        """
+        assert self.ncolumns == 1, "coupling without copies requires a single column"
+        assert not thermo.is_contiguous(), "cannot couple contiguous thermodynamics"
+        for field in self.mpdata.fields:
+            var = thermo.massmix_ratios[field]
+            advectee = self.mpdata.advectees[field].get()
+            assert var.shape == advectee.shape, "thermodynamics has wrong shape"
+            thermo.massmix_ratios[field] = advectee
+        thermo.rho[:] = self.rhod_prof
+        thermo.press[:] = self.press_prof
+        self.coupled_thermo = thermo
+
+        return thermo
+
+    def get_state(self):
+        """
+        Return the internal state of the 1-D KiD dynamics (for checkpointing).
+
+        The state is the values of the advectees of every column, all other attributes
+        of the dynamics depend only on its initialisation and on time.
+
+        Returns:
+            dict: Copy of the advectee of each field with shape (ncolumns, nz).
+        """
+        return {
+            field: np.stack(
+                [mpdata.advectees[field].get() for mpdata in self.mpdata_columns]
+            )
+            for field in self.mpdata.fields
+        }
+
+    def set_state(self, state):
+        """
+        Restore the internal state of the 1-D KiD dynamics from get_state().
+
+        Values are copied into the advectees so that thermodynamics coupled to the
+        dynamics (see couple_thermo) remain views onto them.
+
+        Args:
+            state (dict): Values of the advectee of each field with shape (ncolumns, nz).
+        """
+        for field in self.mpdata.fields:
+            assert state[field].shape[0] == self.ncolumns, "wrong number of columns"
+            for c, mpdata in enumerate(self.mpdata_columns):
+                mpdata.advectees[field].get()[:] = state[field][c]
+
+    @staticmethod
+    def _is_same_memory(var, advectee):
+        """True if var is (a view onto exactly) the same memory as advectee."""
+        return (
+            var.ctypes.data == advectee.ctypes.data
+            and var.shape == advectee.shape
+            and var.strides == advectee.strides
+        )
+
+    def _column(self, var, c):
+        """Return (a view of) the part of a thermodynamic variable belonging to column c."""
+        if self.ncolumns == 1 or var.size == 0:
+            return var
+        return var[c]
@@ -8,7 +8,7 @@ Created Date: Wednesday 2nd July 2025
 Author: PyMPATA Authors (PyMPDATA)
 Additional Contributors: Clara Bayley (CB)
 -----
-Last Modified: Wednesday 2nd July 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -17,7 +17,9 @@ https://opensource.org/licenses/BSD-3-Clause
 File Description:
 File is adaptation from PyMPDATA Shipway and Hill 2012 example, copied from:
 https://github.com/open-atmos/PyMPDATA/blob/main/examples/PyMPDATA_examples/Shipway_and_Hill_2012/mpdata.py
-between v1.6.1 and v1.6.2
+between v1.6.1 and v1.6.2, with the option to advect fields with the same boundary conditions
+using a single multi-field Solver (one compiled call per timestep for each group of fields),
+and to skip advecting fields which are identically zero.
 """
 
 import numpy as np
@@ -38,16 +40,27 @@ class MPDATA:
         qv_of_zZ_at_t0,
         g_factor_of_zZ,
         options,
+        advected_fields=None,
+        multi_field_solver=False,
+        skip_zero_fields=True,
     ):
         nr = 1  # nr==1 is like a bulk scheme
         self.nr = nr
         self.t = 0
         self.dt = dt
         self.fields = ("qvap", "qcond", "qice", "qrain", "qsnow", "qgrau")
+        self.advected_fields = (
+            self.fields if advected_fields is None else tuple(advected_fields)
+        )
+        assert set(self.advected_fields) <= set(self.fields), "unknown advected field"
+        self.multi_field_solver = multi_field_solver
+        self.skip_zero_fields = skip_zero_fields
 
         self.options = options
 
+        self.advectees = {}
         self._solvers = {}
+        self.bc_values = bc_values = {}
         for k in self.fields:
             grid = (nz, nr) if nr > 1 and k == "qcond" else (nz,)
 
@@ -61,31 +74,89 @@ class MPDATA:
                 for d in ((OUTER, INNER) if k == "qcond" and nr > 1 else (INNER,))
             )
 
-            stepper = Stepper(
-                options=self.options, n_dims=len(grid), non_unit_g_factor=True
-            )
-
-            data = g_factor_of_zZ(arakawa_c.z_scalar_coord(grid))
-            g_factor = ScalarField(
-                data=data, halo=self.options.n_halo, boundary_conditions=bcs_extrapol
-            )
-
-            data = (np.zeros(nz + 1),)
-            advector = VectorField(
-                data=data, halo=self.options.n_halo, boundary_conditions=bcs_zero
-            )
             if k == "qvap":
                 data = qv_of_zZ_at_t0(arakawa_c.z_scalar_coord(grid))
-                bcs = (Constant(value=data[0]),)
+                bc_values[k] = data[0]
             else:
                 data = np.zeros(grid)
-                bcs = (Constant(value=0),)
-            advectee = ScalarField(
+                bc_values[k] = 0
+            bcs = (Constant(value=bc_values[k]),)
+            self.advectees[k] = ScalarField(
                 data=data, halo=self.options.n_halo, boundary_conditions=bcs
             )
-            self._solvers[k] = Solver(
-                stepper=stepper, advectee=advectee, advector=advector, g_factor=g_factor
+
+            if not multi_field_solver and k in self.advected_fields:
+                stepper = Stepper(
+                    options=self.options, n_dims=len(grid), non_unit_g_factor=True
+                )
+                advector, g_factor = self._advector_and_g_factor(
+                    grid, bcs_extrapol, bcs_zero, g_factor_of_zZ
+                )
+                self._solvers[k] = Solver(
+                    stepper=stepper,
+                    advectee=self.advectees[k],
+                    advector=advector,
+                    g_factor=g_factor,
+                )
+
+        if multi_field_solver:
+            # Numba requires all the advectees of one solver to have the same type, i.e. the
+            # same boundary conditions, so there is one solver per group of such fields
+            assert (
+                nr == 1
+            ), "multi-field solver requires all fields to have the same grid"
+            grid = (nz,)
+            bcs_extrapol = bcs_zero = (Extrapolated(dim=INNER),)
+            stepper = Stepper(
+                options=self.options, n_dims=len(grid), non_unit_g_factor=True
             )
+            groups = {}
+            for k in self.advected_fields:
+                groups.setdefault(bc_values[k], []).append(k)
+            for group in groups.values():
+                advector, g_factor = self._advector_and_g_factor(
+                    grid, bcs_extrapol, bcs_zero, g_factor_of_zZ
+                )
+                solver = Solver(
+                    stepper=stepper,
+                    advectee=tuple(self.advectees[k] for k in group),
+                    advector=advector,
+                    g_factor=g_factor,
+                )
+                self._solvers.update({k: solver for k in group})
+
+    def _advector_and_g_factor(self, grid, bcs_extrapol, bcs_zero, g_factor_of_zZ):
+        data = g_factor_of_zZ(arakawa_c.z_scalar_coord(grid))
+        g_factor = ScalarField(
+            data=data, halo=self.options.n_halo, boundary_conditions=bcs_extrapol
+        )
+
+        data = (np.zeros(grid[0] + 1),)
+        advector = VectorField(
+            data=data, halo=self.options.n_halo, boundary_conditions=bcs_zero
+        )
+
+        return advector, g_factor
+
+    def advance(self, advector_0):
+        """set the advector of every advected field to advector_0 and advance them by one step
+
+        If skip_zero_fields is True, solvers whose fields are all identically zero with zero
+        boundary values are not advanced, since advecting them leaves them zero.
+        """
+        for solver in dict.fromkeys(self._solvers.values()):
+            if self.skip_zero_fields and self._is_zero(solver):
+                continue
+            solver.advector.get_component(0)[:] = advector_0
+            solver.advance(1)
+
+    def _is_zero(self, solver):
+        """True if all fields advected by solver are zero (and have zero boundary values)"""
+        return all(
+            self.bc_values[k] == 0 and not self.advectees[k].get().any()
+            for k, s in self._solvers.items()
+            if s is solver
+        )
 
     def __getitem__(self, k):
         return self._solvers[k]
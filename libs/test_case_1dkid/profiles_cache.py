@@ -0,0 +1,117 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: profiles_cache.py
+Project: test_case_1dkid
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+persistent on-disk cache of the (initial) profiles of the 1-D KiD rainshaft. Entries are .npz
+files named by a hash of the parameters which define the profiles. Old entries are evicted
+when they exceed a maximum age or when the cache exceeds a maximum size.
+NOTE: Caching is opt-in, e.g. export KID_PROFILES_CACHE_DIR=/path/to/cache/ to enable it.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+
+CACHE_DIR_ENV = "KID_PROFILES_CACHE_DIR"
+# increment CACHE_VERSION to invalidate entries after changes to how profiles are computed
+CACHE_VERSION = 1
+MAX_CACHE_BYTES = 64 * 1024**2  # maximum total size of cache [bytes]
+MAX_CACHE_AGE = 30 * 24 * 3600  # maximum age of an entry [s]
+
+
+def default_cache_dir():
+    """Return the cache directory given by the environment (or None if caching is disabled)."""
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    return Path(cache_dir) if cache_dir else None
+
+
+def cache_key(**params) -> str:
+    """Return the key for a cache entry given the (JSON serialisable) parameters that
+    define it."""
+    params = dict(params, cache_version=CACHE_VERSION)
+    encoded = json.dumps(params, sort_keys=True, default=float).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load(cache_dir, key):
+    """Load the arrays of the cache entry for key.
+
+    Args:
+        cache_dir (str or Path): Directory of the cache.
+        key (str): Key of the cache entry.
+
+    Returns:
+        dict: Mapping from names to arrays of the cache entry, or None if there is no such
+        (valid) entry.
+    """
+    filename = Path(cache_dir) / f"{key}.npz"
+    try:
+        if time.time() - filename.stat().st_mtime > MAX_CACHE_AGE:
+            return None
+        with np.load(filename) as entry:
+            return {name: entry[name] for name in entry.files}
+    except (OSError, ValueError):
+        return None
+
+
+def save(cache_dir, key, **arrays):
+    """Save the arrays as the cache entry for key and then evict old entries.
+
+    The entry is written to a temporary file and then renamed so that concurrent runs
+    never read a partially written entry.
+
+    Args:
+        cache_dir (str or Path): Directory of the cache (created if it does not exist).
+        key (str): Key of the cache entry.
+        **arrays (np.ndarray): Named arrays to cache.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmpfile = cache_dir / f"{key}.{os.getpid()}.tmp.npz"
+    np.savez(tmpfile, **arrays)
+    os.replace(tmpfile, cache_dir / f"{key}.npz")
+    evict(cache_dir)
+
+
+def evict(cache_dir, max_bytes=MAX_CACHE_BYTES, max_age=MAX_CACHE_AGE):
+    """Remove entries older than max_age and then the least recently written entries
+    until the total size of the cache is at most max_bytes.
+
+    Args:
+        cache_dir (str or Path): Directory of the cache.
+        max_bytes (int, optional): Maximum total size of the cache [bytes].
+        max_age (float, optional): Maximum age of an entry [s].
+    """
+    entries = []
+    for filename in Path(cache_dir).glob("*.npz"):
+        if filename.name.endswith(".tmp.npz"):
+            continue
+        try:
+            stat = filename.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, filename))
+
+    now = time.time()
+    total_bytes = sum(size for _, size, _ in entries)
+    for mtime, size, filename in sorted(entries):  # oldest first
+        if now - mtime > max_age or total_bytes > max_bytes:
+            filename.unlink(missing_ok=True)
+            total_bytes -= size
@@ -8,7 +8,7 @@ Created Date: Monday 2nd September 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Wednesday 4th June 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -19,11 +19,40 @@ run 1-D KiD rainshaft model by timestepping and outputting data
 """
 
 from .kid_dynamics import KiDDynamics
-from libs.thermo.output_thermodynamics import OutputThermodynamics
+from libs.thermo.output_thermodynamics import (
+    OutputThermodynamics,
+    StreamingOutputThermodynamics,
+    steps_per_output,
+)
+from libs.utility_functions.checkpoint import (
+    check_run_checkpointable,
+    read_run_checkpoint,
+    write_run_checkpoint,
+)
+from libs.utility_functions.phase_timers import NullTimers, scheme_phase_name
 
 
 def run_1dkid(
-    z_delta, z_max, time_end, timestep, thermo, microphys_scheme, advect_hydrometeors
+    z_delta,
+    z_max,
+    time_end,
+    timestep,
+    thermo,
+    microphys_scheme,
+    advect_hydrometeors,
+    outfile=None,
+    output_timestep=None,
+    output_variables=None,
+    ncolumns=1,
+    wmax_factors=None,
+    multi_field_solver=False,
+    zero_copy=False,
+    wmax=3,
+    tscale=600,
+    timers=None,
+    checkpoint_file=None,
+    checkpoint_timestep=None,
+    restart_file=None,
 ):
     """Run 1-D KiD rainshaft model with a specified microphysics scheme and KiD dynamics.
 
@@ -44,38 +73,145 @@ def run_1dkid(
           Initial thermodynamic conditions.
         microphys_scheme:
           Microphysics scheme to use.
+        advect_hydrometeors (bool):
+          If True, hydrometeors (not only water vapour) are advected by the KiD dynamics.
+        outfile (str or Path, optional):
+          If not None, output is streamed to a Zarr store at this path rather than
+          kept in memory. Defaults to None.
+        output_timestep (float, optional):
+          Time between outputs (s), must be a multiple of timestep. Defaults to None,
+          meaning output every timestep.
+        output_variables (list of str, optional):
+          Names of the thermodynamic variables to output. Defaults to None, meaning all.
+        ncolumns (int, optional):
+          Number of independent columns to simulate at once. If greater than 1, thermo
+          must have arrays of shape (ncolumns, nz) and the output has shape
+          (time, ncolumns, nz). Defaults to 1.
+        wmax_factors (array-like, optional):
+          Factor for the maximum updraft velocity of each column. Defaults to None,
+          meaning 1.0 for every column.
+        multi_field_solver (bool, optional):
+          If True, advected fields with the same boundary conditions share one MPDATA Solver
+          (with a common stepper and advector), see KiDDynamics. Defaults to False.
+        zero_copy (bool, optional):
+          If True, the mass mixing ratios of thermo become views onto the KiD dynamics'
+          advectees (see KiDDynamics.couple_thermo) so that no copies are made between the
+          dynamics and microphysics of a single column when the microphysics updates thermo
+          in-place. Not for schemes which keep the addresses of the mass mixing ratios
+          of thermo from before the run. Defaults to False.
+        wmax (float, optional):
+          Maximum vertical velocity of the KiD updraft, 'w1' of Shipway and Hill (2012) (m/s).
+          Defaults to 3.
+        tscale (float, optional):
+          Timescale of the KiD updraft, 't1' of Shipway and Hill (2012) (s). Defaults to 600.
+        timers (PhaseTimers, optional):
+          If not None, the wall time spent in each phase of the run (initialize, dynamics,
+          microphysics:<scheme>, set_advectees, output, checkpoint, restart and finalize)
+          is accumulated in timers. Defaults to None.
+        checkpoint_file (str or Path, optional):
+          If not None, the full state of the run is written to a checkpoint (.npz) file at
+          this path every checkpoint_timestep (overwriting the previous checkpoint), see
+          libs.utility_functions.checkpoint. Requires in-memory output (outfile=None) and a
+          microphysics scheme with get_state() and set_state() methods, which is checked
+          before the run starts. Defaults to None.
+        checkpoint_timestep (float, optional):
+          Time between checkpoints (s), must be a multiple of timestep. Required if
+          checkpoint_file is not None. Defaults to None.
+        restart_file (str or Path, optional):
+          If not None, the run resumes from the state in this checkpoint file, which must
+          have been written by a run with the same arguments (other than the checkpoint
+          and restart arguments), with the same requirements as checkpoint_file. The
+          arrays of thermo are overwritten by the checkpoint's thermodynamics. Defaults
+          to None.
 
     Returns:
-          OutputThermodynamics: Output containing thermodynamic data from the model run.
+          OutputThermodynamics (or StreamingOutputThermodynamics if outfile is not None):
+            Output containing thermodynamic data from the model run.
     """
 
-    ### type of dynamics rainshaft will undergo
-    kid_dynamics = KiDDynamics(
-        z_delta, z_max, timestep, time_end, advect_hydrometeors=advect_hydrometeors
-    )
+    if timers is None:
+        timers = NullTimers()
+    microphysics = scheme_phase_name(microphys_scheme)
 
-    ### run dynamics + microphysics from time to time_end
-    microphys_scheme.initialize()
+    with timers.phase("initialize"):
+        ### type of dynamics rainshaft will undergo
+        kid_dynamics = KiDDynamics(
+            z_delta,
+            z_max,
+            timestep,
+            time_end,
+            advect_hydrometeors=advect_hydrometeors,
+            ncolumns=ncolumns,
+            wmax_factors=wmax_factors,
+            multi_field_solver=multi_field_solver,
+            wmax=wmax,
+            tscale=tscale,
+        )
 
-    ### data to output during model run
-    ntime = int(time_end / timestep) + 1
-    nz = len(kid_dynamics.zhalf) - 1
-    shape = (ntime, nz)
-    out = OutputThermodynamics(shape, zhalf=kid_dynamics.zhalf)
+        ### run dynamics + microphysics from time to time_end
+        microphys_scheme.initialize()
 
-    time = 0.0
-    thermo = kid_dynamics.set_thermo(time, thermo)
-    out.output_thermodynamics(time, thermo)
+        ### data to output during model run
+        ntime = int(time_end / timestep) + 1
+        nz = len(kid_dynamics.zhalf) - 1
+        shape = (ntime, nz) if ncolumns == 1 else (ntime, ncolumns, nz)
+        output_options = {
+            "zhalf": kid_dynamics.zhalf,
+            "variables": output_variables,
+            "output_interval": steps_per_output(timestep, output_timestep),
+        }
+        if outfile is None:
+            out = OutputThermodynamics(shape, **output_options)
+        else:
+            out = StreamingOutputThermodynamics(shape, outfile, **output_options)
+
+        time = 0.0
+        if zero_copy:
+            thermo = kid_dynamics.couple_thermo(thermo)
+        thermo = kid_dynamics.set_thermo(time, thermo)
+
+        if checkpoint_file is not None:
+            assert checkpoint_timestep is not None, "checkpointing requires a timestep"
+            checkpoint_interval = steps_per_output(timestep, checkpoint_timestep)
+        if checkpoint_file is not None or restart_file is not None:
+            check_run_checkpointable(out, microphys_scheme, dynamics=kid_dynamics)
+
+    step = 0
+    if restart_file is None:
+        with timers.phase("output"):
+            out.output_thermodynamics(time, thermo)
+    else:
+        with timers.phase("restart"):
+            step, time = read_run_checkpoint(
+                restart_file, thermo, out, microphys_scheme, dynamics=kid_dynamics
+            )
     while time < time_end:
-        thermo = kid_dynamics.run(time, timestep, thermo)
-        thermo = microphys_scheme.run(timestep, thermo)
-        kid_dynamics.set_advectees(thermo)
+        with timers.phase("dynamics"):
+            thermo = kid_dynamics.run(time, timestep, thermo)
+        with timers.phase(microphysics):
+            thermo = microphys_scheme.run(timestep, thermo)
+        with timers.phase("set_advectees"):
+            kid_dynamics.set_advectees(thermo)
 
         time += timestep
+        step += 1
 
-        out.output_thermodynamics(time, thermo)
+        with timers.phase("output"):
+            out.output_thermodynamics(time, thermo)
+        if checkpoint_file is not None and step % checkpoint_interval == 0:
+            with timers.phase("checkpoint"):
+                write_run_checkpoint(
+                    checkpoint_file,
+                    step,
+                    time,
+                    thermo,
+                    out,
+                    microphys_scheme,
+                    dynamics=kid_dynamics,
+                )
 
-    microphys_scheme.finalize()
+    with timers.phase("finalize"):
+        microphys_scheme.finalize()
+        out.finalize()
 
-    out.finalize()
     return out
@@ -8,7 +8,7 @@ Created Date: Wednesday 2nd July 2025
 Author: PyMPATA Authors (PyMPDATA)
 Additional Contributors: Clara Bayley (CB)
 -----
-Last Modified: Wednesday 2nd July 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -17,7 +17,7 @@ https://opensource.org/licenses/BSD-3-Clause
 File Description:
 File is adaptation from PyMPDATA Shipway and Hill 2012 example, copied from:
 https://github.com/open-atmos/PyMPDATA/blob/main/examples/PyMPDATA_examples/Shipway_and_Hill_2012/settings.py
-between v1.6.1 and v1.6.2
+between v1.6.1 and v1.6.2, with optional on-disk caching of the dry-density profile
 """
 
 from typing import Optional
@@ -30,8 +30,12 @@ from scipy.interpolate import interp1d
 
 from PyMPDATA_examples.Shipway_and_Hill_2012 import formulae
 from .arakawa_c import arakawa_c
+from . import profiles_cache
 from PyMPDATA_examples.Shipway_and_Hill_2012.formulae import const, si
 
+QV_PROFILE = ((0, 740, 3260), (0.015, 0.0138, 0.0024))  # (z [m], qv [kg/kg]) nodes
+TH_PROFILE = ((0, 740, 3260), (297.9, 297.9, 312.66))  # (z [m], theta [K]) nodes
+
 
 @strict
 class Settings:
@@ -45,6 +49,7 @@ class Settings:
         p0: Optional[float] = None,
         z_max: float = 3000 * si.metres,
         apprx_drhod_dz: bool = True,
+        cache_dir: Optional[str] = None,
     ):
         self.dt = dt
         self.dz = dz
@@ -52,8 +57,8 @@ class Settings:
         self.z_max = z_max
         self.t_max = t_max
 
-        self.qv = interp1d((0, 740, 3260), (0.015, 0.0138, 0.0024))
-        self._th = interp1d((0, 740, 3260), (297.9, 297.9, 312.66))
+        self.qv = interp1d(*QV_PROFILE)
+        self._th = interp1d(*TH_PROFILE)
 
         # note: not in the paper,
         # https://github.com/BShipway/KiD/tree/master/src/physconst.f90#L43
@@ -72,16 +77,33 @@ class Settings:
                 drhod_dz = drhod_dz / (1 + qv) - rhod * dqv_dz / (1 + qv)
             return drhod_dz
 
+        # dry-density profile is read from cache (if enabled and available)
         z_points = np.arange(0, self.z_max + self.dz / 2, self.dz / 2)
-        rhod_solution = solve_ivp(
-            fun=drhod_dz,
-            t_span=(0, self.z_max),
-            y0=np.asarray((self.rhod0,)),
-            t_eval=z_points,
+        cache_dir = cache_dir or profiles_cache.default_cache_dir()
+        key = profiles_cache.cache_key(
+            dz=self.dz,
+            z_max=self.z_max,
+            p0=p0,
+            apprx_drhod_dz=apprx_drhod_dz,
+            qv_profile=QV_PROFILE,
+            th_profile=TH_PROFILE,
         )
-        assert rhod_solution.success
-
-        self.rhod = interp1d(z_points, rhod_solution.y[0])
+        cached = profiles_cache.load(cache_dir, key) if cache_dir else None
+        if cached is not None and np.array_equal(cached["z_points"], z_points):
+            rhod_points = cached["rhod"]
+        else:
+            rhod_solution = solve_ivp(
+                fun=drhod_dz,
+                t_span=(0, self.z_max),
+                y0=np.asarray((self.rhod0,)),
+                t_eval=z_points,
+            )
+            assert rhod_solution.success
+            rhod_points = rhod_solution.y[0]
+            if cache_dir:
+                profiles_cache.save(cache_dir, key, z_points=z_points, rhod=rhod_points)
+
+        self.rhod = interp1d(z_points, rhod_points)
 
         rhod_w_const = wmax_const * si.m / si.s * si.kg / si.m**3
         self.t_1 = tscale_const * si.s
@@ -8,7 +8,7 @@ Created Date: Friday 1st March 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Monday 2nd September 2024
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -21,8 +21,24 @@ functions for calculations of some quantities e.g. potential temperature(s)
 import numpy as np
 from typing import Optional
 
-
-def dry_potential_temperature(temp: np.ndarray, press: np.ndarray):
+# constants (in SI units) equal to those used by metpy so that formulae match metpy's
+RGAS_DRY = 287.04749097718457  # specific gas constant for dry air [J/kg/K]
+RGAS_VAP = 461.52311572606084  # specific gas constant for water vapour [J/kg/K]
+CP_DRY = 1004.6662184201462  # specific heat capacity of dry air [J/kg/K]
+CP_VAP = 1860.078011865639  # specific heat capacity of water vapour [J/kg/K]
+CP_LIQ = 4219.4  # specific heat capacity of liquid water [J/kg/K]
+LATENT_VAP = 2500840.0  # latent heat of vaporisation at the triple point [J/kg]
+EPSILON = 0.6219569100577033  # ratio of gas constants, dry air / water vapour
+GRAVITY = 9.80665  # acceleration due to gravity [m/s^2]
+P_REF = 100000.0  # reference pressure for potential temperature [Pa]
+T_TRIPLE = 273.16  # triple point temperature of water [K]
+T_ZERO_DEGC = 273.15  # zero degrees Celsius [K]
+PSAT_ZERO_DEGC = 611.2  # saturation vapour pressure at the triple point [Pa]
+
+
+def dry_potential_temperature(
+    temp: np.ndarray, press: np.ndarray, backend: str = "numpy"
+):
     r"""Calculate the potential temperature for dry air.
 
     This function calculates the potential temperature for dry air given the temperature and pressure.
@@ -31,31 +47,151 @@ def dry_potential_temperature(temp: np.ndarray, press: np.ndarray):
           \theta_{\rm{dry}} = T \left( \frac{P_{\rm ref}}{P} \right)
               ^{ \frac{R_{\rm{dry}}}{c_{\rm{p, dry}}} }
 
-    where :math:`P_{\rm ref}` is the first pressure in press array.
+    where :math:`P_{\rm ref}` = 1000 hPa.
 
     Args:
       temp (array-like):
           Temperature values (K).
       press (array-like):
           Pressure values (Pa).
+      backend (str, optional):
+          "numpy" for unit-free NumPy calculation or "metpy" for (slower) reference
+          calculation using metpy. Defaults to "numpy".
 
     Returns:
         array-like: The dry potential temperature (K).
     """
-    from metpy.units import units
-    from metpy import calc
+    if backend == "metpy":
+        from metpy.units import units
+        from metpy import calc
 
-    theta_dry = calc.potential_temperature(press * units.Pa, temp * units.kelvin)
+        theta_dry = calc.potential_temperature(press * units.Pa, temp * units.kelvin)
 
-    return theta_dry.magnitude  # Kelvin
+        return theta_dry.magnitude  # Kelvin
 
+    assert backend == "numpy", "backend must be either 'numpy' or 'metpy'"
+    temp, press = np.asarray(temp), np.asarray(press)
 
-def moist_equiv_potential_temperature(
-    temp: np.ndarray, press: np.ndarray, qvap: np.ndarray
+    return temp * (P_REF / press) ** (RGAS_DRY / CP_DRY)  # Kelvin
+
+
+def saturation_vapour_pressure(temp: np.ndarray):
+    r"""Calculate the saturation vapour pressure over liquid water.
+
+    Uses equation 13 of Ambaum (2020) (as in metpy) with latent heat of vaporisation,
+    :math:`L = L_{0} - (c_{\rm p, liq} - c_{\rm p, vap}) (T - T_{0})`:
+
+    .. math::
+          e_s = e_{s0} \left(\frac{T_0}{T}\right)^{(c_{\rm p, liq} - c_{\rm p, vap}) / R_{\rm vap}}
+                \exp \left( \frac{L_0}{R_{\rm vap} T_0} - \frac{L}{R_{\rm vap} T} \right)
+
+    Args:
+        temp (array-like):
+            Temperature values (K).
+
+    Returns:
+        array-like: The saturation vapour pressure (Pa).
+    """
+    temp = np.asarray(temp)
+    latent_heat = LATENT_VAP - (CP_LIQ - CP_VAP) * (temp - T_TRIPLE)
+    heat_power = (CP_LIQ - CP_VAP) / RGAS_VAP
+    exp_term = (LATENT_VAP / T_TRIPLE - latent_heat / temp) / RGAS_VAP
+
+    return PSAT_ZERO_DEGC * (T_TRIPLE / temp) ** heat_power * np.exp(exp_term)
+
+
+def saturation_mixing_ratio(temp: np.ndarray, press: np.ndarray):
+    r"""Calculate the saturation mixing ratio of water vapour over liquid water.
+
+    .. math:: r_s = \epsilon \frac{e_s}{P - e_s}
+
+    Args:
+        temp (array-like):
+            Temperature values (K).
+        press (array-like):
+            Pressure values (Pa).
+
+    Returns:
+        array-like: The saturation mixing ratio (kg/kg), NaN where :math:`e_s \geq P`.
+    """
+    psat = saturation_vapour_pressure(temp)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = EPSILON * psat / (press - psat)
+
+    return np.where(psat >= press, np.nan, ratio)
+
+
+def relative_humidity(
+    temp: np.ndarray, press: np.ndarray, qvap: np.ndarray, backend: str = "numpy"
 ):
+    r"""Calculate the relative humidity (over liquid water) from the mixing ratio.
+
+    .. math:: RH = \frac{q_{\rm v}}{\epsilon + q_{\rm v}} \frac{\epsilon + r_s}{r_s}
+
+    where :math:`r_s` is the saturation mixing ratio.
+
+    Args:
+        temp (array-like):
+            Temperature values (K).
+        press (array-like):
+            Pressure values (Pa).
+        qvap (array-like):
+            Mixing ratio of water vapour (kg/kg)
+        backend (str, optional):
+          "numpy" for unit-free NumPy calculation or "metpy" for (slower) reference
+          calculation using metpy. Defaults to "numpy".
+
+    Returns:
+        array-like: The relative humidity as a ratio (i.e. 1.0 = 100%).
+    """
+    if backend == "metpy":
+        from metpy.units import units
+        from metpy import calc
+
+        relh = calc.relative_humidity_from_mixing_ratio(
+            press * units.Pa, temp * units.kelvin, qvap
+        )
+
+        return relh.magnitude
+
+    assert backend == "numpy", "backend must be either 'numpy' or 'metpy'"
+    qvap = np.asarray(qvap)
+    qsat = saturation_mixing_ratio(temp, press)
+
+    return qvap / (EPSILON + qvap) * (EPSILON + qsat) / qsat
+
+
+def dewpoint_temperature(temp: np.ndarray, relh: np.ndarray):
+    r"""Calculate the dewpoint temperature from the relative humidity.
+
+    Inverts Bolton (1980) formula for saturation vapour pressure (as in metpy), i.e.
+
+    .. math:: T_{D} = \frac{243.5 \log(e / e_{s0})}{17.67 - \log(e / e_{s0})} + 273.15
+
+    where :math:`e = RH \cdot e_s(T)` is the vapour pressure.
+
+    Args:
+        temp (array-like):
+            Temperature values (K).
+        relh (array-like):
+            Relative humidity as a ratio (i.e. 1.0 = 100%).
+
+    Returns:
+        array-like: The dewpoint temperature (K).
     """
+    val = np.log(relh * saturation_vapour_pressure(temp) / PSAT_ZERO_DEGC)
+
+    return T_ZERO_DEGC + 243.5 * val / (17.67 - val)
+
+
+def moist_equiv_potential_temperature(
+    temp: np.ndarray, press: np.ndarray, qvap: np.ndarray, backend: str = "numpy"
+):
+    r"""
     Calculate the moist potential temperature.
 
+    Uses the formula from Bolton (1980) (as in metpy), approximately
+
     .. math::
           \theta_e = \theta \cdot \exp\left(\frac{L_v \cdot q}{c_p \cdot T}\right)
 
@@ -66,55 +202,90 @@ def moist_equiv_potential_temperature(
             Pressure values (Pa).
         qvap (array-like):
             Mixing ratio of water vapour (kg/kg)
+        backend (str, optional):
+          "numpy" for unit-free NumPy calculation or "metpy" for (slower) reference
+          calculation using metpy. Defaults to "numpy".
+
     Returns:
         array-like: The moist potential temperature (K).
     """
-    from metpy.units import units
-    from metpy import calc
+    if backend == "metpy":
+        from metpy.units import units
+        from metpy import calc
 
-    relh = calc.relative_humidity_from_mixing_ratio(
-        press * units.Pa, temp * units.kelvin, qvap
-    )
-    dewpoint = calc.dewpoint_from_relative_humidity(temp * units.kelvin, relh)
+        relh = calc.relative_humidity_from_mixing_ratio(
+            press * units.Pa, temp * units.kelvin, qvap
+        )
+        dewpoint = calc.dewpoint_from_relative_humidity(temp * units.kelvin, relh)
 
-    theta_equiv = calc.equivalent_potential_temperature(
-        press * units.Pa, temp * units.kelvin, dewpoint
-    )
+        theta_equiv = calc.equivalent_potential_temperature(
+            press * units.Pa, temp * units.kelvin, dewpoint
+        )
 
-    return theta_equiv.magnitude  # Kelvin
+        return theta_equiv.magnitude  # Kelvin
+
+    assert backend == "numpy", "backend must be either 'numpy' or 'metpy'"
+    temp, press = np.asarray(temp), np.asarray(press)
+
+    relh = relative_humidity(temp, press, qvap)
+    dewpoint = dewpoint_temperature(temp, relh)
+
+    r = saturation_mixing_ratio(dewpoint, press)
+    e = saturation_vapour_pressure(dewpoint)
+    t_l = 56 + 1.0 / (1.0 / (dewpoint - 56) + np.log(temp / dewpoint) / 800.0)
+    th_l = dry_potential_temperature(temp, press - e) * (temp / t_l) ** (0.28 * r)
+
+    return th_l * np.exp(r * (1 + 0.448 * r) * (3036.0 / t_l - 1.78))  # Kelvin
 
 
 def moist_static_energy(
-    temp: np.ndarray, qvap: np.ndarray, height: Optional[np.ndarray] = None
+    temp: np.ndarray,
+    qvap: np.ndarray,
+    height: Optional[np.ndarray] = None,
+    backend: str = "numpy",
 ):
-    """
+    r"""
     Calculate the moist static energy [kilojoule / kilogram]
 
     .. math::
-          \theta_e = \theta \cdot \exp\left(\frac{L_v \cdot q}{c_p \cdot T}\right)
+          MSE = g z + c_{\rm p, dry} T + L_v q
+
+    where :math:`q = q_{\rm v} / (1 + q_{\rm v})` is the specific humidity.
 
     Args:
         temp (array-like):
             Temperature values (K).
-        press (array-like):
-            Pressure values (Pa).
         qvap (array-like):
             Mixing ratio of water vapour (kg/kg)
+        height (array-like, optional):
+            Height values (m). Defaults to zero.
+        backend (str, optional):
+          "numpy" for unit-free NumPy calculation or "metpy" for (slower) reference
+          calculation using metpy. Defaults to "numpy".
+
     Returns:
-        array-like: The moist potential temperature (K).
+        array-like: The moist static energy (kJ/kg).
     """
-    from metpy.units import units
-    from metpy import calc
-
     if height is None:
-        height = np.zeros(temp.shape)
+        height = np.zeros(np.shape(temp))
+
+    if backend == "metpy":
+        from metpy.units import units
+        from metpy import calc
+
+        specific_humidity = calc.specific_humidity_from_mixing_ratio(qvap)
+        mse = calc.moist_static_energy(
+            height * units.meters, temp * units.kelvin, specific_humidity
+        )
+
+        return mse.magnitude  # [kilojoule / kilogram]
 
-    specific_humidity = calc.specific_humidity_from_mixing_ratio(qvap)
-    mse = calc.moist_static_energy(
-        height * units.meters, temp * units.kelvin, specific_humidity
-    )
+    assert backend == "numpy", "backend must be either 'numpy' or 'metpy'"
+    temp, qvap, height = np.asarray(temp), np.asarray(qvap), np.asarray(height)
+    specific_humidity = qvap / (1 + qvap)
+    mse = GRAVITY * height + CP_DRY * temp + LATENT_VAP * specific_humidity
 
-    return mse.magnitude  # [kilojoule / kilogram]
+    return mse / 1000  # [kilojoule / kilogram]
 
 
 def supersaturation(temp: np.ndarray, press: np.ndarray, qvap: np.ndarray):
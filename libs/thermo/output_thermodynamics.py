@@ -8,20 +8,71 @@ Created Date: Thursday 29th February 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Monday 2nd September 2024
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
 https://opensource.org/licenses/BSD-3-Clause
 -----
 File Description:
-class for storing thermodynamics output during model run
+classes for storing thermodynamics output during model run, either in memory or by
+streaming it to a (Zarr) file on disk
 """
 
 import numpy as np
 
 from .thermodynamics import Thermodynamics
 
+# names and units of the thermodynamic variables output at each output time
+THERMODYNAMICS_VARIABLES = {
+    "temp": "K",
+    "rho": "kg m-3",
+    "press": "Pa",
+    "qvap": "kg/kg",
+    "qcond": "kg/kg",
+    "qice": "kg/kg",
+    "qrain": "kg/kg",
+    "qsnow": "kg/kg",
+    "qgrau": "kg/kg",
+}
+
+# names of coordinates of half-levels (grid cell boundaries) of output
+HALF_COORDINATES = ("zhalf", "xhalf", "yhalf")
+
+
+def get_thermodynamics_variable(thermo: Thermodynamics, name: str):
+    """returns reference to array of variable called 'name' in thermo"""
+    if name in thermo.massmix_ratios:
+        return thermo.massmix_ratios[name]
+    return getattr(thermo, name)
+
+
+def steps_per_output(timestep: float, output_timestep=None):
+    """returns number of timesteps between outputs for a given time between outputs
+
+    Args:
+        timestep (float): Model timestep (s).
+        output_timestep (float, optional): Time between outputs (s), must be a multiple of
+          timestep. Defaults to None, in which case output is every timestep.
+
+    Returns:
+        int: Number of timesteps between outputs.
+    """
+    if output_timestep is None:
+        return 1
+    nsteps = int(round(output_timestep / timestep))
+    assert nsteps >= 1 and np.isclose(
+        nsteps * timestep, output_timestep
+    ), "output timestep must be a multiple of the model timestep"
+    return nsteps
+
+
+def cell_dims(ndims: int):
+    """returns names of the dimensions of (non-time) dimensions of output variables"""
+    if ndims == 1:
+        return ("cell",)
+    return tuple(f"cell{i}" for i in range(ndims))
+
 
 class OutputVariable:
     """Class to output a variable with some of its metadata.
@@ -107,28 +158,53 @@ class OutputThermodynamics:
           Specific snow content kg/kg).
         qgrau (OutputVariable):
           Specific graupel content (kg/kg).
+        variables (tuple):
+          Names of the thermodynamic variables which are output (variables not output are None).
+        output_interval (int):
+          Thermodynamics are output every output_interval calls to output_thermodynamics.
     """
 
-    def __init__(self, shape, zhalf=None, xhalf=None, yhalf=None):
+    def __init__(
+        self,
+        shape,
+        zhalf=None,
+        xhalf=None,
+        yhalf=None,
+        variables=None,
+        output_interval=1,
+    ):
         """Initialize an OutputThermodynamics object.
 
         Args:
-            shape (tuple): Shape of the output variables, time is first dimension.
+            shape (tuple): Shape of the output variables, time is first dimension. First
+              dimension is the number of calls to output_thermodynamics, of which only every
+              output_interval'th call (starting from the first) is output.
             zhalf (np.ndarray, optional): Half-level z-coordinates (m). Defaults to None.
             xhalf (np.ndarray, optional): Half-level x-coordinates (m). Defaults to None.
             yhalf (np.ndarray, optional): Half-level y-coordinates (m). Defaults to None.
+            variables (list of str, optional): Names of the thermodynamic variables to output
+              (at least one). Defaults to None, meaning all variables are output.
+            output_interval (int, optional): Output every output_interval calls to
+              output_thermodynamics. Defaults to 1.
         """
-
+        if variables is None:
+            variables = THERMODYNAMICS_VARIABLES.keys()
+        for name in variables:
+            assert name in THERMODYNAMICS_VARIABLES, f"unknown output variable {name}"
+        assert output_interval >= 1, "output interval must be at least 1"
+        self.variables = tuple(variables)
+        assert self.variables, "at least one variable must be output"
+        self.output_interval = int(output_interval)
+        self._ncalls = 0
+
+        nout = (shape[0] - 1) // self.output_interval + 1
+        shape = [nout, *shape[1:]]
         self.time = OutputVariable("time", "s", [shape[0]])
-        self.temp = OutputVariable("temp", "K", shape)
-        self.rho = OutputVariable("rho", "kg m-3", shape)
-        self.press = OutputVariable("press", "Pa", shape)
-        self.qvap = OutputVariable("qvap", "kg/kg", shape)
-        self.qcond = OutputVariable("qcond", "kg/kg", shape)
-        self.qice = OutputVariable("qice", "kg/kg", shape)
-        self.qrain = OutputVariable("qrain", "kg/kg", shape)
-        self.qsnow = OutputVariable("qsnow", "kg/kg", shape)
-        self.qgrau = OutputVariable("qgrau", "kg/kg", shape)
+        for name, units in THERMODYNAMICS_VARIABLES.items():
+            if name in self.variables:
+                setattr(self, name, OutputVariable(name, units, shape))
+            else:
+                setattr(self, name, None)
 
         if zhalf is not None:
             self.zhalf = OutputVariable("zhalf", "m", [len(zhalf)])
@@ -152,7 +228,8 @@ class OutputThermodynamics:
         """output thermodynamics from thermo to each variable in thermodynamics output.
 
         This method writes time and thermodynamic variables from thermo such as temperature, density,
-        pressure, and specific mass mixing ratios to the respective output variables.
+        pressure, and specific mass mixing ratios to the respective output variables. Calls
+        in-between every output_interval'th call (starting from the first) do nothing.
 
         Parameters:
             time (float):
@@ -163,16 +240,14 @@ class OutputThermodynamics:
         Returns:
             None
         """
+        is_output = self._ncalls % self.output_interval == 0
+        self._ncalls += 1
+        if not is_output:
+            return
+
         self.time.write(time)
-        self.temp.write(thermo.temp)
-        self.rho.write(thermo.rho)
-        self.press.write(thermo.press)
-        self.qvap.write(thermo.massmix_ratios["qvap"])
-        self.qcond.write(thermo.massmix_ratios["qcond"])
-        self.qice.write(thermo.massmix_ratios["qice"])
-        self.qrain.write(thermo.massmix_ratios["qrain"])
-        self.qsnow.write(thermo.massmix_ratios["qsnow"])
-        self.qgrau.write(thermo.massmix_ratios["qgrau"])
+        for name in self.variables:
+            self[name].write(get_thermodynamics_variable(thermo, name))
 
     def __call__(self, time: float, thermo: Thermodynamics):
         """Invoke the object as a function to call the `output_thermodynamics` method.
@@ -211,15 +286,8 @@ class OutputThermodynamics:
             None
         """
         self.time.finalize()
-        self.temp.finalize()
-        self.rho.finalize()
-        self.press.finalize()
-        self.qvap.finalize()
-        self.qcond.finalize()
-        self.qice.finalize()
-        self.qrain.finalize()
-        self.qsnow.finalize()
-        self.qgrau.finalize()
+        for name in self.variables:
+            self[name].finalize()
 
         if self.zhalf is not None:
             self.zhalf.finalize()
@@ -227,3 +295,241 @@ class OutputThermodynamics:
             self.xhalf.finalize()
         if self.yhalf is not None:
             self.yhalf.finalize()
+
+    def to_dataset(self):
+        """Convert the thermodynamics output into an xarray Dataset.
+
+        Variables have dimensions ("time", "cell") ("cell" is replaced by "cell0", "cell1", etc.
+        if the output has more than one non-time dimension) and zhalf, xhalf and yhalf are
+        coordinates along dimensions of the same name.
+
+        Returns:
+            xarray.Dataset: Dataset of the thermodynamics output.
+        """
+        import xarray as xr
+
+        dims = ("time",) + cell_dims(self[self.variables[0]].values.ndim - 1)
+        data_vars = {
+            name: (dims, self[name].values, {"units": self[name].units})
+            for name in self.variables
+        }
+        coords = {"time": ("time", self.time.values, {"units": self.time.units})}
+        for name in HALF_COORDINATES:
+            if self[name] is not None:
+                coords[name] = (name, self[name].values, {"units": self[name].units})
+
+        return xr.Dataset(data_vars=data_vars, coords=coords)
+
+    @classmethod
+    def from_dataset(cls, ds):
+        """Create an OutputThermodynamics object from an xarray Dataset.
+
+        The Dataset should be like one made by to_dataset() (e.g. read from a file written
+        by StreamingOutputThermodynamics).
+
+        Args:
+            ds (xarray.Dataset): Dataset of thermodynamics output.
+
+        Returns:
+            OutputThermodynamics: Thermodynamics output containing values from the dataset.
+        """
+        half_coords = {
+            name: ds[name].values if name in ds.coords else None
+            for name in HALF_COORDINATES
+        }
+        variables = [name for name in THERMODYNAMICS_VARIABLES if name in ds]
+        shape = ds[variables[0]].shape
+        out = cls(shape, **half_coords, variables=variables)
+        out.time.set(ds["time"].values)
+        for name in variables:
+            out[name].set(ds[name].values)
+
+        return out
+
+
+class StreamingOutputThermodynamics:
+    """Class is method for streaming thermodynamic variables output during model timestep to
+    a (chunked and compressed) Zarr store on disk.
+
+    Output is buffered in memory in chunks of "chunksize" output times, each chunk being appended
+    to the Zarr store once it is full so that the memory used is independent of the total number
+    of output times. Once finalized, variables can be accessed like those of OutputThermodynamics
+    (e.g. out.temp.values), in which case they are read from the Zarr store.
+
+    Attributes:
+        filename (Path):
+          Path to the Zarr store.
+        shape (tuple):
+          Shape of the output variables (once written), time is first dimension.
+        chunksize (int):
+          Number of output times in each chunk of the Zarr store.
+        variables (tuple):
+          Names of the thermodynamic variables which are output.
+        output_interval (int):
+          Thermodynamics are output every output_interval calls to output_thermodynamics.
+    """
+
+    def __init__(
+        self,
+        shape,
+        filename,
+        zhalf=None,
+        xhalf=None,
+        yhalf=None,
+        chunksize=100,
+        variables=None,
+        output_interval=1,
+    ):
+        """Initialize a StreamingOutputThermodynamics object.
+
+        Args:
+            shape (tuple): Shape of the output variables, time is first dimension. First
+              dimension is the number of calls to output_thermodynamics, of which only every
+              output_interval'th call (starting from the first) is output.
+            filename (str or Path): Path to the Zarr store to write (overwritten if exists).
+            zhalf (np.ndarray, optional): Half-level z-coordinates (m). Defaults to None.
+            xhalf (np.ndarray, optional): Half-level x-coordinates (m). Defaults to None.
+            yhalf (np.ndarray, optional): Half-level y-coordinates (m). Defaults to None.
+            chunksize (int, optional): Number of output times in each chunk. Defaults to 100.
+            variables (list of str, optional): Names of the thermodynamic variables to output
+              (at least one). Defaults to None, meaning all variables are output.
+            output_interval (int, optional): Output every output_interval calls to
+              output_thermodynamics. Defaults to 1.
+        """
+        from pathlib import Path
+
+        assert output_interval >= 1, "output interval must be at least 1"
+        self.filename = Path(filename)
+        self.output_interval = int(output_interval)
+        nout = (shape[0] - 1) // self.output_interval + 1
+        self.shape = (nout, *shape[1:])
+        self.chunksize = min(chunksize, self.shape[0])
+        self._buffer = OutputThermodynamics(
+            [self.chunksize, *self.shape[1:]],
+            zhalf=zhalf,
+            xhalf=xhalf,
+            yhalf=yhalf,
+            variables=variables,
+        )
+        self.variables = self._buffer.variables
+        self._ncalls = 0
+        self._nwritten = 0
+        self._is_finalized = False
+
+    def output_thermodynamics(self, time: float, thermo: Thermodynamics):
+        """output thermodynamics from thermo to each variable in thermodynamics output.
+
+        Values are written into the buffer, which is appended to the Zarr store if it is full.
+        Calls in-between every output_interval'th call (starting from the first) do nothing.
+
+        Parameters:
+            time (float):
+              The time at which the thermodynamic variables are output (s).
+            thermo (Thermodynamics):
+              An instance of the Thermodynamics class containing the thermodynamic variables to output.
+
+        Returns:
+            None
+        """
+        assert not self._is_finalized, "cannot output after finalize"
+        is_output = self._ncalls % self.output_interval == 0
+        self._ncalls += 1
+        if not is_output:
+            return
+
+        assert self._nwritten < self.shape[0], "no space left in output"
+        self._buffer.output_thermodynamics(time, thermo)
+        self._nwritten += 1
+        if self._buffer.time._i == self.chunksize:
+            self._flush()
+
+    def __call__(self, time: float, thermo: Thermodynamics):
+        """Invoke the object as a function to call the `output_thermodynamics` method.
+
+        Parameters:
+            time (float):
+              The time at which the thermodynamic variables are output (s).
+            thermo (Thermodynamics):
+              An instance of the Thermodynamics class containing the thermodynamic variables to output.
+
+        Returns:
+            None
+        """
+        self.output_thermodynamics(time, thermo)
+
+    def _flush(self):
+        """Append output times currently in buffer to the Zarr store and then empty buffer."""
+        nbuffer = self._buffer.time._i
+        if nbuffer == 0:
+            return
+
+        ds = self._buffer.to_dataset().isel(time=slice(0, nbuffer))
+        if self._nwritten == nbuffer:  # first chunk creates the store
+            encoding = {
+                name: {"chunks": (self.chunksize, *self.shape[1:])}
+                for name in self.variables
+            }
+            encoding["time"] = {"chunks": (self.chunksize,)}
+            ds.to_zarr(self.filename, mode="w", encoding=encoding)
+        else:
+            ds = ds.drop_vars([c for c in HALF_COORDINATES if c in ds.coords])
+            ds.to_zarr(self.filename, append_dim="time")
+
+        for name in ("time",) + self.variables:
+            self._buffer[name]._i = 0
+
+    def finalize(self):
+        """Finalize the thermodynamics output.
+
+        This method appends any output remaining in the buffer to the Zarr store and
+        frees the buffer.
+
+        Returns:
+            None
+        """
+        self._flush()
+        self._buffer = None
+        self._is_finalized = True
+        print(f"{self._nwritten} output times written to: {self.filename}")
+
+    def open_dataset(self):
+        """Open the (lazily loaded) xarray Dataset of the output written to the Zarr store.
+
+        Returns:
+            xarray.Dataset: Dataset of the thermodynamics output.
+        """
+        import xarray as xr
+
+        assert self._is_finalized, "output must be finalized before it is read"
+        return xr.open_zarr(self.filename)
+
+    def load(self):
+        """Load the output written to the Zarr store into memory.
+
+        Returns:
+            OutputThermodynamics: Thermodynamics output containing values from the Zarr store.
+        """
+        return OutputThermodynamics.from_dataset(self.open_dataset())
+
+    def __getitem__(self, key):
+        """
+        Get an output variable read from the Zarr store by its name using bracket notation.
+
+        Parameters:
+            key (str): The name of the variable to access.
+
+        Returns:
+            OutputVariable: The variable if it exists, otherwise None.
+        """
+        ds = self.open_dataset()
+        if key not in ds.variables:
+            return None
+        var = OutputVariable(key, ds[key].attrs.get("units", ""), ds[key].shape)
+        var.set(ds[key].values)
+        return var
+
+    def __getattr__(self, name):
+        """Get an output variable read from the Zarr store as an attribute, e.g. out.temp."""
+        if name in ("time",) + tuple(THERMODYNAMICS_VARIABLES) + HALF_COORDINATES:
+            return self[name]
+        raise AttributeError(name)
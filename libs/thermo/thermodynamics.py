@@ -8,7 +8,7 @@ Created Date: Wednesday 28th February 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Monday 11th November 2024
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -20,6 +20,19 @@ File Description:
 import numpy as np
 from copy import deepcopy
 
+# variables of Thermodynamics (in order) which can be stored in one contiguous buffer
+BUFFER_VARIABLES = (
+    "temp",
+    "rho",
+    "press",
+    "qvap",
+    "qcond",
+    "qice",
+    "qrain",
+    "qsnow",
+    "qgrau",
+)
+
 
 class Thermodynamics:
     """
@@ -47,6 +60,15 @@ class Thermodynamics:
         Specific snow content kg/kg).
       qgrau (np.ndarray):
         Specific graupel content (kg/kg).
+      wvel (np.ndarray):
+        vertical wind velocity, 'z', (m/s)
+      uvel (np.ndarray):
+        zonal wind velocity, 'x', (m/s)
+      vvel (np.ndarray):
+        meridional wind velocity, 'y', (m/s)
+      contiguous (bool, optional):
+        If True, store temp, rho, press and the mass mixing ratios as views onto one
+        contiguous 2-D buffer (see "buffer" attribute). Defaults to False.
 
     Attributes:
       temp (np.ndarray):
@@ -66,6 +88,16 @@ class Thermodynamics:
               massmix_ratios["qsnow"] = qsnow (np.ndarray): Specific snow content kg/kg)\n
               massmix_ratios["qgrau"] = qgrau (np.ndarray): Specific graupel content (kg/kg).
 
+      wvel (np.ndarray):
+        vertical wind velocity, 'z', (m/s)
+      uvel (np.ndarray):
+        zonal wind velocity, 'x', (m/s)
+      vvel (np.ndarray):
+        meridional wind velocity, 'y', (m/s)
+      buffer (np.ndarray or None):
+        If contiguous, float64 array with shape [variable, cell] where the variables are
+        ordered as in BUFFER_VARIABLES, otherwise None.
+
     """
 
     def __init__(
@@ -82,6 +114,7 @@ class Thermodynamics:
         wvel: np.ndarray,
         uvel: np.ndarray,
         vvel: np.ndarray,
+        contiguous: bool = False,
     ):
         """Initialize a thermodynamics object with the given variables
 
@@ -98,22 +131,78 @@ class Thermodynamics:
             wvel (np.ndarray): vertical wind velocity, 'z', (m/s)
             uvel (np.ndarray): zonal wind velocity, 'x', (m/s)
             vvel (np.ndarray): meridional wind velocity, 'y', (m/s)
+            contiguous (bool, optional): If True, temp, rho, press and the mass mixing ratios
+              are views onto one contiguous buffer. Defaults to False.
         """
-        self.temp = deepcopy(temp)
-        self.rho = deepcopy(rho)
-        self.press = deepcopy(press)
-        self.massmix_ratios = {
-            "qvap": deepcopy(qvap),
-            "qcond": deepcopy(qcond),
-            "qice": deepcopy(qice),
-            "qrain": deepcopy(qrain),
-            "qsnow": deepcopy(qsnow),
-            "qgrau": deepcopy(qgrau),
-        }
+        if contiguous:
+            variables = (temp, rho, press, qvap, qcond, qice, qrain, qsnow, qgrau)
+            shape = np.shape(temp)
+            for var in variables:
+                assert (
+                    np.shape(var) == shape
+                ), "contiguous thermodynamics requires variables to have the same shape"
+            self.buffer = np.empty((len(variables), np.prod(shape, dtype=int)))
+            for i, var in enumerate(variables):
+                self.buffer[i] = np.ravel(var)
+            self._set_views_on_buffer(shape)
+        else:
+            self.buffer = None
+            self.temp = deepcopy(temp)
+            self.rho = deepcopy(rho)
+            self.press = deepcopy(press)
+            self.massmix_ratios = {
+                "qvap": deepcopy(qvap),
+                "qcond": deepcopy(qcond),
+                "qice": deepcopy(qice),
+                "qrain": deepcopy(qrain),
+                "qsnow": deepcopy(qsnow),
+                "qgrau": deepcopy(qgrau),
+            }
         self.wvel = deepcopy(wvel)
         self.uvel = deepcopy(uvel)
         self.vvel = deepcopy(vvel)
 
+    def _set_views_on_buffer(self, shape):
+        """sets variables to be views (with given shape) onto rows of the contiguous buffer"""
+        views = {
+            name: self.buffer[i].reshape(shape)
+            for i, name in enumerate(BUFFER_VARIABLES)
+        }
+        self.temp = views["temp"]
+        self.rho = views["rho"]
+        self.press = views["press"]
+        self.massmix_ratios = {
+            "qvap": views["qvap"],
+            "qcond": views["qcond"],
+            "qice": views["qice"],
+            "qrain": views["qrain"],
+            "qsnow": views["qsnow"],
+            "qgrau": views["qgrau"],
+        }
+
+    def __deepcopy__(self, memo):
+        """returns a deep copy of thermodynamics; if contiguous, the copy of the variables
+        stored in the buffer is a single copy of the buffer."""
+        cp_thermo = Thermodynamics.__new__(Thermodynamics)
+        memo[id(self)] = cp_thermo
+        if self.buffer is not None:
+            cp_thermo.buffer = self.buffer.copy()
+            cp_thermo._set_views_on_buffer(self.temp.shape)
+        else:
+            cp_thermo.buffer = None
+            cp_thermo.temp = deepcopy(self.temp, memo)
+            cp_thermo.rho = deepcopy(self.rho, memo)
+            cp_thermo.press = deepcopy(self.press, memo)
+            cp_thermo.massmix_ratios = deepcopy(self.massmix_ratios, memo)
+        cp_thermo.wvel = deepcopy(self.wvel, memo)
+        cp_thermo.uvel = deepcopy(self.uvel, memo)
+        cp_thermo.vvel = deepcopy(self.vvel, memo)
+        return cp_thermo
+
+    def is_contiguous(self):
+        """returns True if temp, rho, press and mass mixing ratios are stored in one buffer"""
+        return self.buffer is not None
+
     def print_state(self):
         print(self.temp)
         print(self.rho)
@@ -0,0 +1,222 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: checkpoint.py
+Project: utility_functions
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+checkpointing and restarting of the test cases. A checkpoint is a (uncompressed) NumPy .npz
+file of the full state of a run: the time and step of the time loop, the thermodynamics, the
+(in-memory) output written so far, the internal state of the microphysics scheme and of the
+dynamics (e.g. the KiD dynamics' advectees). Restarting from a checkpoint resumes a run
+bit-for-bit.
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+from ..thermo.output_thermodynamics import OutputThermodynamics
+
+SEP = "/"  # separator of the group and name of each array in a checkpoint file
+
+
+def thermodynamics_state(thermo):
+    """Return dictionary of (copies of) the arrays of a Thermodynamics object."""
+    state = {
+        "temp": thermo.temp,
+        "rho": thermo.rho,
+        "press": thermo.press,
+        "wvel": thermo.wvel,
+        "uvel": thermo.uvel,
+        "vvel": thermo.vvel,
+    }
+    state.update(thermo.massmix_ratios)
+    return {name: np.array(var, copy=True) for name, var in state.items()}
+
+
+def set_thermodynamics_state(thermo, state):
+    """Copy arrays from state into the arrays of a Thermodynamics object in-place.
+
+    Arrays are copied rather than reassigned so that e.g. views onto a contiguous buffer, or
+    onto the KiD dynamics' advectees, and the addresses given to a microphysics scheme remain
+    valid.
+    """
+    for name in ("temp", "rho", "press", "wvel", "uvel", "vvel"):
+        getattr(thermo, name)[...] = state[name]
+    for name, var in thermo.massmix_ratios.items():
+        var[...] = state[name]
+
+
+def output_state(out):
+    """Return dictionary of the values written so far and the position of an
+    OutputThermodynamics object.
+
+    Raises:
+        TypeError: If out is not (in-memory) OutputThermodynamics, e.g. if it streams
+          output to a Zarr store.
+    """
+    if not isinstance(out, OutputThermodynamics):
+        raise TypeError(
+            f"checkpointing requires in-memory OutputThermodynamics, not {type(out).__name__}"
+        )
+    state = {"_ncalls": np.array(out._ncalls), "_i": np.array(out.time._i)}
+    for name in ("time", *out.variables):
+        state[name] = out[name].values[: out.time._i].copy()
+    return state
+
+
+def set_output_state(out, state):
+    """Restore values and position of an OutputThermodynamics object from output_state()."""
+    if not isinstance(out, OutputThermodynamics):
+        raise TypeError(
+            f"checkpointing requires in-memory OutputThermodynamics, not {type(out).__name__}"
+        )
+    nwritten = int(state["_i"])
+    for name in ("time", *out.variables):
+        var = out[name]
+        assert name in state, f"checkpoint has no output variable {name}"
+        assert (
+            state[name].shape[1:] == var.values.shape[1:]
+        ), f"checkpoint of output variable {name} has wrong shape"
+        var.values[:nwritten] = state[name]
+        var._i = nwritten
+    out._ncalls = int(state["_ncalls"])
+
+
+def check_run_checkpointable(out, microphys_scheme, dynamics=None):
+    """Check, before a test case's run starts, that it can be checkpointed and restarted.
+
+    The microphysics scheme's get_state() is called once so that a scheme which cannot give
+    its state fails now rather than at the first checkpoint.
+
+    Args:
+        out: Output of the run.
+        microphys_scheme: Microphysics scheme (wrapper) of the run.
+        dynamics (optional): Dynamics of the run if it has internal state. Defaults to None.
+
+    Raises:
+        TypeError: If out is not (in-memory) OutputThermodynamics, or if the microphysics
+          scheme or the dynamics have no get_state() and set_state() methods.
+    """
+    if not isinstance(out, OutputThermodynamics):
+        raise TypeError(
+            f"checkpointing requires in-memory OutputThermodynamics, not {type(out).__name__}"
+        )
+    for obj in (microphys_scheme, dynamics):
+        if obj is not None and not (
+            hasattr(obj, "get_state") and hasattr(obj, "set_state")
+        ):
+            raise TypeError(f"{type(obj).__name__} does not support checkpointing")
+    microphys_scheme.get_state()
+
+
+def save_checkpoint(filename, **groups):
+    """Write groups of arrays to a checkpoint file.
+
+    The file is written to a temporary file which then replaces filename, so that a run which
+    is interrupted while checkpointing does not leave behind a corrupted checkpoint.
+
+    E.g. save_checkpoint("run.npz", loop={"time": time}, thermo=thermodynamics_state(thermo))
+
+    Args:
+        filename (str or Path): Path to the checkpoint (.npz) file.
+        **groups (dict): Dictionary of the (name and) value of each array in each group.
+    """
+    filename = Path(filename)
+    arrays = {}
+    for group, state in groups.items():
+        for name, value in state.items():
+            arrays[group + SEP + name] = np.asarray(value)
+
+    tmpfile = filename.with_name(filename.name + ".tmp")
+    with open(tmpfile, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmpfile, filename)
+
+
+def load_checkpoint(filename):
+    """Read groups of arrays from a checkpoint file written by save_checkpoint().
+
+    Args:
+        filename (str or Path): Path to the checkpoint (.npz) file.
+
+    Returns:
+        dict: Dictionary of each group's dictionary of the (name and) value of its arrays.
+    """
+    groups = {}
+    with np.load(filename) as data:
+        for key in data.files:
+            group, name = key.split(SEP, 1)
+            groups.setdefault(group, {})[name] = data[key]
+    return groups
+
+
+def write_run_checkpoint(
+    filename, step, time, thermo, out, microphys_scheme, dynamics=None
+):
+    """Write a checkpoint of the full state of a test case's run.
+
+    Args:
+        filename (str or Path): Path to the checkpoint (.npz) file.
+        step (int): Number of timesteps completed.
+        time (float): Time of the run (s).
+        thermo (Thermodynamics): Thermodynamics of the run.
+        out (OutputThermodynamics): Output of the run so far.
+        microphys_scheme: Microphysics scheme (wrapper) of the run, which must have a
+          get_state() method.
+        dynamics (optional): Dynamics of the run if it has internal state, which must then
+          have a get_state() method. Defaults to None.
+    """
+    groups = {
+        "loop": {"step": np.array(step), "time": np.array(time, dtype=np.float64)},
+        "thermo": thermodynamics_state(thermo),
+        "out": output_state(out),
+        "scheme": microphys_scheme.get_state(),
+    }
+    if dynamics is not None:
+        groups["dynamics"] = dynamics.get_state()
+    save_checkpoint(filename, **groups)
+
+
+def read_run_checkpoint(filename, thermo, out, microphys_scheme, dynamics=None):
+    """Restore the full state of a test case's run from a checkpoint.
+
+    thermo, out, microphys_scheme and dynamics must have been created (and initialised) in
+    the same way as for the run which wrote the checkpoint, their state is then restored
+    in-place.
+
+    Args:
+        filename (str or Path): Path to the checkpoint (.npz) file.
+        thermo (Thermodynamics): Thermodynamics of the run.
+        out (OutputThermodynamics): Output of the run.
+        microphys_scheme: Microphysics scheme (wrapper) of the run, which must have a
+          set_state() method.
+        dynamics (optional): Dynamics of the run if it has internal state, which must then
+          have a set_state() method. Defaults to None.
+
+    Returns:
+        tuple: Number of timesteps completed (int) and time of the run (float) at the
+        checkpoint.
+    """
+    groups = load_checkpoint(filename)
+    set_thermodynamics_state(thermo, groups["thermo"])
+    set_output_state(out, groups["out"])
+    microphys_scheme.set_state(groups.get("scheme", {}))
+    if dynamics is not None:
+        dynamics.set_state(groups["dynamics"])
+
+    step = int(groups["loop"]["step"])
+    time = float(groups["loop"]["time"])
+    return step, time
@@ -0,0 +1,246 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: parameter_sweep.py
+Project: utility_functions
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+run parameter sweeps (ensembles of runs with different parameters) of the 0-D parcel and 1-D
+KiD rainshaft test cases in parallel and combine their output into one dataset.
+"""
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .scheme_registry import get_scheme
+
+# default parameters of each test case, any of which can be varied in a sweep
+DEFAULT_PARAMETERS = {
+    "0dparcel": {
+        "scheme": "pympdata_bulk",
+        "time_end": 240.0,  # [s]
+        "timestep": 1.0,  # [s]
+        "amp": 11325.0,  # amplitude of pressure sinusoid [Pa]
+        "tau": 120.0,  # time period of pressure sinusoid [s]
+        "temp_init": 288.15,  # initial temperature [K]
+        "rho_init": 1.225,  # initial density of moist air [kg/m^3]
+        "press_init": 101325.0,  # initial pressure [Pa]
+        "qvap_init": 0.015,  # initial specific water vapour content [kg/kg]
+    },
+    "1dkid": {
+        "scheme": "pympdata_bulk",
+        "time_end": 900.0,  # [s]
+        "timestep": 1.25,  # [s]
+        "z_delta": 25.0,  # [m]
+        "z_max": 3200.0,  # [m]
+        "wmax": 3.0,  # maximum vertical velocity, 'w1' of Shipway and Hill (2012) [m/s]
+        "tscale": 600.0,  # timescale of updraft, 't1' of Shipway and Hill (2012) [s]
+        "advect_hydrometeors": True,
+    },
+}
+
+
+def parameter_grid(**values):
+    """Return the members of a sweep over every combination of the given parameter values.
+
+    E.g. parameter_grid(timestep=[1.0, 2.0], scheme=["pympdata_bulk"]) returns
+    [{"timestep": 1.0, "scheme": "pympdata_bulk"}, {"timestep": 2.0, "scheme": "pympdata_bulk"}]
+
+    Args:
+        **values (list): Values of each parameter to sweep over.
+
+    Returns:
+        list[dict]: Parameters of each member of the sweep.
+    """
+    names = list(values)
+    return [dict(zip(names, combo)) for combo in itertools.product(*values.values())]
+
+
+def create_microphysics_scheme(scheme, ncells, z_delta):
+    """Return the wrapper of a microphysics scheme for a given number of cells.
+
+    Schemes are created via the scheme registry, so optional backends are only imported if
+    used. CLEO SDM is not available since it requires its own configuration file.
+
+    Args:
+        scheme (str): Name of the scheme, one of "mock_microphys", "pympdata_bulk",
+          "icon_muphys" or "icon_satadj".
+        ncells (int): Number of cells (in the vertical) of the thermodynamics.
+        z_delta (float): Thickness of the cells (m).
+
+    Returns:
+        MicrophysicsSchemeWrapper: Wrapper of the microphysics scheme.
+    """
+    dz = np.array([z_delta], dtype=np.float64)
+    qnc = 500
+    args = {
+        "mock_microphys": (1, ncells, 0, dz, qnc),
+        "pympdata_bulk": (),
+        "icon_muphys": (1, ncells, 0, dz, qnc, True),  # lrain=True
+        "icon_satadj": (1, ncells, 0, dz, qnc),
+    }
+    if scheme not in args:
+        raise ValueError(f"unknown microphysics scheme for parameter sweep: {scheme}")
+    return get_scheme(scheme).create(*args[scheme])
+
+
+def run_member(case, params, output_timestep=None, output_variables=None):
+    """Run one member of a parameter sweep of a test case.
+
+    Args:
+        case (str): Test case to run, "0dparcel" or "1dkid".
+        params (dict): Parameters of the member, unspecified parameters take their
+          default values from DEFAULT_PARAMETERS[case].
+        output_timestep (float, optional): Time between outputs (s). Defaults to None,
+          meaning output every timestep.
+        output_variables (list of str, optional): Names of the thermodynamic variables to
+          output. Defaults to None, meaning all.
+
+    Returns:
+        xarray.Dataset: Output of the member's run.
+    """
+    from libs.thermo.thermodynamics import Thermodynamics
+
+    unknown = set(params) - set(DEFAULT_PARAMETERS[case])
+    assert not unknown, f"unknown parameters for {case} test case: {unknown}"
+    p = dict(DEFAULT_PARAMETERS[case], **params)
+    output_options = {
+        "output_timestep": output_timestep,
+        "output_variables": output_variables,
+    }
+    null = np.array([])  # test cases don't need winds
+
+    if case == "0dparcel":
+        from libs.test_case_0dparcel.run_0dparcel import run_0dparcel
+
+        initial = [p["temp_init"], p["rho_init"], p["press_init"], p["qvap_init"]] + [
+            0.0
+        ] * 5
+        thermo = Thermodynamics(
+            *(np.array([v], dtype=np.float64) for v in initial), null, null, null
+        )
+        microphys_scheme = create_microphysics_scheme(p["scheme"], 1, 1.0)
+        out = run_0dparcel(
+            0.0,
+            p["time_end"],
+            p["timestep"],
+            thermo,
+            microphys_scheme,
+            amp=p["amp"],
+            tau=p["tau"],
+            **output_options,
+        )
+    elif case == "1dkid":
+        from libs.test_case_1dkid.run_1dkid import run_1dkid
+
+        assert (
+            p["z_max"] % p["z_delta"] == 0
+        ), "z limit is not a multiple of the grid spacing."
+        nz = int(p["z_max"] / p["z_delta"])
+        thermo = Thermodynamics(*(np.zeros(nz) for _ in range(9)), null, null, null)
+        microphys_scheme = create_microphysics_scheme(p["scheme"], nz, p["z_delta"])
+        out = run_1dkid(
+            p["z_delta"],
+            p["z_max"],
+            p["time_end"],
+            p["timestep"],
+            thermo,
+            microphys_scheme,
+            p["advect_hydrometeors"],
+            wmax=p["wmax"],
+            tscale=p["tscale"],
+            **output_options,
+        )
+    else:
+        raise ValueError(f"unknown test case: {case}")
+
+    return out.to_dataset()
+
+
+def combine_members(datasets, members):
+    """Combine the output of each member of a sweep into one dataset.
+
+    Datasets are concatenated along a new "member" dimension with the members' parameters
+    as coordinates along it. Time and cell dimensions are outer-joined, so members with
+    e.g. different timesteps or grids are padded with NaN.
+
+    Args:
+        datasets (list[xarray.Dataset]): Output of each member.
+        members (list[dict]): Parameters of each member.
+
+    Returns:
+        xarray.Dataset: Combined output of the sweep.
+    """
+    import xarray as xr
+
+    combined = []
+    for i, (ds, params) in enumerate(zip(datasets, members)):
+        cells = {dim: np.arange(ds.sizes[dim]) for dim in ds.dims if dim != "time"}
+        ds = ds.assign_coords({k: v for k, v in cells.items() if k not in ds.coords})
+        ds = ds.expand_dims(member=[i])
+        ds = ds.assign_coords({k: ("member", [v]) for k, v in params.items()})
+        combined.append(ds)
+
+    return xr.concat(combined, dim="member", join="outer")
+
+
+def run_sweep(
+    case,
+    members,
+    max_workers=None,
+    executor="process",
+    output_timestep=None,
+    output_variables=None,
+):
+    """Run every member of a parameter sweep of a test case in parallel.
+
+    Args:
+        case (str): Test case to run, "0dparcel" or "1dkid".
+        members (list[dict]): Parameters of each member, e.g. from parameter_grid().
+        max_workers (int, optional): Number of worker processes. Defaults to None, meaning
+          the executor's default (e.g. the number of cores).
+        executor (str, optional): "process" to use a ProcessPoolExecutor or "mpi" to use
+          an MPIPoolExecutor from mpi4py (run with e.g. mpiexec -n N python -m mpi4py.futures
+          script.py). Defaults to "process".
+        output_timestep (float, optional): Time between outputs (s). Defaults to None,
+          meaning output every timestep.
+        output_variables (list of str, optional): Names of the thermodynamic variables to
+          output. Defaults to None, meaning all.
+
+    Returns:
+        xarray.Dataset: Combined output of the sweep, see combine_members().
+    """
+    if executor == "process":
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+    elif executor == "mpi":
+        from mpi4py.futures import MPIPoolExecutor
+
+        pool = MPIPoolExecutor(max_workers=max_workers)
+    else:
+        raise ValueError(f"unknown executor: {executor}")
+
+    nmembers = len(members)
+    with pool:
+        datasets = list(
+            pool.map(
+                run_member,
+                [case] * nmembers,
+                members,
+                [output_timestep] * nmembers,
+                [output_variables] * nmembers,
+            )
+        )
+
+    return combine_members(datasets, members)
@@ -0,0 +1,142 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: phase_timers.py
+Project: utility_functions
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+low-overhead timers which accumulate the wall time spent in each phase (e.g. dynamics,
+microphysics, output) of a test case's time loop. Timings can be exported as JSON or as a
+Chrome trace (viewable in e.g. chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import json
+from time import perf_counter_ns
+
+
+class _Phase:
+    """Context manager which adds the time spent inside it to a phase of PhaseTimers."""
+
+    __slots__ = ("timers", "name", "start")
+
+    def __init__(self, timers, name):
+        self.timers = timers
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.timers.add(self.name, self.start, perf_counter_ns())
+        return False
+
+
+class PhaseTimers:
+    """Accumulators of the wall time (from time.perf_counter_ns) spent in named phases.
+
+    E.g.
+    timers = PhaseTimers()
+    with timers.phase("dynamics"):
+        thermo = dynamics.run(time, timestep, thermo)
+    print(timers.summary())
+
+    Args:
+        trace (bool, optional): If True, the start and duration of every call to every phase
+          are also recorded so that they can be exported as a Chrome trace (memory grows
+          with the number of calls). Defaults to False.
+    """
+
+    def __init__(self, trace=False):
+        self.trace = trace
+        self.totals = {}  # total time spent in each phase [ns]
+        self.counts = {}  # number of calls to each phase
+        self.events = []  # (name, start, end) of each call if trace is True [ns]
+        self.origin = perf_counter_ns()  # time relative to which events are traced [ns]
+
+    def phase(self, name):
+        """Return context manager which times the code inside it as (a call to) phase name."""
+        return _Phase(self, name)
+
+    def add(self, name, start, end):
+        """Add call to phase name which started and ended at times given by perf_counter_ns."""
+        self.totals[name] = self.totals.get(name, 0) + (end - start)
+        self.counts[name] = self.counts.get(name, 0) + 1
+        if self.trace:
+            self.events.append((name, start, end))
+
+    def summary(self):
+        """Return dictionary of the total time [s], number of calls and mean time per call [ms]
+        of each phase."""
+        summary = {}
+        for name, total in self.totals.items():
+            count = self.counts[name]
+            summary[name] = {
+                "total_s": total / 1e9,
+                "calls": count,
+                "mean_ms": total / count / 1e6,
+            }
+        return summary
+
+    def to_json(self, filename):
+        """Write summary of the phases' timings to a JSON file."""
+        with open(filename, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def to_chrome_trace(self, filename):
+        """Write every recorded call to every phase to a JSON file in Chrome trace format.
+
+        Raises:
+            ValueError: If the timers were not created with trace=True.
+        """
+        if not self.trace:
+            raise ValueError("Chrome trace requires PhaseTimers(trace=True)")
+
+        events = [
+            {
+                "name": name,
+                "ph": "X",  # 'complete' event with duration
+                "ts": (start - self.origin) / 1e3,  # [us]
+                "dur": (end - start) / 1e3,  # [us]
+                "pid": 0,
+                "tid": 0,
+            }
+            for name, start, end in self.events
+        ]
+        with open(filename, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+class NullTimers:
+    """Drop-in replacement for PhaseTimers which does not time anything."""
+
+    class _NullPhase:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    _null_phase = _NullPhase()
+
+    def phase(self, name):
+        return self._null_phase
+
+
+def scheme_phase_name(microphys_scheme):
+    """Return name of microphysics phase for a scheme wrapper, e.g. "microphysics:pympdata_bulk",
+    from the package the wrapper is defined in."""
+    module = type(microphys_scheme).__module__.split(".")
+    scheme = module[-2] if len(module) > 1 else module[-1]
+    return f"microphysics:{scheme}"
@@ -0,0 +1,118 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: postprocessing.py
+Project: utility_functions
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+post-processing (plotting) of the output of the test cases separately from running them, e.g.
+from output saved to a Zarr store and/or in a background process so that runs are not blocked
+on rendering figures.
+"""
+
+import multiprocessing
+from pathlib import Path
+
+from ..thermo.output_thermodynamics import (
+    OutputThermodynamics,
+    StreamingOutputThermodynamics,
+)
+
+
+def load_output(source):
+    """Return the output of a test case as an OutputThermodynamics object.
+
+    Args:
+        source (OutputThermodynamics, StreamingOutputThermodynamics, xarray.Dataset, str or
+          Path): Output of a test case, a Dataset of it (e.g. from to_dataset()), or the path
+          to a Zarr store of it (e.g. written by StreamingOutputThermodynamics).
+
+    Returns:
+        OutputThermodynamics: Output of the test case.
+    """
+    if isinstance(source, OutputThermodynamics):
+        return source
+    if isinstance(source, StreamingOutputThermodynamics):
+        return source.load()
+    if isinstance(source, (str, Path)):
+        import xarray as xr
+
+        source = xr.open_zarr(source)
+    return OutputThermodynamics.from_dataset(source)
+
+
+def plot_test_case(case, source, binpath, run_name):
+    """Plot the output of a test case and save the plots in binpath.
+
+    Args:
+        case (str): Test case of the output, "0dparcel" or "1dkid".
+        source: Output of the test case, see load_output().
+        binpath (str or Path): Path to the directory where plots will be saved.
+        run_name (str): Name of the test run (used for labeling plots).
+
+    Raises:
+        AssertionError: If the specified binpath does not exist or if run_name is empty.
+        ValueError: If the test case is unknown.
+
+    Returns:
+        None
+    """
+    binpath = Path(binpath)
+    assert binpath.exists(), "The specified binpath does not exist."
+    assert run_name, "The run_name cannot be empty."
+    out = load_output(source)
+
+    if case == "0dparcel":
+        from ..test_case_0dparcel.plot_0dparcel import plot_0dparcel
+
+        plot_0dparcel(out, binpath, run_name)
+    elif case == "1dkid":
+        from ..test_case_1dkid.plot_1dkid import plot_1dkid_moisture
+
+        zhalf = out.zhalf.values
+        z_delta, z_max = zhalf[1] - zhalf[0], zhalf[-1]
+        plot_1dkid_moisture(out, z_delta, z_max, binpath, run_name)
+    else:
+        raise ValueError(f"unknown test case: {case}")
+
+
+def postprocess_test_case(case, source, binpath, run_name, background=False):
+    """Plot the output of a test case, optionally in a background process.
+
+    In the background, plotting happens in a new (spawned) process so that the caller can
+    continue, e.g. with the next run of a batch job. The output is passed to the process,
+    so for large outputs pass the path to a Zarr store rather than the output itself.
+
+    Args:
+        case (str): Test case of the output, "0dparcel" or "1dkid".
+        source: Output of the test case, see load_output().
+        binpath (str or Path): Path to the directory where plots will be saved.
+        run_name (str): Name of the test run (used for labeling plots).
+        background (bool, optional): If True, plot in a background process. Defaults to
+          False.
+
+    Returns:
+        multiprocessing.Process: The (started) background process if background is True,
+        which can be joined to wait for plotting to finish, else None.
+    """
+    if not background:
+        plot_test_case(case, source, binpath, run_name)
+        return None
+
+    if isinstance(source, StreamingOutputThermodynamics):
+        source = source.filename  # output is read from its Zarr store in the process
+    process = multiprocessing.get_context("spawn").Process(
+        target=plot_test_case, args=(case, source, binpath, run_name)
+    )
+    process.start()
+    return process
@@ -0,0 +1,181 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: scheme_registry.py
+Project: utility_functions
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+registry of the microphysics schemes (backends) which can be used by the test cases. Schemes
+are registered by the name of the module of their wrapper, so nothing is imported until a
+scheme's wrapper is loaded, and whether a scheme is available (e.g. if its compiled python
+bindings can be found) can be checked without importing it.
+"""
+
+import importlib
+import importlib.machinery
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+
+def import_extension(module_name, env_var):
+    """Import a (compiled) module from the directory given by an environment variable.
+
+    Args:
+        module_name (str): Name of the module, e.g. "aes_muphys_py".
+        env_var (str): Name of the environment variable with the module's directory,
+          e.g. "AES_MUPHYS_PY_DIR".
+
+    Raises:
+        ImportError: If the environment variable is not set or the module cannot be imported.
+
+    Returns:
+        module: The imported module.
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    directory = os.environ.get(env_var)
+    if directory is None:
+        raise ImportError(
+            f"cannot import {module_name}: export {env_var} as the directory containing it"
+        )
+    if directory not in sys.path:
+        sys.path.append(directory)
+    return importlib.import_module(module_name)
+
+
+class SchemeBackend:
+    """A microphysics scheme registered by the module of its wrapper class.
+
+    Args:
+        name (str): Name of the scheme.
+        module (str): Name of the module which defines the scheme's wrapper.
+        wrapper (str, optional): Name of the wrapper class in module. Defaults to
+          "MicrophysicsSchemeWrapper".
+        requires (tuple of str, optional): Names of python packages the scheme requires.
+          Defaults to ().
+        extension (tuple of str, optional): Name of the (compiled) module the scheme requires
+          and the environment variable with its directory, see import_extension(). Defaults
+          to None.
+    """
+
+    def __init__(
+        self,
+        name,
+        module,
+        wrapper="MicrophysicsSchemeWrapper",
+        requires=(),
+        extension=None,
+    ):
+        self.name = name
+        self.module = module
+        self.wrapper = wrapper
+        self.requires = tuple(requires)
+        self.extension = extension
+
+    def unavailable_reason(self):
+        """Return why the scheme cannot be used, or None if it is available.
+
+        This only searches for the scheme's requirements, it does not import anything.
+        """
+        for package in self.requires:
+            if importlib.util.find_spec(package) is None:
+                return f"python package {package} not found"
+
+        if self.extension is not None:
+            module_name, env_var = self.extension
+            if module_name in sys.modules:
+                return None
+            directory = os.environ.get(env_var)
+            if directory is None:
+                return f"environment variable {env_var} not set"
+            if not Path(directory).is_dir():
+                return f"{env_var}={directory} is not a directory"
+            if (
+                importlib.machinery.PathFinder.find_spec(module_name, [directory])
+                is None
+            ):
+                return f"{module_name} not found in {directory}"
+
+        return None
+
+    def is_available(self):
+        """Return True if the scheme's requirements can be found (without importing them)."""
+        return self.unavailable_reason() is None
+
+    def load(self):
+        """Import and return the scheme's wrapper class.
+
+        Raises:
+            ImportError: If the scheme is unavailable.
+        """
+        reason = self.unavailable_reason()
+        if reason is not None:
+            raise ImportError(f"microphysics scheme {self.name} unavailable: {reason}")
+        return getattr(importlib.import_module(self.module), self.wrapper)
+
+    def create(self, *args, **kwargs):
+        """Return an instance of the scheme's wrapper created with the given arguments."""
+        return self.load()(*args, **kwargs)
+
+
+SCHEMES = {}
+
+
+def register_scheme(name, module, **kwargs):
+    """Register a microphysics scheme, see SchemeBackend for the arguments."""
+    SCHEMES[name] = SchemeBackend(name, module, **kwargs)
+    return SCHEMES[name]
+
+
+def get_scheme(name):
+    """Return the registered microphysics scheme called name.
+
+    Raises:
+        ValueError: If no scheme of that name is registered.
+    """
+    if name not in SCHEMES:
+        raise ValueError(f"unknown microphysics scheme: {name}")
+    return SCHEMES[name]
+
+
+def available_schemes():
+    """Return dictionary of the names of the registered schemes and whether each of them
+    is available (without importing any of them)."""
+    return {name: scheme.is_available() for name, scheme in SCHEMES.items()}
+
+
+register_scheme("mock_microphys", "libs.mock_microphys.microphysics_scheme_wrapper")
+register_scheme(
+    "pympdata_bulk",
+    "libs.pympdata_bulk.bulk_scheme_condensation",
+    requires=("PyMPDATA_examples",),
+)
+register_scheme(
+    "icon_muphys",
+    "libs.icon_muphys.microphysics_scheme_wrapper",
+    extension=("aes_muphys_py", "AES_MUPHYS_PY_DIR"),
+)
+register_scheme(
+    "icon_satadj",
+    "libs.icon_satadj.microphysics_scheme_wrapper",
+    extension=("aes_muphys_py", "AES_MUPHYS_PY_DIR"),
+)
+register_scheme(
+    "cleo_sdm",
+    "libs.cleo_sdm.microphysics_scheme_wrapper",
+    requires=("mpi4py",),
+    extension=("pycleo", "PYCLEO_DIR"),
+)
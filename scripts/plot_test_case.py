@@ -0,0 +1,53 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: plot_test_case.py
+Project: scripts
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+Plot the output of a run of the 0-D parcel or 1-D KiD rainshaft test case saved in a zarr
+store, e.g.
+python scripts/plot_test_case.py --case 1dkid --infile out.zarr --binpath ./bin --run-name kid
+"""
+
+import argparse
+import sys
+import pathlib
+
+path = str(pathlib.Path(__file__).parent.resolve())
+sys.path.append(path + "/../")  # add path to repository to PATH
+
+from libs.utility_functions.postprocessing import postprocess_test_case
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--case", type=str, choices=["0dparcel", "1dkid"], required=True
+    )
+    parser.add_argument(
+        "--infile", type=pathlib.Path, required=True, help="zarr store of the output"
+    )
+    parser.add_argument(
+        "--binpath", type=pathlib.Path, required=True, help="directory for the plots"
+    )
+    parser.add_argument(
+        "--run-name", type=str, required=True, help="name of run used to label plots"
+    )
+    args = parser.parse_args()
+
+    postprocess_test_case(args.case, args.infile, args.binpath, args.run_name)
+
+
+if __name__ == "__main__":
+    main()
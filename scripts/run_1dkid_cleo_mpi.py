@@ -0,0 +1,99 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: run_1dkid_cleo_mpi.py
+Project: scripts
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+Run the 1-D KiD rainshaft test case with CLEO SDM microphysics with CLEO's gridboxes (and
+superdroplets) decomposed across MPI processes. The KiD dynamics and output are on rank 0,
+which writes the output to a zarr store, e.g.
+mpirun -n 4 python scripts/run_1dkid_cleo_mpi.py
+  --config src/cleo_initial_conditions/1dkid/fullscheme/config.yaml
+  --path2pycleo build/_deps/cleo-build/pycleo --outfile cleo_1dkid.zarr
+NOTE: assumes CLEO's initial condition binary files given in its config file already exist.
+"""
+
+import argparse
+import os
+import sys
+import pathlib
+
+import numpy as np
+from mpi4py import MPI
+
+path = str(pathlib.Path(__file__).parent.resolve())
+sys.path.append(path + "/../")  # add path to repository to PATH
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("File Description:")[-1])
+    parser.add_argument("--config", required=True, help="CLEO config file")
+    parser.add_argument("--path2pycleo", required=True, help="directory of pycleo")
+    parser.add_argument("--outfile", required=True, help="zarr store to write output")
+    parser.add_argument("--z_delta", type=float, default=25.0, help="[m]")
+    parser.add_argument("--z_max", type=float, default=3200.0, help="[m]")
+    parser.add_argument("--timestep", type=float, default=1.25, help="[s]")
+    parser.add_argument("--time_end", type=float, default=900.0, help="[s]")
+    parser.add_argument("--no_motion", action="store_true")
+    args = parser.parse_args()
+
+    os.environ["PYCLEO_DIR"] = str(args.path2pycleo)
+    from libs.cleo_sdm.domain_decomposition import run_microphysics_worker
+    from libs.cleo_sdm.microphysics_scheme_wrapper import MicrophysicsSchemeWrapper
+    from libs.test_case_1dkid.run_1dkid import run_1dkid
+    from libs.thermo.thermodynamics import Thermodynamics
+
+    comm = MPI.COMM_WORLD
+
+    # NOTE: grid must be consistent with CLEO initial condition binary files(!)
+    assert args.z_max % args.z_delta == 0, "z limit is not a multiple of grid spacing."
+    ngbxs = int(args.z_max / args.z_delta)
+    zeros = np.zeros(ngbxs)
+    zeros2 = np.tile(zeros, 2)
+    thermo_init = Thermodynamics(*(zeros for _ in range(9)), zeros2, zeros2, zeros2)
+
+    microphys_scheme = MicrophysicsSchemeWrapper(
+        args.config,
+        not args.no_motion,
+        0.0,
+        args.timestep,
+        thermo_init.press,
+        thermo_init.temp,
+        thermo_init.massmix_ratios["qvap"],
+        thermo_init.massmix_ratios["qcond"],
+        thermo_init.wvel,
+        thermo_init.uvel,
+        thermo_init.vvel,
+        comm=comm,
+    )
+
+    if comm.Get_rank() == 0:
+        advect_hydrometeors = False
+        out = run_1dkid(
+            args.z_delta,
+            args.z_max,
+            args.time_end,
+            args.timestep,
+            thermo_init,
+            microphys_scheme,
+            advect_hydrometeors,
+        )
+        out.to_dataset().to_zarr(args.outfile, mode="w")
+        print(f"output written to {args.outfile}")
+    else:
+        run_microphysics_worker(microphys_scheme, 0.0, args.time_end, args.timestep)
+
+
+if __name__ == "__main__":
+    main()
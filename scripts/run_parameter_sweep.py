@@ -0,0 +1,101 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: run_parameter_sweep.py
+Project: scripts
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+Run a parameter sweep of the 0-D parcel or 1-D KiD rainshaft test case in parallel and write
+the combined output of all its members to a zarr store, e.g.
+python scripts/run_parameter_sweep.py --case 0dparcel --param timestep=1,2
+  --param scheme=mock_microphys,pympdata_bulk --workers 4 --outfile sweep.zarr
+or with MPI
+mpiexec -n 5 python -m mpi4py.futures scripts/run_parameter_sweep.py --executor mpi ...
+"""
+
+import argparse
+import sys
+import pathlib
+
+path = str(pathlib.Path(__file__).parent.resolve())
+sys.path.append(path + "/../")  # add path to repository to PATH
+
+from libs.utility_functions.parameter_sweep import (
+    DEFAULT_PARAMETERS,
+    parameter_grid,
+    run_sweep,
+)
+
+
+def parse_value(value, default):
+    """Convert string value of a parameter to the type of its default value."""
+    if isinstance(default, bool):
+        return value.lower() in ["true", "1", "yes"]
+    return type(default)(value)
+
+
+def parse_params(case, params):
+    """Return dictionary of the values to sweep over for each parameter given as strings
+    "name=value1,value2,...".
+    """
+    values = {}
+    for param in params:
+        name, _, vals = param.partition("=")
+        if name not in DEFAULT_PARAMETERS[case]:
+            raise ValueError(f"unknown parameter for {case} test case: {name}")
+        default = DEFAULT_PARAMETERS[case][name]
+        values[name] = [parse_value(v, default) for v in vals.split(",")]
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--case", type=str, choices=list(DEFAULT_PARAMETERS), default="0dparcel"
+    )
+    parser.add_argument(
+        "--param",
+        type=str,
+        action="append",
+        default=[],
+        help="parameter to sweep over as name=value1,value2,... (can be repeated)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="number of worker processes"
+    )
+    parser.add_argument(
+        "--executor", type=str, choices=["process", "mpi"], default="process"
+    )
+    parser.add_argument(
+        "--output-timestep", type=float, default=None, help="time between outputs [s]"
+    )
+    parser.add_argument(
+        "--outfile", type=pathlib.Path, required=True, help="zarr store for the output"
+    )
+    args = parser.parse_args()
+
+    members = parameter_grid(**parse_params(args.case, args.param))
+    print(f"running {len(members)} members of {args.case} parameter sweep")
+    ds = run_sweep(
+        args.case,
+        members,
+        max_workers=args.workers,
+        executor=args.executor,
+        output_timestep=args.output_timestep,
+    )
+    ds.to_zarr(args.outfile, mode="w")
+    print(f"output written to {args.outfile}")
+
+
+if __name__ == "__main__":
+    main()
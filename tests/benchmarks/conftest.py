@@ -0,0 +1,86 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: conftest.py
+Project: benchmarks
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+configuration file for benchmarks. Benchmarks are only collected if pytest is called with
+--run_benchmarks and pytest-benchmark is installed, e.g. to save a baseline and later compare
+against it (failing if the mean time of any benchmark regresses by more than 10%) do:
+pytest tests/benchmarks --run_benchmarks --benchmark-autosave
+pytest tests/benchmarks --run_benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+def pytest_ignore_collect(collection_path, config):
+    if collection_path.name.startswith("test_"):
+        run_benchmarks = config.getoption("run_benchmarks")
+        return (
+            not run_benchmarks or importlib.util.find_spec("pytest_benchmark") is None
+        )
+
+
+def create_thermo(ncells):
+    """Return thermodynamics with ncells cells of a slightly supersaturated state."""
+    from libs.thermo.thermodynamics import Thermodynamics
+
+    def full(value):
+        return np.full(ncells, value, dtype=np.float64)
+
+    null = np.array([])  # benchmarks don't need winds
+    return Thermodynamics(
+        full(288.15),
+        full(1.225),
+        full(101325.0),
+        full(0.015),
+        full(0.0001),
+        full(0.0002),
+        full(0.0003),
+        full(0.0004),
+        full(0.0005),
+        null,
+        null,
+        null,
+    )
+
+
+@pytest.fixture(scope="session")
+def aes_muphys_py_dir(pytestconfig):
+    """Directory of the ICON AES microphysics bindings, benchmarks using it are skipped if
+    it does not exist."""
+    aes_muphys_py_dir = pytestconfig.getoption("aes_muphys_py_dir")
+    if not Path(aes_muphys_py_dir).is_dir():
+        pytest.skip("No ICON AES microphysics library found")
+    os.environ["AES_MUPHYS_PY_DIR"] = str(aes_muphys_py_dir)
+    return aes_muphys_py_dir
+
+
+@pytest.fixture(scope="session")
+def path2pycleo(pytestconfig):
+    """Directory of the CLEO python bindings, benchmarks using it are skipped if it does
+    not exist."""
+    path2pycleo = pytestconfig.getoption("cleo_path2pycleo")
+    if not Path(path2pycleo).is_dir():
+        pytest.skip("No CLEO python bindings found")
+    os.environ["PYCLEO_DIR"] = str(path2pycleo)
+    sys.path.append(str(path2pycleo))
+    return path2pycleo
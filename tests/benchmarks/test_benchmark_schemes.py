@@ -0,0 +1,106 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_benchmark_schemes.py
+Project: benchmarks
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+benchmarks of one timestep of each microphysics scheme (via its wrapper) for a range of
+numbers of cells
+"""
+
+import numpy as np
+import pytest
+
+from .conftest import create_thermo
+from libs.utility_functions.parameter_sweep import create_microphysics_scheme
+
+NCELLS = [1, 10, 100, 1000, 10000, 100000]
+
+
+def create_scheme(scheme, ncells):
+    if scheme == "pympdata_bulk_numba":
+        from libs.pympdata_bulk.bulk_scheme_condensation import (
+            MicrophysicsSchemeWrapper,
+        )
+
+        return MicrophysicsSchemeWrapper(use_numba=True)
+    return create_microphysics_scheme(scheme, ncells, 25.0)
+
+
+@pytest.mark.parametrize("ncells", NCELLS)
+@pytest.mark.parametrize(
+    "scheme",
+    [
+        "mock_microphys",
+        "pympdata_bulk",
+        "pympdata_bulk_numba",
+        "icon_muphys",
+        "icon_satadj",
+    ],
+)
+def test_benchmark_scheme_run(benchmark, request, scheme, ncells):
+    if scheme.startswith("icon"):
+        request.getfixturevalue("aes_muphys_py_dir")
+
+    timestep = 1.0
+    thermo = create_thermo(ncells)
+    microphys = create_scheme(scheme, ncells)
+    microphys.initialize()
+    microphys.run(timestep, thermo)  # e.g. for numba compilation
+
+    benchmark.group = f"scheme run ncells={ncells}"
+    benchmark.extra_info["ncells"] = ncells
+    thermo = benchmark(microphys.run, timestep, thermo)
+
+    microphys.finalize()
+    assert np.all(np.isfinite(thermo.temp))
+
+
+def test_benchmark_cleo_sdm_run(benchmark, pytestconfig, path2pycleo):
+    from ruamel.yaml import YAML
+    from libs.cleo_sdm.microphysics_scheme_wrapper import MicrophysicsSchemeWrapper
+
+    config_filename = pytestconfig.getoption("cleo_test_generic_config_filename")
+    yaml = YAML()
+    with open(config_filename, "r") as file:
+        python_config = yaml.load(file)
+
+    timestep = python_config["timesteps"]["COUPLTSTEP"]  # [s]
+    is_motion = python_config["pycleo_setup"]["is_motion"]
+    ngbxs = python_config["domain"]["ngbxs"]
+    thermo = create_thermo(ngbxs)
+    thermo.wvel = np.tile(np.array([-1.2, 1.0], dtype=np.float64), ngbxs)
+    thermo.uvel = np.tile(np.array([-0.1, 0.2], dtype=np.float64), ngbxs)
+    thermo.vvel = np.tile(np.array([0.0, 0.0], dtype=np.float64), ngbxs)
+
+    microphys = MicrophysicsSchemeWrapper(
+        config_filename,
+        is_motion,
+        0,
+        timestep,
+        thermo.press,
+        thermo.temp,
+        thermo.massmix_ratios["qvap"],
+        thermo.massmix_ratios["qcond"],
+        thermo.wvel,
+        thermo.uvel,
+        thermo.vvel,
+    )
+    microphys.initialize()
+
+    benchmark.group = f"scheme run ncells={ngbxs}"
+    benchmark.extra_info["ncells"] = ngbxs
+    benchmark(microphys.run, timestep, thermo)
+
+    microphys.finalize()
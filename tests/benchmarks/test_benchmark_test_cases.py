@@ -0,0 +1,66 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_benchmark_test_cases.py
+Project: benchmarks
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+benchmarks of full runs (without plotting) of the 0-D parcel and 1-D KiD rainshaft test cases
+"""
+
+import pytest
+
+from .conftest import create_thermo
+from libs.test_case_0dparcel.run_0dparcel import run_0dparcel
+from libs.test_case_1dkid.run_1dkid import run_1dkid
+from libs.utility_functions.parameter_sweep import create_microphysics_scheme
+
+
+@pytest.mark.parametrize("scheme", ["mock_microphys", "pympdata_bulk", "icon_muphys"])
+def test_benchmark_0dparcel(benchmark, request, scheme):
+    if scheme.startswith("icon"):
+        request.getfixturevalue("aes_muphys_py_dir")
+
+    time_end, timestep = 240.0, 1.0
+
+    def setup():
+        thermo = create_thermo(1)
+        microphys = create_microphysics_scheme(scheme, 1, 1.0)
+        return (0.0, time_end, timestep, thermo, microphys), {}
+
+    benchmark.group = "0dparcel"
+    benchmark.pedantic(run_0dparcel, setup=setup, rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("option", [None, "multi_field_solver", "zero_copy"])
+@pytest.mark.parametrize("scheme", ["pympdata_bulk", "icon_muphys"])
+def test_benchmark_1dkid(benchmark, request, scheme, option):
+    """benchmark 1-D KiD rainshaft with the default options and with each of the
+    multi-field solver and the zero-copy coupling of the dynamics and (in-place)
+    microphysics."""
+    if scheme.startswith("icon"):
+        request.getfixturevalue("aes_muphys_py_dir")
+
+    z_delta, z_max, time_end, timestep = 25.0, 3200.0, 900.0, 1.25
+    nz = int(z_max / z_delta)
+
+    def setup():
+        thermo = create_thermo(nz)
+        microphys = create_microphysics_scheme(scheme, nz, z_delta)
+        microphys.inplace = option == "zero_copy"
+        args = (z_delta, z_max, time_end, timestep, thermo, microphys, True)
+        kwargs = {option: True} if option else {}
+        return args, kwargs
+
+    benchmark.group = "1dkid"
+    benchmark.pedantic(run_1dkid, setup=setup, rounds=3, warmup_rounds=1)
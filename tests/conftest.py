@@ -8,7 +8,7 @@ Created Date: Monday 23rd June 2025
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Monday 23rd June 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -75,3 +75,10 @@ def pytest_addoption(parser):
         action="store",
         default=str(default_cleo_test_1dkid_fullscheme_config_filename),
     )
+
+    parser.addoption(
+        "--run_benchmarks",
+        action="store_true",
+        default=False,
+        help="run the benchmarks in tests/benchmarks (requires pytest-benchmark)",
+    )
@@ -0,0 +1,65 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_adiabatic_motion.py
+Project: test_case_0dparcel
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for adiabatic motion dynamics of 0-D parcel model
+"""
+
+import numpy as np
+
+from libs.test_case_0dparcel.adiabatic_motion import AdiabaticMotion
+from libs.thermo.thermodynamics import Thermodynamics
+
+
+def test_analytic_adiabatic_motion():
+    """checks the analytical solution for the adiabatic motion of an ensemble of parcels
+    matches integration of the equations using odeint"""
+
+    amp = 11325  # [Pa]
+    tau = 120  # [s]
+    timestep = 1.0  # [s]
+
+    temp = np.array([283.15, 288.15, 293.15], dtype=np.float64)
+    rho = np.array([1.2, 1.225, 1.25], dtype=np.float64)
+    press = np.array([100000, 101325, 102000], dtype=np.float64)
+    qvap = np.array([0.0, 0.01, 0.02], dtype=np.float64)
+    zeros = np.zeros(3, dtype=np.float64)
+    null = np.array([])
+
+    thermo_odeint = Thermodynamics(
+        temp, rho, press, qvap, zeros, zeros, zeros, zeros, zeros, null, null, null
+    )
+    thermo_analytic = Thermodynamics(
+        temp, rho, press, qvap, zeros, zeros, zeros, zeros, zeros, null, null, null
+    )
+
+    dynamics_odeint = AdiabaticMotion(amp, tau)
+    dynamics_analytic = AdiabaticMotion(amp, tau, analytic=True)
+
+    time = 0.0
+    while time < 2 * tau:
+        thermo_odeint = dynamics_odeint.run(time, timestep, thermo_odeint)
+        thermo_analytic = dynamics_analytic.run(time, timestep, thermo_analytic)
+        time += timestep
+
+        assert np.allclose(thermo_analytic.temp, thermo_odeint.temp, rtol=1e-5)
+        assert np.allclose(thermo_analytic.rho, thermo_odeint.rho, rtol=1e-5)
+        assert np.allclose(thermo_analytic.press, thermo_odeint.press, rtol=1e-5)
+
+    # parcels return to their initial state after whole periods of the pressure sinusoid
+    assert np.allclose(thermo_analytic.temp, temp, rtol=1e-12)
+    assert np.allclose(thermo_analytic.rho, rho, rtol=1e-12)
+    assert np.allclose(thermo_analytic.press, press, rtol=1e-12)
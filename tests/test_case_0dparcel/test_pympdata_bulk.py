@@ -8,7 +8,7 @@ Created Date: Wednesday 4th September 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Wednesday 4th June 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -19,11 +19,13 @@ perform test case for 0-D parcel model with pyMPDATA bulk microphysics scheme
 """
 
 import numpy as np
+from copy import deepcopy
 from pathlib import Path
 
 from libs.test_case_0dparcel.perform_0dparcel_test_case import (
     perform_0dparcel_test_case,
 )
+from libs.test_case_0dparcel.run_0dparcel import run_0dparcel
 from libs.thermo.thermodynamics import Thermodynamics
 from libs.pympdata_bulk.bulk_scheme_condensation import (
     MicrophysicsSchemeWrapper,
@@ -102,3 +104,71 @@ def test_pympdata_bulk_0dparcel():
     perform_0dparcel_test_case(
         time_init, time_end, timestep, thermo_init, microphys_scheme, binpath, run_name
     )
+
+
+def test_pympdata_bulk_0dparcel_ensemble():
+    """runs 0-D parcel model test using Python pyMPDATA microphysics scheme for an ensemble
+    of parcels with different initial temperatures and water vapour contents.
+
+    This function runs an ensemble of 0-D parcels in one model run and checks each member
+    of the ensemble matches the result of running that parcel alone. It then runs the
+    ensemble as a 0-D parcel test case.
+    """
+
+    ### label for test case to name data/plots with
+    run_name = "pympdata_bulk_0dparcel_ensemble"
+
+    ### path to directory to save data/plots in after model run
+    binpath = Path(__file__).parent.resolve() / "bin"  # i.e. [current directory]/bin/
+    binpath.mkdir(parents=False, exist_ok=True)
+
+    ### time parameters
+    time_init = 0.0  # [s]
+    time_end = 240.0  # [s]
+    timestep = 1.0  # [s]
+
+    ### initial thermodynamic conditions
+    temp = np.array([283.15, 288.15, 293.15], dtype=np.float64)
+    rho = np.array([1.225, 1.225, 1.225], dtype=np.float64)
+    press = np.array([101325, 101325, 101325], dtype=np.float64)
+    qvap = np.array([0.008, 0.01, 0.012], dtype=np.float64)
+    qcond = np.array([0.0, 0.0, 0.0], dtype=np.float64)
+    zeros = np.zeros(3, dtype=np.float64)
+    wvel = uvel = vvel = np.array([])  # this microphysics test doesn't need winds
+
+    thermo_init = Thermodynamics(
+        temp, rho, press, qvap, qcond, zeros, zeros, zeros, zeros, wvel, uvel, vvel
+    )
+
+    ### microphysics scheme to use (within a wrapper)
+    microphys_scheme = MicrophysicsSchemeWrapper()
+
+    ### check ensemble matches individual parcel runs
+    out = run_0dparcel(
+        time_init, time_end, timestep, deepcopy(thermo_init), microphys_scheme
+    )
+    for n in range(temp.size):
+        thermo_n = Thermodynamics(
+            temp[n : n + 1],
+            rho[n : n + 1],
+            press[n : n + 1],
+            qvap[n : n + 1],
+            qcond[n : n + 1],
+            zeros[n : n + 1],
+            zeros[n : n + 1],
+            zeros[n : n + 1],
+            zeros[n : n + 1],
+            wvel,
+            uvel,
+            vvel,
+        )
+        out_n = run_0dparcel(time_init, time_end, timestep, thermo_n, microphys_scheme)
+        for var in ["temp", "rho", "press", "qvap", "qcond"]:
+            assert np.allclose(
+                out[var].values[:, n], out_n[var].values[:, 0], rtol=1e-6
+            )
+
+    ### Perform 0-D parcel model test case using chosen setup
+    perform_0dparcel_test_case(
+        time_init, time_end, timestep, thermo_init, microphys_scheme, binpath, run_name
+    )
@@ -0,0 +1,133 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_kid_dynamics.py
+Project: test_case_1dkid
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for KiDDynamics of 1-D KiD rainshaft test case
+"""
+
+import numpy as np
+import pytest
+
+from libs.test_case_1dkid.kid_dynamics import KiDDynamics
+from libs.thermo.thermodynamics import Thermodynamics
+from libs.pympdata_bulk.bulk_scheme_condensation import MicrophysicsSchemeWrapper
+
+
+def create_thermo(nz):
+    null = np.array([])  # this test doesn't need winds
+    return Thermodynamics(*(np.zeros(nz) for _ in range(9)), null, null, null)
+
+
+def test_kid_dynamics_skip_zero_fields():
+    z_delta, z_max, timestep, time_end = 25.0, 3200.0, 1.25, 50.0
+    nz = int(z_max / z_delta)
+
+    results = []
+    for skip_zero_fields in [True, False]:
+        kid_dynamics = KiDDynamics(z_delta, z_max, timestep, time_end)
+        mpdata = kid_dynamics.mpdata
+        mpdata.skip_zero_fields = skip_zero_fields
+
+        thermo = kid_dynamics.set_thermo(0.0, create_thermo(nz))
+        thermo.massmix_ratios["qcond"][40:60] = 1e-3
+        kid_dynamics.set_advectees(thermo)
+
+        time = 0.0
+        while time < time_end:
+            thermo = kid_dynamics.run(time, timestep, thermo)
+            time += timestep
+
+        assert mpdata._is_zero(mpdata["qice"])
+        assert not mpdata._is_zero(mpdata["qcond"])
+        assert not mpdata._is_zero(mpdata["qvap"])
+        results.append(thermo.unpack_massmix_ratios())
+
+    for q_skip, q_noskip in zip(*results):
+        assert np.array_equal(q_skip, q_noskip)
+
+
+def test_kid_dynamics_couple_thermo():
+    z_delta, z_max, timestep, time_end = 25.0, 3200.0, 1.25, 50.0
+    nz = int(z_max / z_delta)
+
+    results = []
+    for zero_copy in [True, False]:
+        kid_dynamics = KiDDynamics(z_delta, z_max, timestep, time_end)
+        microphys = MicrophysicsSchemeWrapper(inplace=True)
+        thermo = create_thermo(nz)
+        if zero_copy:
+            thermo = kid_dynamics.couple_thermo(thermo)
+        thermo = kid_dynamics.set_thermo(0.0, thermo)
+        thermo.massmix_ratios["qvap"][40:60] *= 1.1  # supersaturate some cells
+        kid_dynamics.set_advectees(thermo)
+
+        time = 0.0
+        while time < time_end:
+            thermo = kid_dynamics.run(time, timestep, thermo)
+            thermo = microphys.run(timestep, thermo)
+            kid_dynamics.set_advectees(thermo)
+            time += timestep
+
+        advectee = kid_dynamics.mpdata.advectees["qcond"].get()
+        assert zero_copy == np.shares_memory(thermo.massmix_ratios["qcond"], advectee)
+        assert np.any(thermo.massmix_ratios["qcond"] > 0.0)
+        results.append([thermo.temp, thermo.rho, thermo.press])
+        results[-1] += thermo.unpack_massmix_ratios()
+
+    for var_coupled, var in zip(*results):
+        assert np.array_equal(var_coupled, var)
+
+
+@pytest.mark.parametrize("advect_hydrometeors", [True, False])
+def test_kid_dynamics_multi_field_solver(advect_hydrometeors):
+    z_delta, z_max, timestep, time_end = 25.0, 3200.0, 1.25, 50.0
+    nz = int(z_max / z_delta)
+
+    results = []
+    for multi_field_solver in [True, False]:
+        kid_dynamics = KiDDynamics(
+            z_delta,
+            z_max,
+            timestep,
+            time_end,
+            advect_hydrometeors=advect_hydrometeors,
+            multi_field_solver=multi_field_solver,
+        )
+        solvers = set(kid_dynamics.mpdata._solvers.values())
+        if advect_hydrometeors:
+            # i.e. one solver for qvap and one for all the hydrometeors
+            assert len(solvers) == (2 if multi_field_solver else 6)
+        else:
+            assert len(solvers) == 1  # i.e. only qvap group
+        microphys = MicrophysicsSchemeWrapper(inplace=True)
+        thermo = kid_dynamics.set_thermo(0.0, create_thermo(nz))
+        thermo.massmix_ratios["qvap"][40:60] *= 1.1  # supersaturate some cells
+        thermo.massmix_ratios["qrain"][20:30] = 1e-4
+        kid_dynamics.set_advectees(thermo)
+
+        time = 0.0
+        while time < time_end:
+            thermo = kid_dynamics.run(time, timestep, thermo)
+            thermo = microphys.run(timestep, thermo)
+            kid_dynamics.set_advectees(thermo)
+            time += timestep
+
+        assert np.any(thermo.massmix_ratios["qcond"] > 0.0)
+        results.append(kid_dynamics.get_state())
+
+    state_multi, state = results
+    for field in state:
+        assert np.array_equal(state_multi[field], state[field]), field
@@ -0,0 +1,64 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_plot_1dkid.py
+Project: test_case_1dkid
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for plotting results of 1-D KiD rainshaft test case
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from libs.test_case_1dkid.plot_1dkid import plot_kid_result
+
+
+def plot(var, time, z_delta, z_max):
+    fig, (ax0, cax0, ax1) = plt.subplots(nrows=3)
+    plot_kid_result(fig, ax0, cax0, ax1, var, time, z_delta, z_max, "var")
+    mesh = ax0.collections[0].get_array().reshape(var.shape[1], -1)
+    line_times = [line.get_xdata()[0] for line in ax0.get_lines()]
+    profiles = [line.get_xdata() for line in ax1.get_lines()]
+    plt.close(fig)
+    return mesh, line_times, profiles
+
+
+@pytest.mark.parametrize("ntime", [721, 724])
+def test_plot_kid_result(ntime):
+    z_delta, z_max, timestep, fctr = 25.0, 3200.0, 1.25, 5
+    nz = int(z_max / z_delta)
+    time = np.arange(ntime) * timestep
+    var = np.random.default_rng(42).random((ntime, nz))
+
+    mesh, line_times, profiles = plot(var, time, z_delta, z_max)
+
+    time_steps = ntime - 1
+    assert mesh.shape == (nz, 1 + -(-time_steps // fctr))
+    assert np.array_equal(mesh[:, 0], var[0])
+    nfull = time_steps // fctr
+    expected = var[1 : nfull * fctr + 1].reshape(nfull, fctr, nz).mean(axis=1)
+    assert np.allclose(mesh[:, 1 : nfull + 1], expected.T, rtol=1e-14)
+    if time_steps % fctr:
+        assert np.allclose(mesh[:, -1], var[nfull * fctr + 1 :].mean(axis=0))
+
+    # snapshots at first output time at or after 3, 6, 9 and 12 minutes
+    expected_idxs = [int(np.ceil(t * 60 / timestep)) for t in [3, 6, 9, 12]]
+    assert np.allclose(line_times, time[expected_idxs] / 60)
+    for profile, i in zip(profiles, expected_idxs):
+        assert np.array_equal(profile, var[i])
@@ -8,7 +8,7 @@ Created Date: Monday 2nd September 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Wednesday 4th June 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -22,6 +22,7 @@ from pathlib import Path
 from PyMPDATA_examples.Shipway_and_Hill_2012 import si
 
 from libs.test_case_1dkid.perform_1dkid_test_case import perform_1dkid_test_case
+from libs.test_case_1dkid.run_1dkid import run_1dkid
 from libs.thermo.thermodynamics import Thermodynamics
 from libs.pympdata_bulk.bulk_scheme_condensation import (
     MicrophysicsSchemeWrapper,
@@ -84,3 +85,51 @@ def test_pympdata_bulk_scheme_1dkid():
         binpath,
         run_name,
     )
+
+
+def test_pympdata_bulk_scheme_1dkid_multicolumn():
+    """runs 1-D KiD rainshaft model with three columns at once and checks that the columns
+    are independent, i.e. that columns with the default updraft strength reproduce a
+    single-column run exactly."""
+
+    ### time and grid parameters
+    z_delta = 25 * si.m
+    z_max = 3200 * si.m
+    timestep = 1.25 * si.s
+    time_end = 50 * si.s
+    nz = int(z_max / z_delta)
+
+    def create_thermo(shape):
+        null = np.array([])  # this microphysics test doesn't need winds
+        return Thermodynamics(*(np.zeros(shape) for _ in range(9)), null, null, null)
+
+    advect_hydrometeors = True
+    out_single = run_1dkid(
+        z_delta,
+        z_max,
+        time_end,
+        timestep,
+        create_thermo(nz),
+        MicrophysicsSchemeWrapper(),
+        advect_hydrometeors,
+    )
+
+    ncolumns = 3
+    out_multi = run_1dkid(
+        z_delta,
+        z_max,
+        time_end,
+        timestep,
+        create_thermo((ncolumns, nz)),
+        MicrophysicsSchemeWrapper(),
+        advect_hydrometeors,
+        ncolumns=ncolumns,
+        wmax_factors=[1.0, 0.5, 1.0],
+    )
+
+    qvap_single = out_single.qvap.values
+    qvap_multi = out_multi.qvap.values
+    assert qvap_multi.shape == (qvap_single.shape[0], ncolumns, nz)
+    assert np.array_equal(qvap_multi[:, 0], qvap_single)
+    assert np.array_equal(qvap_multi[:, 2], qvap_single)
+    assert not np.array_equal(qvap_multi[:, 1], qvap_single)
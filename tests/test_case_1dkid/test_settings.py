@@ -0,0 +1,71 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_settings.py
+Project: test_case_1dkid
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for on-disk caching of the 1-D KiD rainshaft settings' profiles
+"""
+
+import os
+import numpy as np
+
+from libs.test_case_1dkid import profiles_cache
+from libs.test_case_1dkid.settings import Settings
+
+
+def create_settings(cache_dir, dz=25.0):
+    return Settings(
+        dt=1.25,
+        dz=dz,
+        wmax_const=3.0,
+        tscale_const=600.0,
+        t_max=900.0,
+        p0=100700.0,
+        z_max=3200.0,
+        cache_dir=cache_dir,
+    )
+
+
+def test_settings_cache(tmp_path):
+    settings = create_settings(None)
+    settings_first = create_settings(tmp_path)
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+    settings_cached = create_settings(tmp_path)
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    z = np.arange(0, 3200.0, 12.5)
+    assert np.array_equal(settings_first.rhod(z), settings.rhod(z))
+    assert np.array_equal(settings_cached.rhod(z), settings.rhod(z))
+
+    create_settings(tmp_path, dz=50.0)
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+
+
+def test_profiles_cache_eviction(tmp_path):
+    keys = ("a", "b", "c")
+    for key in keys:
+        profiles_cache.save(tmp_path, key, data=np.zeros(1000))
+    for i, key in enumerate(keys):
+        mtime = 1e9 + i  # entries (long ago) written in order a, b, c
+        os.utime(tmp_path / f"{key}.npz", (mtime, mtime))
+
+    assert profiles_cache.load(tmp_path, "a") is None  # entries are too old to be valid
+
+    entry_bytes = (tmp_path / "c.npz").stat().st_size
+    profiles_cache.evict(tmp_path, max_bytes=2 * entry_bytes, max_age=np.inf)
+    assert sorted(f.stem for f in tmp_path.glob("*.npz")) == ["b", "c"]
+
+    profiles_cache.evict(tmp_path, max_age=0.0)
+    assert not list(tmp_path.glob("*.npz"))
@@ -0,0 +1,208 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_checkpoint.py
+Project: tests
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for checkpointing and restarting the test cases
+"""
+
+import numpy as np
+import pytest
+
+from libs.utility_functions.checkpoint import load_checkpoint, save_checkpoint
+from libs.test_case_0dparcel.run_0dparcel import run_0dparcel
+from libs.test_case_1dkid.run_1dkid import run_1dkid
+from libs.thermo.thermodynamics import Thermodynamics
+from libs.mock_microphys.microphysics_scheme_wrapper import (
+    MicrophysicsSchemeWrapper as MockWrapper,
+)
+from libs.pympdata_bulk.bulk_scheme_condensation import (
+    MicrophysicsSchemeWrapper as BulkWrapper,
+)
+
+
+class Crash(Exception):
+    pass
+
+
+def crash_after(microphys_scheme, ncalls):
+    """make microphys_scheme raise Crash on its (ncalls+1)'th call to run()"""
+    run = microphys_scheme.run
+    calls = [0]
+
+    def crashing_run(timestep, thermo):
+        if calls[0] == ncalls:
+            raise Crash()
+        calls[0] += 1
+        return run(timestep, thermo)
+
+    microphys_scheme.run = crashing_run
+    return microphys_scheme
+
+
+def parcel_thermo():
+    null = np.array([])  # this test doesn't need winds
+    initial = [288.15, 1.225, 101325.0, 0.015] + [0.0] * 5
+    return Thermodynamics(
+        *(np.array([v], dtype=np.float64) for v in initial), null, null, null
+    )
+
+
+def kid_thermo(nz):
+    null = np.array([])  # winds are set by the KiD dynamics
+    return Thermodynamics(
+        *(np.zeros(nz) for _ in range(9)), np.zeros(nz + 1), null, null
+    )
+
+
+def mock_scheme():
+    return MockWrapper(1, 1, 0, np.array([1.0]), 500)
+
+
+def assert_same_output(out, expected):
+    for name in ("time", *expected.variables):
+        assert np.array_equal(out[name].values, expected[name].values), name
+
+
+def test_save_load_checkpoint(tmp_path):
+    filename = tmp_path / "checkpoint.npz"
+    save_checkpoint(filename, a={"x": np.arange(3.0), "y": 2}, b={"x/z": np.ones(2)})
+
+    groups = load_checkpoint(filename)
+    assert set(groups) == {"a", "b"}
+    assert np.array_equal(groups["a"]["x"], np.arange(3.0))
+    assert groups["a"]["y"] == 2
+    assert np.array_equal(groups["b"]["x/z"], np.ones(2))
+    assert not (tmp_path / "checkpoint.npz.tmp").exists()
+
+
+@pytest.mark.parametrize("create_scheme", [mock_scheme, BulkWrapper])
+def test_restart_0dparcel(tmp_path, create_scheme):
+    time_end, timestep = 120.0, 1.0
+    filename = tmp_path / "checkpoint.npz"
+    expected = run_0dparcel(
+        0.0, time_end, timestep, parcel_thermo(), create_scheme(), output_timestep=2.0
+    )
+
+    with pytest.raises(Crash):
+        run_0dparcel(
+            0.0,
+            time_end,
+            timestep,
+            parcel_thermo(),
+            crash_after(create_scheme(), 77),
+            output_timestep=2.0,
+            checkpoint_file=filename,
+            checkpoint_timestep=10.0,
+        )
+    assert float(load_checkpoint(filename)["loop"]["time"]) == 70.0
+
+    out = run_0dparcel(
+        0.0,
+        time_end,
+        timestep,
+        parcel_thermo(),
+        create_scheme(),
+        output_timestep=2.0,
+        restart_file=filename,
+    )
+    assert_same_output(out, expected)
+
+
+@pytest.mark.parametrize("zero_copy", [False, True])
+def test_restart_1dkid(tmp_path, zero_copy):
+    z_delta, z_max, time_end, timestep = 25.0, 800.0, 60.0, 1.25
+    nz = int(z_max / z_delta)
+    filename = tmp_path / "checkpoint.npz"
+    args = (z_delta, z_max, time_end, timestep)
+    options = {"zero_copy": zero_copy}
+
+    expected = run_1dkid(
+        *args, kid_thermo(nz), BulkWrapper(inplace=zero_copy), True, **options
+    )
+
+    with pytest.raises(Crash):
+        run_1dkid(
+            *args,
+            kid_thermo(nz),
+            crash_after(BulkWrapper(inplace=zero_copy), 30),
+            True,
+            checkpoint_file=filename,
+            checkpoint_timestep=5.0,
+            **options,
+        )
+    assert int(load_checkpoint(filename)["loop"]["step"]) == 28
+
+    out = run_1dkid(
+        *args,
+        kid_thermo(nz),
+        BulkWrapper(inplace=zero_copy),
+        True,
+        restart_file=filename,
+        **options,
+    )
+    assert_same_output(out, expected)
+
+
+def test_checkpoint_requires_in_memory_output(tmp_path):
+    outfile = tmp_path / "out.zarr"
+    filename = tmp_path / "checkpoint.npz"
+    with pytest.raises(TypeError):
+        run_0dparcel(
+            0.0,
+            10.0,
+            1.0,
+            parcel_thermo(),
+            crash_after(BulkWrapper(), 0),
+            outfile=outfile,
+            checkpoint_file=filename,
+            checkpoint_timestep=5.0,
+        )
+    assert not outfile.exists()
+    assert not filename.exists()
+
+
+class NoStateWrapper:
+    """microphysics scheme wrapper without get_state() and set_state() methods"""
+
+    def __init__(self):
+        self.wrapper = BulkWrapper()
+
+    def initialize(self):
+        return self.wrapper.initialize()
+
+    def finalize(self):
+        return self.wrapper.finalize()
+
+    def run(self, timestep, thermo):
+        return self.wrapper.run(timestep, thermo)
+
+
+@pytest.mark.parametrize("option", ["checkpoint_file", "restart_file"])
+def test_checkpoint_requires_scheme_state(tmp_path, option):
+    filename = tmp_path / "checkpoint.npz"
+    options = {option: filename}
+    if option == "checkpoint_file":
+        options["checkpoint_timestep"] = 5.0
+    with pytest.raises(TypeError):
+        run_0dparcel(
+            0.0,
+            10.0,
+            1.0,
+            parcel_thermo(),
+            crash_after(NoStateWrapper(), 0),
+            **options,
+        )
+    assert not filename.exists()
@@ -0,0 +1,90 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_domain_decomposition.py
+Project: tests
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for decomposing gridboxes across MPI processes, which can be run with any
+number of processes, e.g. mpirun -n 3 python -m pytest tests/test_domain_decomposition.py
+"""
+
+import numpy as np
+import pytest
+
+from libs.cleo_sdm.domain_decomposition import (
+    GridboxDecomposition,
+    run_microphysics_worker,
+)
+
+MPI = pytest.importorskip("mpi4py.MPI")
+
+
+@pytest.mark.parametrize("nper", [1, 2])
+def test_scatter_gather(nper):
+    comm = MPI.COMM_WORLD
+    rank, size = comm.Get_rank(), comm.Get_size()
+    first_gbxindex = rank * (rank + 1) // 2
+    dec = GridboxDecomposition(comm, rank + 1, first_gbxindex)  # uneven blocks
+
+    ngbxs = size * (size + 1) // 2
+    assert dec.ngbxs == ngbxs
+    assert dec.is_root == (rank == 0)
+
+    domain = np.arange(ngbxs * nper, dtype=np.float64)
+    local = np.empty(dec.nlocal * nper)
+    dec.scatter(domain if dec.is_root else None, local)
+    assert np.array_equal(local, dec.local(domain))
+    assert local[0] == dec.displs[rank] * nper
+
+    gathered = np.zeros_like(domain) if dec.is_root else None
+    dec.gather(2 * local, gathered)
+    if dec.is_root:
+        assert np.array_equal(gathered, 2 * domain)
+
+
+def test_decomposition_not_in_order_of_rank():
+    comm = MPI.COMM_WORLD
+    rank = comm.Get_rank()
+    first_gbxindex = rank * (rank + 1) // 2 + 1  # not where the rank's block starts
+    with pytest.raises(AssertionError):
+        GridboxDecomposition(comm, rank + 1, first_gbxindex)
+
+
+def test_scatter_requires_contiguous_variable():
+    comm = MPI.COMM_WORLD
+    rank, size = comm.Get_rank(), comm.Get_size()
+    dec = GridboxDecomposition(comm, 1, rank)
+    if dec.is_root:
+        columns = np.zeros((2 * size, 2))
+        with pytest.raises(AssertionError, match="contiguous"):
+            dec.scatter(columns[:, 0], np.empty(2))  # non-contiguous view of a column
+
+
+def test_run_microphysics_worker():
+    class CountingScheme:
+        ncalls = 0
+
+        def initialize(self):
+            pass
+
+        def finalize(self):
+            pass
+
+        def run(self, timestep, thermo):
+            assert thermo is None
+            self.ncalls += 1
+
+    scheme = CountingScheme()
+    run_microphysics_worker(scheme, 0.0, 900.0, 1.25)
+    assert scheme.ncalls == 720
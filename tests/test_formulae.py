@@ -0,0 +1,70 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_formulae.py
+Project: tests
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for NumPy thermodynamic formulae against their metpy reference calculations
+"""
+
+import numpy as np
+
+from libs.thermo import formulae
+
+
+def thermodynamics_grid():
+    temp = np.linspace(250, 310, 13)
+    press = np.linspace(50000, 105000, 12)
+    temp, press = np.meshgrid(temp, press)
+    qvap = 0.5 * formulae.saturation_mixing_ratio(temp, press)
+    height = np.linspace(0, 5000, 13) * np.ones_like(temp)
+    return temp, press, qvap, height
+
+
+def test_dry_potential_temperature():
+    temp, press, qvap, height = thermodynamics_grid()
+    theta = formulae.dry_potential_temperature(temp, press)
+    theta_metpy = formulae.dry_potential_temperature(temp, press, backend="metpy")
+
+    assert theta.shape == temp.shape
+    assert np.allclose(theta, theta_metpy, rtol=1e-12)
+
+
+def test_relative_humidity():
+    temp, press, qvap, height = thermodynamics_grid()
+    relh = formulae.relative_humidity(temp, press, qvap)
+    relh_metpy = formulae.relative_humidity(temp, press, qvap, backend="metpy")
+
+    assert np.allclose(relh, relh_metpy, rtol=1e-12)
+
+
+def test_moist_equiv_potential_temperature():
+    temp, press, qvap, height = thermodynamics_grid()
+    theta_e = formulae.moist_equiv_potential_temperature(temp, press, qvap)
+    theta_e_metpy = formulae.moist_equiv_potential_temperature(
+        temp, press, qvap, backend="metpy"
+    )
+
+    assert np.allclose(theta_e, theta_e_metpy, rtol=1e-12)
+
+
+def test_moist_static_energy():
+    temp, press, qvap, height = thermodynamics_grid()
+    mse = formulae.moist_static_energy(temp, qvap)
+    mse_metpy = formulae.moist_static_energy(temp, qvap, backend="metpy")
+    assert np.allclose(mse, mse_metpy, rtol=1e-12)
+
+    mse = formulae.moist_static_energy(temp, qvap, height=height)
+    mse_metpy = formulae.moist_static_energy(temp, qvap, height=height, backend="metpy")
+    assert np.allclose(mse, mse_metpy, rtol=1e-12)
@@ -8,7 +8,7 @@ Created Date: Tuesday 27th February 2024
 Author: Clara Bayley (CB)
 Additional Contributors: Joerg Behrens, Georgiana Mania
 -----
-Last Modified: Wednesday 4th June 2025
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -144,9 +144,18 @@ def test_microphys_with_wrapper(aes_muphys_py_dir):
         )
 
         result = microphys_wrapped.run(timestep, thermo)
+        diagnostics = microphys_wrapped.precipitation_diagnostics()
 
         microphys_wrapped.finalize()
 
+        assert np.array_equal(diagnostics["prr_gsp"], prr_gsp)
+        assert np.array_equal(diagnostics["pri_gsp"], pri_gsp)
+        assert np.array_equal(diagnostics["prs_gsp"], prs_gsp)
+        assert np.array_equal(diagnostics["prg_gsp"], prg_gsp)
+        assert np.array_equal(diagnostics["pre_gsp"], pre_gsp)
+        assert np.array_equal(diagnostics["pflx"], pflx)
+        assert diagnostics["pflx"] is microphys_wrapped.pflx
+
         assert result.temp == temp
         assert result.unpack_massmix_ratios() == [
             qvap,
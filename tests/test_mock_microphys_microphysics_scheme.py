@@ -8,7 +8,7 @@ Created Date: Tuesday 27th February 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Monday 11th November 2024
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -118,3 +118,70 @@ def test_microphys_with_wrapper():
 
     assert result.temp == t
     assert result.unpack_massmix_ratios() == [qv, qc, qi, qr, qs, qg]
+
+
+def test_microphys_with_wrapper_inplace():
+    nvec = 1
+    ke = 1
+    ivstart = 0
+    dz = np.array([10], dtype=np.float64)
+    qnc = 500
+    microphys_copy = MicrophysicsSchemeWrapper(nvec, ke, ivstart, dz, qnc)
+    microphys_inplace = MicrophysicsSchemeWrapper(
+        nvec, ke, ivstart, dz, qnc, inplace=True
+    )
+
+    timestep = 1.0
+    temp = np.array([288.15], dtype=np.float64)
+    rho = np.array([1.225], dtype=np.float64)
+    press = np.array([101325], dtype=np.float64)
+    qvap = np.array([0.015], dtype=np.float64)
+    qcond = np.array([0.0001], dtype=np.float64)
+    qice = np.array([0.0002], dtype=np.float64)
+    qrain = np.array([0.0003], dtype=np.float64)
+    qsnow = np.array([0.0004], dtype=np.float64)
+    qgrau = np.array([0.0005], dtype=np.float64)
+    wvel = uvel = vvel = np.array([])  # this microphysics test doesn't need winds
+
+    thermo = Thermodynamics(
+        temp,
+        rho,
+        press,
+        qvap,
+        qcond,
+        qice,
+        qrain,
+        qsnow,
+        qgrau,
+        wvel,
+        uvel,
+        vvel,
+    )
+    thermo_copy = thermo
+    thermo_inplace = Thermodynamics(
+        temp,
+        rho,
+        press,
+        qvap,
+        qcond,
+        qice,
+        qrain,
+        qsnow,
+        qgrau,
+        wvel,
+        uvel,
+        vvel,
+    )
+    qvap_addr = thermo_inplace.massmix_ratios["qvap"].ctypes.data
+
+    for _ in range(101):
+        thermo_copy = microphys_copy.run(timestep, thermo_copy)
+        result = microphys_inplace.run(timestep, thermo_inplace)
+        assert result is thermo_inplace
+
+    assert thermo_inplace.massmix_ratios["qvap"].ctypes.data == qvap_addr
+    assert np.array_equal(thermo_inplace.temp, thermo_copy.temp)
+    for q_inplace, q_copy in zip(
+        thermo_inplace.unpack_massmix_ratios(), thermo_copy.unpack_massmix_ratios()
+    ):
+        assert np.array_equal(q_inplace, q_copy)
@@ -0,0 +1,137 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_output_thermodynamics.py
+Project: tests
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for classes which output thermodynamics during a model run
+"""
+
+import numpy as np
+import pytest
+
+from libs.thermo.output_thermodynamics import (
+    OutputThermodynamics,
+    StreamingOutputThermodynamics,
+    THERMODYNAMICS_VARIABLES,
+    steps_per_output,
+)
+from libs.thermo.thermodynamics import Thermodynamics
+
+
+def create_thermo(ncells):
+    temp = np.linspace(280, 290, ncells)
+    rho = np.linspace(1.0, 1.2, ncells)
+    press = np.linspace(90000, 101325, ncells)
+    qvap = np.linspace(0.01, 0.015, ncells)
+    zeros = np.zeros(ncells)
+    null = np.array([])
+
+    return Thermodynamics(
+        temp, rho, press, qvap, zeros, zeros, zeros, zeros, zeros, null, null, null
+    )
+
+
+def run_output(out, ntime, thermo):
+    for n in range(ntime):
+        thermo.temp[:] += 1.0
+        thermo.massmix_ratios["qcond"][:] += 0.001
+        out.output_thermodynamics(n * 1.25, thermo)
+    out.finalize()
+
+
+def test_streaming_output_thermodynamics(tmp_path):
+    ntime, ncells = 23, 5
+    zhalf = np.linspace(0, 100, ncells + 1)
+
+    out = OutputThermodynamics([ntime, ncells], zhalf=zhalf)
+    run_output(out, ntime, create_thermo(ncells))
+
+    filename = tmp_path / "output.zarr"
+    out_stream = StreamingOutputThermodynamics(
+        [ntime, ncells], filename, zhalf=zhalf, chunksize=10
+    )
+    run_output(out_stream, ntime, create_thermo(ncells))
+
+    assert filename.is_dir()
+    assert np.array_equal(out_stream.time.values, out.time.values)
+    assert np.array_equal(out_stream.zhalf.values, zhalf)
+    for name in THERMODYNAMICS_VARIABLES:
+        assert np.array_equal(out_stream[name].values, out[name].values)
+        assert out_stream[name].units == out[name].units
+
+    ds = out_stream.open_dataset()
+    assert ds["temp"].dims == ("time", "cell")
+    assert ds["temp"].encoding["chunks"] == (10, ncells)
+
+    out_loaded = out_stream.load()
+    assert np.array_equal(out_loaded.qcond.values, out.qcond.values)
+
+
+def test_output_thermodynamics_to_dataset():
+    ntime, ncells = 4, 3
+    out = OutputThermodynamics([ntime, ncells])
+    run_output(out, ntime, create_thermo(ncells))
+
+    ds = out.to_dataset()
+    out_from_ds = OutputThermodynamics.from_dataset(ds)
+
+    assert out_from_ds.zhalf is None
+    assert np.array_equal(out_from_ds.time.values, out.time.values)
+    for name in THERMODYNAMICS_VARIABLES:
+        assert np.array_equal(out_from_ds[name].values, out[name].values)
+
+
+def test_output_thermodynamics_interval_and_variables(tmp_path):
+    ntime, ncells = 23, 5
+    output_interval = steps_per_output(1.25, 5.0)
+    variables = ["temp", "qcond"]
+    assert output_interval == 4
+
+    out_all = OutputThermodynamics([ntime, ncells])
+    run_output(out_all, ntime, create_thermo(ncells))
+
+    out = OutputThermodynamics(
+        [ntime, ncells], variables=variables, output_interval=output_interval
+    )
+    run_output(out, ntime, create_thermo(ncells))
+
+    out_stream = StreamingOutputThermodynamics(
+        [ntime, ncells],
+        tmp_path / "output.zarr",
+        chunksize=4,
+        variables=variables,
+        output_interval=output_interval,
+    )
+    run_output(out_stream, ntime, create_thermo(ncells))
+
+    assert out.time.values.shape == (6,)
+    assert np.array_equal(out.time.values, out_all.time.values[::4])
+    assert np.array_equal(out_stream.time.values, out.time.values)
+    for name in THERMODYNAMICS_VARIABLES:
+        if name in variables:
+            assert out[name].values.shape == (6, ncells)
+            assert np.array_equal(out[name].values, out_all[name].values[::4])
+            assert np.array_equal(out_stream[name].values, out[name].values)
+        else:
+            assert out[name] is None
+            assert out_stream[name] is None
+
+
+def test_output_thermodynamics_requires_variables(tmp_path):
+    with pytest.raises(AssertionError):
+        OutputThermodynamics([4, 3], variables=[])
+    with pytest.raises(AssertionError):
+        StreamingOutputThermodynamics([4, 3], tmp_path / "output.zarr", variables=[])
+    assert not (tmp_path / "output.zarr").exists()
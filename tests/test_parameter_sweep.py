@@ -0,0 +1,53 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_parameter_sweep.py
+Project: tests
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for running parameter sweeps of the test cases
+"""
+
+import numpy as np
+
+from libs.utility_functions.parameter_sweep import (
+    parameter_grid,
+    run_member,
+    run_sweep,
+)
+
+
+def test_parameter_grid():
+    members = parameter_grid(timestep=[1.0, 2.0], scheme=["a", "b"])
+
+    assert len(members) == 4
+    assert members[0] == {"timestep": 1.0, "scheme": "a"}
+    assert members[-1] == {"timestep": 2.0, "scheme": "b"}
+
+
+def test_parameter_sweep_0dparcel():
+    members = parameter_grid(
+        timestep=[1.0, 2.0], qvap_init=[0.01, 0.015], scheme=["pympdata_bulk"]
+    )
+    ds = run_sweep("0dparcel", members, max_workers=2, output_timestep=2.0)
+
+    assert ds.sizes["member"] == 4
+    assert ds.sizes["time"] == 121
+    assert np.array_equal(ds["timestep"].values, [1.0, 1.0, 2.0, 2.0])
+    assert np.array_equal(
+        ds["qvap"].isel(time=0, cell=0).values, ds["qvap_init"].values
+    )
+
+    for i, params in enumerate(members):
+        expected = run_member("0dparcel", params, output_timestep=2.0)
+        assert np.array_equal(ds["temp"].isel(member=i).values, expected["temp"].values)
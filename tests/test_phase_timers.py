@@ -0,0 +1,77 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_phase_timers.py
+Project: tests
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for timing the phases of the test cases' time loops
+"""
+
+import json
+import numpy as np
+import pytest
+
+from libs.utility_functions.phase_timers import PhaseTimers
+from libs.test_case_0dparcel.run_0dparcel import run_0dparcel
+from libs.thermo.thermodynamics import Thermodynamics
+from libs.pympdata_bulk.bulk_scheme_condensation import MicrophysicsSchemeWrapper
+
+
+def test_phase_timers(tmp_path):
+    timers = PhaseTimers()
+    for _ in range(3):
+        with timers.phase("a"):
+            pass
+    with timers.phase("b"):
+        sum(range(1000))
+
+    summary = timers.summary()
+    assert summary["a"]["calls"] == 3
+    assert summary["b"]["calls"] == 1
+    assert summary["b"]["total_s"] > 0.0
+
+    timers.to_json(tmp_path / "timers.json")
+    with open(tmp_path / "timers.json") as f:
+        assert json.load(f) == summary
+
+    with pytest.raises(ValueError):
+        timers.to_chrome_trace(tmp_path / "trace.json")
+
+
+def test_phase_timers_0dparcel(tmp_path):
+    time_end, timestep = 20.0, 1.0
+    null = np.array([])  # this test doesn't need winds
+    initial = [288.15, 1.225, 101325.0, 0.015] + [0.0] * 5
+    thermo = Thermodynamics(
+        *(np.array([v], dtype=np.float64) for v in initial), null, null, null
+    )
+
+    timers = PhaseTimers(trace=True)
+    run_0dparcel(
+        0.0, time_end, timestep, thermo, MicrophysicsSchemeWrapper(), timers=timers
+    )
+
+    nsteps = int(time_end / timestep)
+    summary = timers.summary()
+    assert summary["dynamics"]["calls"] == nsteps
+    assert summary["microphysics:pympdata_bulk"]["calls"] == nsteps
+    assert summary["output"]["calls"] == nsteps + 1
+    assert summary["initialize"]["calls"] == summary["finalize"]["calls"] == 1
+
+    timers.to_chrome_trace(tmp_path / "trace.json")
+    with open(tmp_path / "trace.json") as f:
+        events = json.load(f)["traceEvents"]
+    assert len(events) == sum(s["calls"] for s in summary.values())
+    assert all(e["ph"] == "X" and e["dur"] >= 0.0 for e in events)
+    assert all(e0["ts"] <= e1["ts"] for e0, e1 in zip(events[:-1], events[1:]))
@@ -0,0 +1,103 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_postprocessing.py
+Project: tests
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for running test cases without plotting and plotting their output afterwards
+"""
+
+import subprocess
+import sys
+import numpy as np
+
+from libs.test_case_0dparcel.perform_0dparcel_test_case import (
+    perform_0dparcel_test_case,
+)
+from libs.test_case_1dkid.perform_1dkid_test_case import perform_1dkid_test_case
+from libs.mock_microphys.microphysics_scheme_wrapper import MicrophysicsSchemeWrapper
+from libs.pympdata_bulk.bulk_scheme_condensation import (
+    MicrophysicsSchemeWrapper as BulkMicrophysicsSchemeWrapper,
+)
+from libs.thermo.thermodynamics import Thermodynamics
+from libs.utility_functions.postprocessing import postprocess_test_case
+
+
+def create_thermo(ncells):
+    null = np.array([])  # this test doesn't need winds
+    initial = [288.15, 1.225, 101325.0, 0.015] + [0.0] * 5
+    return Thermodynamics(
+        *(np.full(ncells, v, dtype=np.float64) for v in initial), null, null, null
+    )
+
+
+def create_mock_scheme():
+    dz = np.array([10], dtype=np.float64)
+    return MicrophysicsSchemeWrapper(1, 1, 0, dz, 500)
+
+
+def test_run_only_does_not_import_matplotlib():
+    code = """
+import sys
+import numpy as np
+from libs.mock_microphys.microphysics_scheme_wrapper import MicrophysicsSchemeWrapper
+from libs.test_case_0dparcel.perform_0dparcel_test_case import perform_0dparcel_test_case
+from libs.thermo.thermodynamics import Thermodynamics
+
+null = np.array([])
+initial = [288.15, 1.225, 101325.0, 0.015] + [0.0] * 5
+thermo = Thermodynamics(*(np.array([v]) for v in initial), null, null, null)
+microphys_scheme = MicrophysicsSchemeWrapper(1, 1, 0, np.array([10.0]), 500)
+perform_0dparcel_test_case(0.0, 10.0, 1.0, thermo, microphys_scheme, plot=False)
+assert "matplotlib" not in sys.modules
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_postprocess_0dparcel_in_background(tmp_path):
+    run_name = "mock_postprocessed"
+    out = perform_0dparcel_test_case(
+        0.0, 60.0, 1.0, create_thermo(1), create_mock_scheme(), plot=False
+    )
+    assert not list(tmp_path.glob("*.png"))
+
+    zarrfile = tmp_path / "out.zarr"
+    out.to_dataset().to_zarr(zarrfile)
+    process = postprocess_test_case(
+        "0dparcel", zarrfile, tmp_path, run_name, background=True
+    )
+    process.join()
+
+    assert process.exitcode == 0
+    assert (tmp_path / f"{run_name}_thermodynamics.png").exists()
+    assert (tmp_path / f"{run_name}_massmix_ratios.png").exists()
+
+
+def test_postprocess_1dkid(tmp_path):
+    run_name = "pympdata_bulk_postprocessed"
+    z_delta, z_max = 25.0, 3200.0
+    nz = int(z_max / z_delta)
+    out = perform_1dkid_test_case(
+        z_delta,
+        z_max,
+        50.0,
+        1.25,
+        create_thermo(nz),
+        BulkMicrophysicsSchemeWrapper(),
+        True,
+        plot=False,
+    )
+
+    postprocess_test_case("1dkid", out, tmp_path, run_name)
+    assert (tmp_path / f"{run_name}_moisture.png").exists()
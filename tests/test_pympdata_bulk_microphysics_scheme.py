@@ -8,7 +8,7 @@ Created Date: Wednesday 4th September 2024
 Author: Clara Bayley (CB)
 Additional Contributors:
 -----
-Last Modified: Wednesday 4th September 2024
+Last Modified: Sunday 18th October 2026
 Modified By: CB
 -----
 License: BSD 3-Clause "New" or "Revised" License
@@ -22,6 +22,7 @@ import numpy as np
 
 from libs.pympdata_bulk.bulk_scheme_condensation import (
     bulk_scheme_condensation,
+    bulk_scheme_condensation_numba,
     MicrophysicsSchemeWrapper,
 )
 from libs.thermo.thermodynamics import Thermodynamics
@@ -89,3 +90,94 @@ def test_microphys_with_wrapper():
     result = microphys_wrapped.run(timestep, thermo)
 
     assert result.unpack_massmix_ratios() == [qv, qc, qice, qrain, qsnow, qgrau]
+
+
+def test_microphys_with_wrapper_inplace():
+    microphys_copy = MicrophysicsSchemeWrapper()
+    microphys_inplace = MicrophysicsSchemeWrapper(inplace=True)
+
+    timestep = 1.0
+    temp = np.array([288.15, 275.0, 290.0], dtype=np.float64)
+    rho = np.array([1.225, 1.0, 1.1], dtype=np.float64)
+    press = np.array([101325, 80000, 95000], dtype=np.float64)
+    qvap = np.array([0.015, 0.008, 0.004], dtype=np.float64)
+    qcond = np.array([0.0001, 0.0, 0.0002], dtype=np.float64)
+    zeros = np.zeros(3, dtype=np.float64)
+    wvel = uvel = vvel = np.array([])  # this microphysics test doesn't need winds
+
+    thermo = Thermodynamics(
+        temp, rho, press, qvap, qcond, zeros, zeros, zeros, zeros, wvel, uvel, vvel
+    )
+    qvap_before = thermo.massmix_ratios["qvap"].copy()
+
+    result_copy = microphys_copy.run(timestep, thermo)
+    assert np.array_equal(thermo.massmix_ratios["qvap"], qvap_before)
+
+    result_inplace = microphys_inplace.run(timestep, thermo)
+    assert result_inplace is thermo
+    for q_inplace, q_copy in zip(
+        result_inplace.unpack_massmix_ratios(), result_copy.unpack_massmix_ratios()
+    ):
+        assert np.array_equal(q_inplace, q_copy)
+
+
+def test_bulk_scheme_condensation_numba():
+    rng = np.random.default_rng(seed=2024)
+    ncells = 1000
+    temp = rng.uniform(250, 310, ncells)
+    press = rng.uniform(50000, 105000, ncells)
+    qvap = rng.uniform(0.0, 0.03, ncells)
+    qcond = rng.uniform(0.0, 0.001, ncells)
+
+    qvap_ref, qcond_ref = bulk_scheme_condensation(
+        temp, press, qvap.copy(), qcond.copy()
+    )
+    qvap_numba, qcond_numba = bulk_scheme_condensation_numba(temp, press, qvap, qcond)
+
+    assert qvap_numba is qvap  # i.e. updated in-place
+    assert qcond_numba is qcond
+    assert np.any(qcond_ref != qcond_ref[0])
+    assert np.allclose(qvap_numba, qvap_ref, rtol=1e-12, atol=1e-16)
+    assert np.allclose(qcond_numba, qcond_ref, rtol=1e-12, atol=1e-16)
+
+
+def test_bulk_scheme_condensation_numba_dry_cell():
+    temp = np.array([288.15, 275.0, 290.0], dtype=np.float64)
+    press = np.array([101325, 80000, 95000], dtype=np.float64)
+    qvap = np.array([0.015, 0.0, 0.004], dtype=np.float64)
+    qcond = np.array([0.0001, 0.0002, 0.0], dtype=np.float64)
+    wet = qvap != 0.0
+
+    qvap_ref, qcond_ref = bulk_scheme_condensation(
+        temp[wet], press[wet], qvap[wet], qcond[wet]
+    )
+    qvap_numba, qcond_numba = bulk_scheme_condensation_numba(temp, press, qvap, qcond)
+
+    assert qvap_numba[1] == 0.0 and qcond_numba[1] == 0.0002  # i.e. dry cell unchanged
+    assert np.allclose(qvap_numba[wet], qvap_ref, rtol=1e-12, atol=1e-16)
+    assert np.allclose(qcond_numba[wet], qcond_ref, rtol=1e-12, atol=1e-16)
+
+
+def test_microphys_with_wrapper_numba():
+    microphys_ref = MicrophysicsSchemeWrapper()
+    microphys_numba = MicrophysicsSchemeWrapper(use_numba=True)
+
+    timestep = 1.0
+    temp = np.array([288.15, 275.0, 290.0], dtype=np.float64)
+    rho = np.array([1.225, 1.0, 1.1], dtype=np.float64)
+    press = np.array([101325, 80000, 95000], dtype=np.float64)
+    qvap = np.array([0.015, 0.008, 0.004], dtype=np.float64)
+    qcond = np.array([0.0001, 0.0, 0.0002], dtype=np.float64)
+    zeros = np.zeros(3, dtype=np.float64)
+    wvel = uvel = vvel = np.array([])  # this microphysics test doesn't need winds
+
+    thermo = Thermodynamics(
+        temp, rho, press, qvap, qcond, zeros, zeros, zeros, zeros, wvel, uvel, vvel
+    )
+
+    result_ref = microphys_ref.run(timestep, thermo)
+    result_numba = microphys_numba.run(timestep, thermo)
+    for q_numba, q_ref in zip(
+        result_numba.unpack_massmix_ratios(), result_ref.unpack_massmix_ratios()
+    ):
+        assert np.allclose(q_numba, q_ref, rtol=1e-12, atol=1e-16)
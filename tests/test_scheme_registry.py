@@ -0,0 +1,81 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_scheme_registry.py
+Project: tests
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for the registry of microphysics schemes
+"""
+
+import subprocess
+import sys
+import pytest
+
+from libs.utility_functions import scheme_registry
+
+
+def test_import_wrappers_without_backends():
+    """importing the wrappers of optional backends does not need their bindings nor
+    import mpi4py."""
+    code = """
+import os
+import sys
+os.environ.pop("AES_MUPHYS_PY_DIR", None)
+os.environ.pop("PYCLEO_DIR", None)
+import libs.icon_muphys.microphysics_scheme_wrapper
+import libs.icon_satadj.microphysics_scheme_wrapper
+import libs.cleo_sdm.microphysics_scheme_wrapper
+assert "mpi4py" not in sys.modules
+assert "aes_muphys_py" not in sys.modules and "pycleo" not in sys.modules
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_available_schemes(monkeypatch, tmp_path):
+    monkeypatch.delenv("AES_MUPHYS_PY_DIR", raising=False)
+    monkeypatch.delitem(sys.modules, "aes_muphys_py", raising=False)
+
+    available = scheme_registry.available_schemes()
+    assert available["mock_microphys"]
+    assert available["pympdata_bulk"]
+    assert not available["icon_muphys"]
+
+    scheme = scheme_registry.get_scheme("icon_muphys")
+    assert "AES_MUPHYS_PY_DIR" in scheme.unavailable_reason()
+    with pytest.raises(ImportError):
+        scheme.load()
+
+    monkeypatch.setenv("AES_MUPHYS_PY_DIR", str(tmp_path))
+    assert "not found" in scheme.unavailable_reason()
+
+    with pytest.raises(ValueError):
+        scheme_registry.get_scheme("unknown")
+
+
+def test_register_scheme(monkeypatch):
+    monkeypatch.setattr(scheme_registry, "SCHEMES", dict(scheme_registry.SCHEMES))
+
+    scheme = scheme_registry.register_scheme(
+        "another_mock",
+        "libs.mock_microphys.microphysics_scheme_wrapper",
+        requires=("numpy",),
+    )
+    assert scheme_registry.available_schemes()["another_mock"]
+    microphys = scheme.create(1, 1, 0, [10.0], 500)
+    assert microphys.initialize() == 0
+
+    scheme_registry.register_scheme(
+        "missing", "libs.missing", requires=("no_such_package",)
+    )
+    assert not scheme_registry.available_schemes()["missing"]
@@ -0,0 +1,92 @@
+"""
+Copyright (c) 2026 MPI-M, Clara Bayley
+
+----- Microphysics Test Cases -----
+File: test_thermodynamics.py
+Project: tests
+Created Date: Sunday 18th October 2026
+Author: Clara Bayley (CB)
+Additional Contributors:
+-----
+Last Modified: Sunday 18th October 2026
+Modified By: CB
+-----
+License: BSD 3-Clause "New" or "Revised" License
+https://opensource.org/licenses/BSD-3-Clause
+-----
+File Description:
+unit tests for Thermodynamics class
+"""
+
+import numpy as np
+from copy import deepcopy
+
+from libs.thermo.thermodynamics import Thermodynamics
+
+
+def create_thermo(contiguous):
+    ncells = 4
+    temp = np.linspace(280, 290, ncells)
+    rho = np.linspace(1.0, 1.2, ncells)
+    press = np.linspace(90000, 101325, ncells)
+    qvap = np.full(ncells, 0.015)
+    qcond = np.full(ncells, 0.0001)
+    qice = np.full(ncells, 0.0002)
+    qrain = np.full(ncells, 0.0003)
+    qsnow = np.full(ncells, 0.0004)
+    qgrau = np.full(ncells, 0.0005)
+    wvel = np.ones(ncells + 1)
+    uvel = vvel = np.array([])
+
+    return Thermodynamics(
+        temp,
+        rho,
+        press,
+        qvap,
+        qcond,
+        qice,
+        qrain,
+        qsnow,
+        qgrau,
+        wvel,
+        uvel,
+        vvel,
+        contiguous=contiguous,
+    )
+
+
+def test_contiguous_thermodynamics():
+    thermo = create_thermo(False)
+    thermo_contiguous = create_thermo(True)
+
+    assert not thermo.is_contiguous()
+    assert thermo_contiguous.is_contiguous()
+    assert thermo_contiguous.buffer.flags["C_CONTIGUOUS"]
+    assert thermo_contiguous.buffer.shape == (9, 4)
+
+    assert np.array_equal(thermo.temp, thermo_contiguous.temp)
+    assert np.array_equal(thermo.rho, thermo_contiguous.rho)
+    assert np.array_equal(thermo.press, thermo_contiguous.press)
+    for q, q_contiguous in zip(
+        thermo.unpack_massmix_ratios(), thermo_contiguous.unpack_massmix_ratios()
+    ):
+        assert np.array_equal(q, q_contiguous)
+        assert np.shares_memory(q_contiguous, thermo_contiguous.buffer)
+
+    thermo_contiguous.copy_massmix_ratios(*thermo_contiguous.unpack_massmix_ratios())
+    thermo_contiguous.massmix_ratios["qcond"][:] = 0.002
+    assert np.all(thermo_contiguous.buffer[4] == 0.002)
+
+
+def test_deepcopy_contiguous_thermodynamics():
+    thermo = create_thermo(True)
+    cp_thermo = deepcopy(thermo)
+
+    assert cp_thermo.is_contiguous()
+    assert not np.shares_memory(cp_thermo.buffer, thermo.buffer)
+    assert np.array_equal(cp_thermo.buffer, thermo.buffer)
+    assert np.array_equal(cp_thermo.wvel, thermo.wvel)
+
+    cp_thermo.temp[:] = 0.0
+    assert np.all(cp_thermo.buffer[0] == 0.0)
+    assert np.all(thermo.temp > 0.0)